@@ -0,0 +1,60 @@
+"""
+Cost of converting the ISO8601 UTC time columns of a table, with and without format inference.
+
+    python benchmarks/bench_convert_times.py [--rows 1000000]
+"""
+
+import argparse
+import timeit
+
+import pandas as pd
+
+from juice_core.SHTRestInterface import convert_times
+
+COLUMNS = ["start", "end"]
+
+
+def convert_times_inferred(table, columns):
+    """The former convert_times: format inference, column by column"""
+    for col in columns:
+        table[col] = pd.to_datetime(table[col]).dt.tz_localize(None)
+    return table
+
+
+def convert_times_iso8601(table, columns):
+    for col in columns:
+        table[col] = pd.to_datetime(table[col], format="ISO8601").dt.tz_localize(None)
+    return table
+
+
+def table(rows):
+    times = pd.date_range("2032-01-01", periods=rows, freq="s")
+    return pd.DataFrame(
+        {
+            "start": times.strftime("%Y-%m-%dT%H:%M:%SZ").tolist(),
+            "end": (times + pd.Timedelta("500ms"))
+            .strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+            .tolist(),
+        }
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    source = table(args.rows)
+    for label, convert in (
+        ("inferred", convert_times_inferred),
+        ("ISO8601", convert_times_iso8601),
+        ("convert_times", convert_times),
+    ):
+        best = min(
+            timeit.repeat(lambda: convert(source.copy(), COLUMNS), number=1, repeat=3)
+        )
+        print(f"{label:<14}{best * 1e3:>8.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
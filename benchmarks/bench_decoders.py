@@ -0,0 +1,84 @@
+"""
+Cost of decoding one model from its JSON, with from_dict and the compiled decoder.
+
+    python benchmarks/bench_decoders.py
+"""
+
+import timeit
+
+from juice_core_uplink_api_client._decoders import DECODERS
+from juice_core_uplink_api_client.models import Event, ReadOnlyPlan, Segment, SeriesData
+
+RESOURCE = {
+    "category": "DATA",
+    "target": "ALL",
+    "unit": "bits",
+    "instrument_type": "X",
+    "value": "1000",
+}
+SEGMENT = {
+    "start": "2032-01-01T00:00:00Z",
+    "end": "2032-01-01T12:00:00Z",
+    "segment_definition": "SEG",
+    "overwritten": False,
+    "instrument_overwritten": False,
+    "timeline": "PRIME",
+    "name": "SEG_1",
+    "resources": [RESOURCE] * 2,
+    "instrument_resources": None,
+    "segment_group": "GROUP",
+    "platform_power_profile": None,
+    "pointing_request_snippet": None,
+    "origin": "USER",
+    "prime": "JANUS",
+    "riders": ["MAJIS", "UVS"],
+}
+SAMPLES = {
+    SeriesData: {"epoch": "2032-01-01T00:00:00Z", "value": 1.0},
+    Event: {
+        "name": "PERIJOVE",
+        "start": "2032-01-01T00:00:00Z",
+        "end": "2032-01-01T00:00:00Z",
+        "description": "ID = 1; TYPE = PERIJOVE",
+    },
+    Segment: SEGMENT,
+    ReadOnlyPlan: {
+        "name": "PLAN",
+        "trajectory": "CREMA_5_1_150lb_23_1",
+        "mnemonic": "PLAN",
+        "description": "a plan",
+        "is_public": True,
+        "segments": "https://juicesoc.esac.esa.int/rest_api/plan/1/segments",
+        "segment_groups": [
+            {
+                "name": f"GROUP_{i}",
+                "mnemonic": f"GROUP_{i}",
+                "resources": [RESOURCE] * 2,
+                "instrument_resources": [],
+                "platform_power_profile": 1,
+            }
+            for i in range(10)
+        ],
+        "refine_log": "",
+    },
+}
+
+
+def per_call(decode, doc, number):
+    return min(timeit.repeat(lambda: decode(doc), number=number, repeat=5)) / number
+
+
+def main():
+    print(f"{'model':<14}{'from_dict':>12}{'compiled':>12}{'speedup':>9}")
+    for model, doc in SAMPLES.items():
+        number = 200 if model is ReadOnlyPlan else 5_000
+        generic = per_call(model.from_dict, doc, number)
+        compiled = per_call(DECODERS[model], doc, number)
+        print(
+            f"{model.__name__:<14}{generic * 1e6:>9.2f} µs{compiled * 1e6:>9.2f} µs"
+            f"{generic / compiled:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
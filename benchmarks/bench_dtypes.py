@@ -0,0 +1,58 @@
+"""
+Memory of a segment table with and without a DtypePolicy.
+
+    python benchmarks/bench_dtypes.py [--rows 1000000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from juice_core.dtypes import DtypePolicy, memory_report
+
+
+def table(rng, rows):
+    """Segments as the plan endpoints return them, before any typing"""
+    definitions = np.array([f"DEFINITION_{i}" for i in range(300)], dtype=object)
+    start = pd.Timestamp("2032-01-01") + pd.to_timedelta(
+        rng.integers(0, 10**9, rows), "s"
+    )
+    return pd.DataFrame(
+        {
+            "name": definitions[rng.integers(0, len(definitions), rows)],
+            "timeline": np.array(["PRIME", "RIDER"], dtype=object)[
+                rng.integers(0, 2, rows)
+            ],
+            "mnemonic": [f"SEG_{i}" for i in range(rows)],
+            "start": start,
+            "end": start + pd.to_timedelta(rng.integers(1, 3600, rows), "s"),
+            "overwritten": np.array([True, False], dtype=object)[
+                rng.integers(0, 2, rows)
+            ],
+            "instrument_count": rng.integers(0, 12, rows),
+            "power": rng.integers(0, 4000, rows) / 4,
+        }
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    segments = table(np.random.default_rng(0), args.rows)
+    start = time.perf_counter()
+    DtypePolicy().apply(segments.copy())
+    elapsed = time.perf_counter() - start
+
+    report = memory_report({"segments": segments})
+    print(report.to_string())
+    before, after = report["bytes"].sum(), report["lean_bytes"].sum()
+    print(f"\n{before / 2**20:.0f} MiB -> {after / 2**20:.0f} MiB")
+    print(f"policy applied in {elapsed * 1e3:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Cost of expanding the description column of a 100k-row event table.
+
+    python benchmarks/bench_expand_column.py [--rows 100000]
+"""
+
+import argparse
+import timeit
+
+import pandas as pd
+
+from juice_core import expand_column
+
+
+def expand_column_loop(tab, column_name="description"):
+    """The former expand_column, item by item"""
+    rows = []
+    for d in tab[column_name]:
+        values = {}
+        for item in d.split(";"):
+            key, value = item.split("=")
+            values[key.strip()] = value.strip()
+        rows.append(values)
+    return tab.drop(columns=[column_name]).join(pd.DataFrame(rows))
+
+
+def events(rows, scattered=False):
+    descriptions = [
+        f"ID = {i}; TYPE = PERIJOVE; ORBIT = {i % 50}; DISTANCE = {i * 1.5}"
+        for i in range(rows)
+    ]
+    if scattered:
+        # one event in ten has an extra key
+        descriptions[::10] = [d + "; FLYBY = GANYMEDE" for d in descriptions[::10]]
+    return pd.DataFrame(
+        {
+            "name": "PERIJOVE",
+            "start": pd.date_range("2032-01-01", periods=rows, freq="h"),
+            "description": descriptions,
+        }
+    )
+
+
+def best(func, tab):
+    return min(timeit.repeat(lambda: func(tab), number=1, repeat=5))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'table':<12}{'loop':>10}{'expand':>10}{'categorical':>13}")
+    for label, scattered in (("same keys", False), ("scattered", True)):
+        tab = events(args.rows, scattered)
+        loop = best(expand_column_loop, tab)
+        vectorised = best(expand_column, tab)
+        categorical = best(lambda t: expand_column(t, categorical=True), tab)
+        print(
+            f"{label:<12}{loop * 1e3:>7.0f} ms{vectorised * 1e3:>7.0f} ms"
+            f"{categorical * 1e3:>10.0f} ms"
+        )
+
+    tab = events(args.rows)
+    memory = {
+        "object": expand_column(tab).memory_usage(deep=True).sum(),
+        "categorical": expand_column(tab, categorical=True)
+        .memory_usage(deep=True)
+        .sum(),
+    }
+    print(", ".join(f"{k}: {v / 2**20:.1f} MiB" for k, v in memory.items()))
+
+
+if __name__ == "__main__":
+    main()
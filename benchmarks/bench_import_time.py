@@ -0,0 +1,74 @@
+"""
+Time taken by ``import juice_core`` in a fresh interpreter.
+
+Runs the import in new processes and reports the best and median time. With
+``--budget`` (in milliseconds, or the ``JUICE_CORE_IMPORT_BUDGET_MS``
+environment variable) it exits with an error when the best time is over it,
+and when pandas or the models got imported along the package.
+
+    python benchmarks/bench_import_time.py --budget 400
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import juice_core
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "ms": elapsed * 1000,
+    "eager": sorted(
+        name for name in ("pandas", "numpy", "juice_core_uplink_api_client.models.plan_list")
+        if name in sys.modules
+    ),
+}))
+"""
+
+
+def measure():
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=os.environ.get("JUICE_CORE_IMPORT_BUDGET_MS"),
+        help="maximum import time in milliseconds",
+    )
+    args = parser.parse_args()
+
+    measure()  # warm the bytecode and filesystem caches
+    runs = [measure() for _ in range(args.runs)]
+    times = [run["ms"] for run in runs]
+    eager = runs[0]["eager"]
+
+    print(
+        f"import juice_core: best {min(times):.0f} ms, median {statistics.median(times):.0f} ms"
+    )
+    if eager:
+        print(f"imported along: {', '.join(eager)}")
+
+    if args.budget is None:
+        return 0
+    budget = float(args.budget)
+    if min(times) > budget or eager:
+        print(f"over budget ({budget:.0f} ms, nothing heavy imported)")
+        return 1
+    print(f"within budget ({budget:.0f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
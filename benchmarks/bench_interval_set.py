@@ -0,0 +1,75 @@
+"""
+Interval algebra on 10^6 intervals with IntervalSet, against a loop over the rows.
+
+    python benchmarks/bench_interval_set.py [--rows 1000000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from juice_core.timeline import IntervalSet
+
+
+def table(rng, rows):
+    """Intervals of up to an hour over 30 years"""
+    start = pd.Timestamp("2032-01-01") + pd.to_timedelta(
+        rng.integers(0, 10**9, rows), "s"
+    )
+    return pd.DataFrame(
+        {
+            "start": start,
+            "end": start + pd.to_timedelta(rng.integers(1, 3600, rows), "s"),
+        }
+    )
+
+
+def union_loop(table):
+    """Merging the sorted rows one by one"""
+    merged = []
+    for row in table.sort_values("start").itertuples():
+        if merged and row.start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], row.end)
+        else:
+            merged.append([row.start, row.end])
+    return merged
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    a, b = table(rng, args.rows), table(rng, args.rows)
+
+    (sa, sb), build = timed(
+        lambda: (IntervalSet.from_table(a), IntervalSet.from_table(b))
+    )
+    window = (a["start"].min(), b["end"].max())
+    print(f"{args.rows} intervals per table, {len(sa)} and {len(sb)} once merged")
+    print(f"from_table x2   {build * 1e3:>8.0f} ms")
+    for label, func in (
+        ("union", lambda: sa | sb),
+        ("intersection", lambda: sa & sb),
+        ("difference", lambda: sa - sb),
+        ("complement", lambda: sa.complement(*window)),
+        ("stats", sa.stats),
+    ):
+        _, elapsed = timed(func)
+        print(f"{label:<16}{elapsed * 1e3:>8.0f} ms")
+
+    _, loop = timed(union_loop, a)
+    print(f"{'row loop union':<16}{loop * 1e3:>8.0f} ms (one table)")
+
+
+if __name__ == "__main__":
+    main()
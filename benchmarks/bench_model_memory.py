@@ -0,0 +1,67 @@
+"""
+Memory held by the decoded models, per instance.
+
+Compares the models as decoded by ``from_dict`` with the same models holding,
+as they did before sharing EMPTY_PROPERTIES, the copy of the source dict left
+once all the fields are popped as ``additional_properties``.
+
+    python benchmarks/bench_model_memory.py
+"""
+
+import gc
+import tracemalloc
+
+from juice_core_uplink_api_client.models import Event, Segment, SeriesData
+
+N = 20_000
+
+SAMPLES = {
+    SeriesData: {"epoch": "2032-01-01T00:00:00Z", "value": 1.0},
+    Event: {
+        "name": "PERIJOVE",
+        "start": "2032-01-01T00:00:00Z",
+        "end": "2032-01-01T00:00:00Z",
+        "description": "ID = 1; TYPE = PERIJOVE",
+    },
+    Segment: {
+        "start": "2032-01-01T00:00:00Z",
+        "end": "2032-01-01T12:00:00Z",
+        "segment_definition": "SEG",
+        "overwritten": False,
+        "instrument_overwritten": False,
+        "timeline": "PRIME",
+    },
+}
+
+
+def bytes_per_instance(model, sample, own_dict):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    instances = [model.from_dict(sample) for _ in range(N)]
+    if own_dict:
+        for instance in instances:
+            leftover = sample.copy()
+            for key in sample:
+                leftover.pop(key)
+            instance.additional_properties = leftover
+
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del instances
+    return (after - before) / N
+
+
+def main():
+    print(f"{'model':<12}{'before':>12}{'after':>12}{'saved':>8}")
+    for model, sample in SAMPLES.items():
+        own = bytes_per_instance(model, sample, own_dict=True)
+        shared = bytes_per_instance(model, sample, own_dict=False)
+        saved = 1 - shared / own
+        print(f"{model.__name__:<12}{own:>10.0f} B{shared:>10.0f} B{saved:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Peak memory of a long series query, decoded in full or streamed.
+
+Serves a series of N samples from a mock transport and compares the peak
+memory traced while reducing it to its mean value with ``get_series.sync``
+(whole body, decoded JSON and models at once) and with ``streaming.sync``
+(one chunk and one item at a time).
+
+    python benchmarks/bench_streaming_memory.py
+"""
+
+import gc
+import json
+import tracemalloc
+
+import httpx
+
+from juice_core_uplink_api_client import Client, streaming
+from juice_core_uplink_api_client.api.rest_api import get_series
+
+URL = "https://mock.juicesoc"
+CHUNK = 64 * 1024
+
+
+def serve(n):
+    body = json.dumps(
+        [
+            {"epoch": f"2032-01-01T00:00:{i % 60:02d}Z", "value": i * 0.5}
+            for i in range(n)
+        ]
+    ).encode()
+
+    def handler(request):
+        chunks = (body[i : i + CHUNK] for i in range(0, len(body), CHUNK))
+        return httpx.Response(200, content=chunks)
+
+    return Client(base_url=URL, httpx_args={"transport": httpx.MockTransport(handler)})
+
+
+def whole(client):
+    series = get_series.sync(client=client, body="{}")
+    return sum(s.value for s in series) / len(series)
+
+
+def streamed(client):
+    total = count = 0
+    for s in streaming.sync(get_series, client=client, body="{}"):
+        total += s.value
+        count += 1
+    return total / count
+
+
+def peak(fetch, client):
+    gc.collect()
+    tracemalloc.start()
+    fetch(client)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main():
+    print(f"{'samples':>10}{'whole':>12}{'streamed':>12}")
+    for n in (10_000, 100_000, 400_000):
+        client = serve(n)
+        print(f"{n:>10}{peak(whole, client):>9.1f} MB{peak(streamed, client):>9.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Interval joins with a Timeline against one boolean mask per query.
+
+    python benchmarks/bench_timeline.py [--rows 1000000] [--queries 100000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from juice_core.timeline import Timeline
+
+MASKED_QUERIES = 1_000
+
+
+def table(rng, rows):
+    """Segments of up to an hour over 30 years, one in 10,000 lasting a month"""
+    start = pd.Timestamp("2032-01-01") + pd.to_timedelta(
+        rng.integers(0, 10**9, rows), "s"
+    )
+    duration = pd.to_timedelta(rng.integers(0, 3600, rows), "s")
+    duration = duration.where(rng.random(rows) > 1e-4, pd.Timedelta("30D"))
+    return pd.DataFrame({"start": start, "end": start + duration})
+
+
+def masks(segments, queries):
+    starts, ends = segments["start"].to_numpy(), segments["end"].to_numpy()
+    return sum(
+        int(((starts <= e) & (ends >= s)).sum())
+        for s, e in zip(queries["start"].to_numpy(), queries["end"].to_numpy())
+    )
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    segments, queries = table(rng, args.rows), table(rng, args.queries)
+
+    timeline, build = timed(Timeline, segments)
+    joined, join = timed(timeline.join, queries)
+    _, containing = timed(timeline.containing, queries["start"])
+    _, nearest = timed(timeline.nearest, queries["start"])
+    _, masked = timed(masks, segments, queries.iloc[:MASKED_QUERIES])
+
+    print(f"{args.rows} intervals, {args.queries} queries, {len(joined)} pairs")
+    print(f"build       {build * 1e3:>8.0f} ms")
+    print(f"join        {join * 1e3:>8.0f} ms")
+    print(f"containing  {containing * 1e3:>8.0f} ms")
+    print(f"nearest     {nearest * 1e3:>8.0f} ms")
+    print(
+        f"masks       {masked * 1e3 * args.queries / MASKED_QUERIES:>8.0f} ms"
+        f" (extrapolated from {MASKED_QUERIES} queries)"
+    )
+
+
+if __name__ == "__main__":
+    main()
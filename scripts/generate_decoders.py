@@ -0,0 +1,201 @@
+"""
+Generate the compiled model decoders from the OpenAPI description of the API.
+
+The ``from_dict`` methods written by openapi-python-client are generic: they
+copy the source dict, define a ``_parse_*`` closure per optional field and
+check for Unset over and over. This script reads ``openapi.json`` and writes
+``juice_core_uplink_api_client/_decoders.py`` with one flat function per
+schema doing direct dict lookups and building the model in a single call,
+with the same results as ``from_dict``.
+
+Run it again after regenerating the client:
+
+    python scripts/generate_decoders.py && ruff format src/juice_core_uplink_api_client/_decoders.py
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+import attrs
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from juice_core_uplink_api_client import models  # noqa: E402
+
+OPENAPI = ROOT / "openapi.json"
+OUTPUT = ROOT / "src" / "juice_core_uplink_api_client" / "_decoders.py"
+REF = "#/components/schemas/"
+
+HEADER = '''"""Contains the compiled decoders of the models, equivalent to their from_dict
+
+Generated from openapi.json by scripts/generate_decoders.py, do not edit.
+"""
+
+from typing import Any
+
+from dateutil.parser import isoparse
+'''
+
+HELPERS = """
+
+def _extra(d: dict[str, Any], known: frozenset[str]) -> dict[str, Any]:
+    return {key: value for key, value in d.items() if key not in known}
+
+
+def _datetime(data: Any) -> Any:
+    if isinstance(data, Unset):
+        return data
+    return isoparse(data)
+
+
+def _nullable_datetime(data: Any) -> Any:
+    if isinstance(data, str):
+        try:
+            return isoparse(data)
+        except:  # noqa: E722
+            pass
+    return data
+
+
+def _nullable_list(data: Any, decode: Any) -> Any:
+    if isinstance(data, list):
+        return decode_list(data, decode)
+    return data
+"""
+
+
+def snake(name):
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", name).lower()
+
+
+def decoder_name(schema):
+    return f"decode_{snake(schema)}"
+
+
+def squash(name):
+    return name.replace("_", "").lower()
+
+
+def value(key, prop, required, enums):
+    """The expression decoding the property ``key`` of the dict ``d``"""
+    get = f'd["{key}"]' if required else f'd.get("{key}", UNSET)'
+    nullable = prop.get("nullable", False)
+    kind = prop.get("type")
+
+    if "enum" in prop:
+        if not required or nullable:
+            raise NotImplementedError(key, prop)
+        return f"{enums[key]}({get})"
+
+    if kind == "string" and prop.get("format") == "date-time":
+        if nullable:
+            return f"_nullable_datetime({get})"
+        return f"isoparse({get})" if required else f"_datetime({get})"
+
+    if kind == "array":
+        items = prop["items"]
+        if "$ref" in items:
+            decode = decoder_name(items["$ref"].removeprefix(REF))
+            if nullable:
+                return f"_nullable_list({get}, {decode})"
+            if required:
+                return f"decode_list({get}, {decode})"
+            return f'decode_list(d.get("{key}") or [], {decode})'
+        if items.get("nullable"):
+            # from_dict copies the items, and turns a missing list into []
+            if required:
+                raise NotImplementedError(key, prop)
+            return f'list(d.get("{key}") or ())'
+        return get
+
+    if kind in ("string", "integer", "number", "boolean"):
+        return get
+
+    raise NotImplementedError(key, prop)
+
+
+def decoder(schema_name, schema):
+    cls = getattr(models, schema_name)
+    properties = schema.get("properties", {})
+    required = set(schema.get("required", []))
+    keys = {squash(key): key for key in properties}
+
+    fields = [f for f in attrs.fields(cls) if f.init]
+    if len(fields) != len(properties):
+        msg = f"{schema_name}: the model and the schema have different fields"
+        raise ValueError(msg)
+
+    enums = {}
+    args = []
+    for f in fields:
+        key = keys[squash(f.name)]
+        if "enum" in properties[key]:
+            enums[key] = f.type.__name__ if isinstance(f.type, type) else f.type
+        args.append(value(key, properties[key], key in required, enums))
+
+    instance = snake(schema_name)
+    known = f"_{instance.upper()}_KEYS"
+    lines = [
+        "",
+        "",
+        f"{known} = frozenset({sorted(properties)!r})",
+        "",
+        "",
+        f"def {decoder_name(schema_name)}(d: dict[str, Any]) -> {schema_name}:",
+        f"    {instance} = {schema_name}(",
+        *(f"        {arg}," for arg in args),
+        "    )",
+        f"    if not {known}.issuperset(d):",
+        f"        {instance}.additional_properties = _extra(d, {known})",
+        f"    return {instance}",
+    ]
+    return lines, [cls, *(getattr(models, e) for e in enums.values())]
+
+
+def generate(spec):
+    schemas = spec["components"]["schemas"]
+    body = []
+    classes = {}
+    for name in sorted(schemas):
+        lines, used = decoder(name, schemas[name])
+        body += lines
+        for cls in used:
+            classes[cls.__name__] = cls.__module__
+
+    imports = sorted(
+        [
+            "from .lazy import decode_list",
+            "from .types import UNSET, Unset",
+            *(
+                f"from {module.removeprefix('juice_core_uplink_api_client')} import {name}"
+                for name, module in classes.items()
+            ),
+        ]
+    )
+    table = [
+        "",
+        "",
+        "DECODERS = {",
+        *(f"    {name}: {decoder_name(name)}," for name in sorted(schemas)),
+        "}",
+    ]
+    return "\n".join([HEADER, *imports, HELPERS.rstrip("\n"), *body, *table, ""])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("openapi", nargs="?", type=Path, default=OPENAPI)
+    parser.add_argument("-o", "--output", type=Path, default=OUTPUT)
+    args = parser.parse_args()
+
+    spec = json.loads(args.openapi.read_text())
+    args.output.write_text(generate(spec))
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import asyncio
+
+from attrs import define
+
+from juice_core_uplink_api_client.api import rest_api
+
+from .cache import cached, persistent_cache
+from .SHTRestInterface import (
+    DEFAULT_END,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_START,
+    DEFAULT_TRAJECTORY,
+    _BaseInterface,
+    align_series,
+    events_query,
+    find_plan_id,
+    known_mnemonics,
+    merge_events,
+    merge_series,
+    mnemonic_list,
+    pandas_convertable,
+    records_wanted,
+    resolve_output,
+    segment_records,
+    series_output,
+    series_query,
+    split_range,
+    trajectory_phases,
+    wants_records,
+)
+from .imports import lazy_module
+
+pd = lazy_module("pandas")
+
+
+async def gather_bounded(aws, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+    """Like asyncio.gather, but with at most ``max_concurrency`` awaitables running"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(aw):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*[run(aw) for aw in aws])
+
+
+@define(auto_attribs=True, eq=False)
+class AsyncSHTRestInterface(_BaseInterface):
+    """
+    Asynchronous counterpart of SHTRestInterface.
+
+    Every query method is a coroutine built on the ``asyncio`` variant of the
+    generated endpoints, so many queries can be awaited concurrently (e.g.
+    with ``asyncio.gather``) on a single event loop. The instance can be used
+    as an async context manager to close the underlying connections.
+
+    ``timeout``, ``max_connections``, ``max_keepalive_connections`` and
+    ``http2`` configure the client built when none is given. With
+    ``lazy_models`` the list fields of the returned models are decoded on
+    access (see juice_core_uplink_api_client.lazy). ``dtypes`` types the
+    columns of the returned tables (see juice_core.dtypes.DtypePolicy), e.g.
+    categoricals for the repeated strings.
+    """
+
+    async def __aenter__(self) -> "AsyncSHTRestInterface":
+        await self.client.__aenter__()
+        return self
+
+    async def __aexit__(self, *args, **kwargs) -> None:
+        await self.client.__aexit__(*args, **kwargs)
+
+    async def _fetch(self, endpoint, *args, **kwargs):
+        """Call a generated endpoint, parsing its response (see _parse)"""
+        request = endpoint._get_kwargs(*args, **kwargs)  # noqa: SLF001
+        response = await self.client.get_async_httpx_client().request(**request)
+        return self._parse(endpoint, request, response)
+
+    @cached
+    @persistent_cache
+    @pandas_convertable
+    async def pcw(self):
+        return await self._fetch(rest_api.get_pcw)
+
+    @cached
+    @persistent_cache
+    @pandas_convertable
+    async def pcw_by_mnemonic(self, mnemonic: str):
+        return await self._fetch(rest_api.get_pcw_by_mnemonic, mnemonic=mnemonic)
+
+    @cached
+    @persistent_cache
+    @pandas_convertable(time_fields=["created"])
+    async def plans(self):
+        """Retrieve all the plans available on the endpoint"""
+        return await self._fetch(rest_api.get_plan)
+
+    async def plan_id_by_name(self, name):
+        """Retrieve the plan id from the plan name"""
+        return find_plan_id(await self.plans(as_pandas=False), name)
+
+    @cached
+    @persistent_cache
+    @pandas_convertable(time_fields=["start", "end"])
+    async def plan_segments(self, plan_id_or_name):
+        """Retrieve the segments of a plan"""
+        if not wants_records.get():
+            return (await self.plan(plan_id_or_name, as_pandas=False)).segments
+
+        # tables are built from the records, without the Plan and Segment models
+        if isinstance(plan_id_or_name, str):
+            plan_id_or_name = await self.plan_id_by_name(plan_id_or_name)
+        return segment_records(
+            await self._fetch(rest_api.get_plan_by_id, plan_id_or_name)
+        )
+
+    @cached
+    @persistent_cache
+    @pandas_convertable(time_fields=["start", "end"])
+    async def engineering_segments(
+        self,
+        trajectory=DEFAULT_TRAJECTORY,
+    ) -> pd.DataFrame:
+        """Retrieve the engineering segments for a mnemonic"""
+        return await self._fetch(
+            rest_api.get_trajectory_engineering_segments_by_mnemonic,
+            mnemonic=trajectory,
+        )
+
+    @cached
+    @persistent_cache
+    @pandas_convertable
+    async def plan(self, plan_id_or_name):
+        """Retrieve the plan from the plan id or name"""
+        if isinstance(plan_id_or_name, str):
+            plan_id_or_name = await self.plan_id_by_name(plan_id_or_name)
+
+        return await self._fetch(rest_api.get_plan_by_id, plan_id_or_name)
+
+    @cached
+    @persistent_cache
+    @pandas_convertable(time_fields=["start", "end"])
+    async def phases(self, trajectory=DEFAULT_TRAJECTORY):
+        """Retrieve the mission phases of a trajectory"""
+        return trajectory_phases(
+            await self._fetch(rest_api.get_trajectory_by_mnemonic, mnemonic=trajectory)
+        )
+
+    async def time_windows(
+        self,
+        window,
+        trajectory=DEFAULT_TRAJECTORY,
+        start=DEFAULT_START,
+        end=DEFAULT_END,
+    ):
+        """Split [start, end] into windows
+
+        ``window`` is either a pandas offset alias (e.g. "MS" for one window
+        per month) or "phases" for one window per phase of the trajectory.
+        """
+        phases = None
+        if window == "phases":
+            phases = await self.phases(trajectory, as_pandas=False)
+        return split_range(window, start, end, phases)
+
+    @cached
+    @persistent_cache
+    @pandas_convertable
+    async def known_series(self, trajectory=DEFAULT_TRAJECTORY):
+        """Retrieve all the series available on the endpoint"""
+        return await self._fetch(
+            rest_api.get_trajectory_series_by_mnemonic,
+            mnemonic=trajectory,
+        )
+
+    @cached
+    @persistent_cache
+    async def series(
+        self,
+        series_name,
+        trajectory=DEFAULT_TRAJECTORY,
+        start=DEFAULT_START,
+        end=DEFAULT_END,
+        window=None,
+        *,
+        as_pandas=True,
+        output=None,
+        utc=False,
+    ):
+        """Retrieve a serie from the endpoint
+
+        As pandas, the response is decoded directly into epoch and value
+        columns, indexed by naive UTC epochs (tz-aware ones with ``utc``);
+        with ``output="arrow"`` or ``"polars"`` into a table of epoch and
+        value columns; otherwise (``as_pandas=False`` or ``output="raw"``) a
+        list of SeriesData is returned.
+
+        If ``window`` is given (see time_windows) the range is split and the
+        windows are retrieved concurrently, then merged back in order.
+        """
+        output = resolve_output(output, as_pandas)
+
+        with records_wanted(output != "raw"):
+            if window is None:
+                result = await self._series(series_name, trajectory, start, end)
+            else:
+                windows = await self.time_windows(window, trajectory, start, end)
+                result = merge_series(
+                    await gather_bounded(
+                        self._series(series_name, trajectory, *w) for w in windows
+                    )
+                )
+
+        return series_output(result, output, series_name, utc=utc)
+
+    async def _series(self, series_name, trajectory, start, end):
+        body = series_query(series_name, trajectory, start, end)
+        return await self._fetch(rest_api.get_series, body=body)
+
+    async def series_multi(
+        self,
+        series_names,
+        trajectory=DEFAULT_TRAJECTORY,
+        start=DEFAULT_START,
+        end=DEFAULT_END,
+        as_pandas=True,
+    ):
+        """Retrieve multiple series from the endpoint, concurrently"""
+        return await asyncio.gather(
+            *[
+                self.series(
+                    series_name,
+                    trajectory=trajectory,
+                    start=start,
+                    end=end,
+                    as_pandas=as_pandas,
+                )
+                for series_name in series_names
+            ],
+        )
+
+    async def series_bulk(
+        self,
+        series_names,
+        trajectory=DEFAULT_TRAJECTORY,
+        start=DEFAULT_START,
+        end=DEFAULT_END,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        *,
+        utc=False,
+    ) -> pd.DataFrame:
+        """Retrieve multiple series as a single DataFrame indexed by epoch
+
+        At most ``max_concurrency`` requests are in flight at any time and each
+        response is decoded directly into columns (see series). The index is
+        naive UTC, tz-aware (UTC) with ``utc``.
+        """
+        series = await gather_bounded(
+            (self.series(n, trajectory, start, end, utc=utc) for n in series_names),
+            max_concurrency=max_concurrency,
+        )
+        return align_series(series)
+
+    @cached
+    @persistent_cache
+    @pandas_convertable
+    async def event_types(self, trajectory=DEFAULT_TRAJECTORY):
+        """Retrieve all the events applicable for a trajectory"""
+        return await self._fetch(
+            rest_api.get_trajectory_event_by_mnemonic,
+            mnemonic=trajectory,
+        )
+
+    @cached
+    @persistent_cache
+    async def segment_definition(self, mnemonic):
+        return await rest_api.get_segment_definition_by_mnemonic.asyncio(
+            client=self.client,
+            mnemonic=mnemonic,
+        )
+
+    @pandas_convertable
+    async def segment_definitions(self, mnemonics: list[str]):
+        return await asyncio.gather(*[self.segment_definition(m) for m in mnemonics])
+
+    @cached
+    @persistent_cache
+    @pandas_convertable(time_fields=["start", "end"])
+    async def events(
+        self,
+        mnemonics: list[str] | str = [],
+        trajectory: str = DEFAULT_TRAJECTORY,
+        start=DEFAULT_START,
+        end=DEFAULT_END,
+        window=None,
+    ):
+        """Retrieve events of a given type from the endpoint
+
+        If ``window`` is given (see time_windows) the range is split and the
+        windows are retrieved concurrently, then merged back in order.
+        """
+        mnemonics = mnemonic_list(mnemonics)
+        if len(mnemonics) == 0:
+            mnemonics = known_mnemonics(
+                await self.event_types(trajectory=trajectory, as_pandas=False)
+            )
+
+        def fetch(start, end):
+            body = events_query(mnemonics, trajectory, start, end)
+            return self._fetch(rest_api.get_events, body=body)
+
+        if window is None:
+            return await fetch(start, end)
+
+        windows = await self.time_windows(window, trajectory, start, end)
+        return merge_events(await gather_bounded(fetch(*w) for w in windows))
@@ -1,34 +1,48 @@
+from __future__ import annotations
+
 import asyncio
 import json
 from collections.abc import Iterable
-from functools import cache, partial
-
-import pandas as pd
-from attrs import define
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from functools import partial
+from inspect import iscoroutinefunction
+from itertools import chain
+
+from attrs import define, field
 from loguru import logger as log
 from merge_args import merge_args  # also makefun has a decorator that does this
 
-from juice_core_uplink_api_client.api.rest_api import (
-    get_events,
-    get_pcw,
-    get_pcw_by_mnemonic,
-    get_plan,
-    get_plan_by_id,
-    get_segment_definition_by_mnemonic,
-    get_series,
-    get_trajectory_engineering_segments_by_mnemonic,
-    get_trajectory_event_by_mnemonic,
-    get_trajectory_series_by_mnemonic,
-)
+from juice_core_uplink_api_client import errors
+from juice_core_uplink_api_client.api import rest_api
 from juice_core_uplink_api_client.client import Client
+from juice_core_uplink_api_client.lazy import lazy_lists
+from juice_core_uplink_api_client.retry import RetryPolicy
+
+from .arrow import as_output, check_output, records_to_arrow, series_to_arrow
+from .cache import DiskCache, MemoryCache, ParsedMemo, cached, persistent_cache
+from .columnar import description_columns, series_from_records, times_to_datetime64
+from .dtypes import DtypePolicy
+from .imports import lazy_module
+from .windows import merge_windows, phase_windows, record_key, time_windows
+
+pd = lazy_module("pandas")
 
 DEFAULT_START = "2020"
 DEFAULT_END = "2040"
 DEFAULT_TRAJECTORY = "CREMA_5_1_150lb_23_1"
 DEFAULT_URL = "https://juicesoc.esac.esa.int"
+DEFAULT_MAX_CONCURRENCY = 8
+
+# True while a pandas_convertable method builds a pandas result: the interfaces
+# then fetch plain JSON records, skipping the from_dict/to_dict round-trip
+wants_records: ContextVar[bool] = ContextVar("wants_records", default=False)
 
 
-def expand_column(tab: pd.DataFrame, column_name="description") -> pd.DataFrame:
+def expand_column(
+    tab: pd.DataFrame, column_name="description", *, categorical=False
+) -> pd.DataFrame:
     """Some tables have a description column that contains additional information.
 
     This function expands the description column into multiple columns.
@@ -36,49 +50,196 @@ def expand_column(tab: pd.DataFrame, column_name="description") -> pd.DataFrame:
     Parameters
     ----------
     tab (pd.DataFrame):
-        table to expand, must have a description column
+        table to expand, must have a description column of ``key = value; ...``
+        items
+    categorical (bool):
+        return the new columns as categoricals, for keys taking few values
 
     Returns
     -------
     pd.DataFrame:
-        a new dataframe with the description column expanded
+        a new dataframe with the description column expanded, one column per
+        key with NaN where a row does not have it. Missing descriptions and
+        malformed items (without "=") are skipped.
 
     """
-    additional_columns = []
-    for d in tab[column_name]:
-        values = {}
-        for item in d.split(";"):
-            key, value = item.split("=")
-            values[key.strip()] = value.strip()
+    columns = description_columns(tab[column_name].tolist(), categorical=categorical)
+    tab_ = tab.drop(columns=[column_name], inplace=False)
+    return tab_.join(pd.DataFrame(columns, index=tab.index))
 
-        additional_columns.append(values)
 
-    tab_ = tab.drop(columns=[column_name], inplace=False)
-    newd = pd.DataFrame(additional_columns)
+def convert_times(table, columns=[], *, utc=False, errors="coerce"):
+    """Convert the ISO8601 UTC time columns of a table to datetimes, in place.
 
-    return tab_.join(newd)
+    The columns are parsed together, in one pass: the "...Z" times returned
+    by the API directly by NumPy, any other ISO8601 time by pandas with that
+    format (no per-column format inference).
 
+    Parameters
+    ----------
+    table (pd.DataFrame):
+        table to convert
+    columns (list[str] | str):
+        time columns; the ones missing from the table are skipped
+    utc (bool):
+        make the columns tz-aware (UTC) instead of naive UTC
+    errors (str):
+        "coerce" turns the values that are not times into NaT and logs a
+        warning with their rows, "raise" raises a ValueError instead
+
+    Returns
+    -------
+    pd.DataFrame:
+        the table
+
+    """
+    if errors not in ("coerce", "raise"):
+        msg = f"errors must be 'coerce' or 'raise', not {errors!r}"
+        raise ValueError(msg)
 
-def convert_times(table, columns=[]):
     if isinstance(columns, str):
         columns = [columns]
 
-    if len(columns) == 0 or columns is None:
+    if columns is None or len(columns) == 0:
         return table
 
+    present = []
     for col in columns:
-        try:
-            table[col] = pd.to_datetime(table[col]).dt.tz_localize(None)
-        except Exception:
+        if col in table:
+            present.append(col)
+        else:
             log.warning(
-                f"Could not convert column {col} to datetime. Maybe is a point event?",
+                f"No column {col} to convert to datetime. Maybe is a point event?"
             )
 
+    parsed = [
+        col for col in present if not pd.api.types.is_datetime64_any_dtype(table[col])
+    ]
+    if parsed:
+        values = list(chain.from_iterable(table[col].tolist() for col in parsed))
+        times, unparsed = times_to_datetime64(values)
+        times = times.reshape(len(parsed), len(table))
+        unparsed = unparsed.reshape(len(parsed), len(table))
+
+        if unparsed.any():
+            rows = {
+                col: table.index[mask].tolist()
+                for col, mask in zip(parsed, unparsed, strict=True)
+                if mask.any()
+            }
+            msg = "Could not convert to datetime " + ", ".join(
+                f"{col} on {len(r)} rows (first {r[0]!r})" for col, r in rows.items()
+            )
+            if errors == "raise":
+                raise ValueError(msg)
+            log.warning(msg)
+
+        for col, column in zip(parsed, times, strict=True):
+            table[col] = column
+
+    for col in present:
+        column = table[col]
+        if column.dt.tz is not None:
+            column = column.dt.tz_convert("UTC").dt.tz_localize(None)
+        if utc:
+            column = column.dt.tz_localize("UTC")
+        if column is not table[col]:
+            table[col] = column
+
     return table
 
 
 def table_to_timeseries(table, name=None):
-    return pd.Series(data=table.value.values, index=table.epoch.values, name=name)
+    return pd.Series(
+        data=table.value.to_numpy(), index=pd.DatetimeIndex(table.epoch), name=name
+    )
+
+
+def align_series(series) -> pd.DataFrame:
+    """Join multiple timeseries into a DataFrame indexed by epoch, one column each."""
+    series = [s[~s.index.duplicated()] for s in series]
+    if len(series) == 0:
+        return pd.DataFrame(index=pd.DatetimeIndex([], name="epoch"))
+
+    table = pd.concat(series, axis=1).sort_index()
+    table.index.name = "epoch"
+    return table
+
+
+@contextmanager
+def records_wanted(wanted):
+    """Set wants_records for the calls made within the block."""
+    token = wants_records.set(wanted)
+    try:
+        yield
+    finally:
+        wants_records.reset(token)
+
+
+def decode_records(client, response):
+    """Decode a raw JSON response, mirroring the status handling of the endpoints."""
+    if response.status_code == 200:  # noqa: PLR2004
+        return client.json_decoder(response.content)
+
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+
+    log.warning(f"Got status {response.status_code} from {response.url}")
+    return []
+
+
+def _as_pandas(
+    result,
+    time_fields=[],
+    is_timeseries=False,
+    expand_fields=[],
+    series_name=None,
+    utc=False,
+    dtypes=None,
+):
+    """Convert the result of an API call into a pandas object.
+
+    Tables are typed with the ``dtypes`` policy, if any.
+    """
+    return_first_item = False
+    if isinstance(result, dict) or not isinstance(result, Iterable):
+        log.debug("Result is requested as pandas but it is not iterable!")
+        return_first_item = True
+        result = [result]
+
+    log.debug("Result requested as pandas. Converting.")
+    table = convert_times(
+        pd.DataFrame(
+            [d.to_dict() if hasattr(d, "to_dict") else d for d in result],
+        ),
+        columns=time_fields,
+        utc=utc,
+    )
+
+    for f in expand_fields:
+        log.debug("Expanding column %s", f)
+        table = expand_column(table, column_name=f)
+
+    if is_timeseries:
+        log.debug("Is a timeseries")
+        return table_to_timeseries(table, name=series_name)
+
+    if return_first_item:
+        log.debug("Returning as Series")
+        return table.iloc[0]
+
+    if dtypes is not None:
+        table = dtypes.apply(table)
+
+    log.debug("Returning table")
+    return table
+
+
+def resolve_output(output, as_pandas=True) -> str:
+    """The output requested by ``output``, or by ``as_pandas`` when it is None."""
+    if output is None:
+        return "pandas" if as_pandas else "raw"
+    return check_output(output)
 
 
 def pandas_convertable(
@@ -87,6 +248,17 @@ def pandas_convertable(
     is_timeseries=False,
     expand_fields=[],
 ):
+    """Add ``as_pandas`` and ``output`` keywords to a method returning API models.
+
+    ``output`` is "pandas" (a DataFrame, the default), "arrow" (a pyarrow
+    Table), "polars" (a Polars DataFrame over that table) or "raw" (the API
+    models, as with ``as_pandas=False``); tables other than pandas are built
+    straight from the decoded JSON records (see juice_core.arrow). A ``utc``
+    keyword makes the time columns tz-aware (UTC) rather than naive.
+
+    Works both on plain methods and on coroutine methods, in which case the
+    wrapper is a coroutine as well.
+    """
     if func is None:
         return partial(
             pandas_convertable,
@@ -97,8 +269,7 @@ def pandas_convertable(
 
     from copy import copy
 
-    @merge_args(func)
-    def wrapper(*args, as_pandas=True, **kwargs):
+    def prepare(args, kwargs):
         time_fields_ = copy(time_fields)
 
         series_name = None
@@ -106,47 +277,174 @@ def pandas_convertable(
             time_fields_ += ["epoch"]
             series_name = kwargs["series_name"] if "series_name" in kwargs else args[1]
 
-        result = func(*args, **kwargs)  # call actual function
-
-        # log.debug(f"Got result from API:\n{result}")
-
-        return_first_item = False
-        if not isinstance(result, Iterable) and as_pandas:
-            log.debug("Result is requested as pandas but it is not iterable!")
-            return_first_item = True
-            result = [result]
-
-        # convert to pandas if needed
-        if as_pandas:
-            log.debug("Result requested as pandas. Converting.")
-            table = convert_times(
-                pd.DataFrame(
-                    [d.to_dict() if hasattr(d, "to_dict") else d for d in result],
-                ),
-                columns=time_fields_,
-            )
+        as_pandas = partial(
+            _as_pandas,
+            time_fields=time_fields_,
+            is_timeseries=is_timeseries,
+            expand_fields=expand_fields,
+            series_name=series_name,
+            dtypes=getattr(args[0], "dtypes", None) if args else None,
+        )
 
-            for f in expand_fields:
-                log.debug("Expanding column %s", f)
-                table = expand_column(table, column_name=f)
+        def convert(result, output, utc):
+            if output == "pandas":
+                return as_pandas(result, utc=utc)
 
+            log.debug(f"Result requested as {output}. Converting.")
+            if isinstance(result, dict) or not isinstance(result, Iterable):
+                result = [result]
             if is_timeseries:
-                log.debug("Is a timeseries")
-                return table_to_timeseries(table, name=series_name)
+                table = series_to_arrow(
+                    [r.to_dict() if hasattr(r, "to_dict") else r for r in result],
+                    name=series_name,
+                    utc=utc,
+                )
+            else:
+                table = records_to_arrow(
+                    result, time_fields_, utc=utc, expand_fields=expand_fields
+                )
+            return as_output(table, output)
+
+        return convert
+
+    if iscoroutinefunction(func):
+
+        @merge_args(func)
+        async def async_wrapper(
+            *args, as_pandas=True, output=None, utc=False, **kwargs
+        ):
+            output = resolve_output(output, as_pandas)
+            convert = prepare(args, kwargs)
+            with records_wanted(output != "raw"):
+                result = await func(*args, **kwargs)  # await actual coroutine
+
+            if output != "raw":
+                return convert(result, output, utc)
+
+            log.debug("Returning plain result")
+            return result
+
+        async_wrapper.__name__ = func.__name__
+        async_wrapper.__qualname__ = func.__qualname__
+        return async_wrapper
 
-            if return_first_item:
-                log.debug("Returning as Series")
-                return table.iloc[0]
+    @merge_args(func)
+    def wrapper(*args, as_pandas=True, output=None, utc=False, **kwargs):
+        output = resolve_output(output, as_pandas)
+        convert = prepare(args, kwargs)
+        with records_wanted(output != "raw"):
+            result = func(*args, **kwargs)  # call actual function
+
+        # log.debug(f"Got result from API:\n{result}")
 
-            log.debug('Returning table')
-            return table
+        # convert to a table if needed
+        if output != "raw":
+            return convert(result, output, utc)
 
-        log.debug('Returning plain result')
+        log.debug("Returning plain result")
         return result
 
+    # merge_args keeps the name of the wrapper, but the caches key on it
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
     return wrapper
 
 
+def series_query(
+    series_name,
+    trajectory=DEFAULT_TRAJECTORY,
+    start=DEFAULT_START,
+    end=DEFAULT_END,
+) -> str:
+    """Build the JSON body expected by the series endpoint."""
+    q = {
+        "start": str(start),
+        "end": str(end),
+        "trajectory": trajectory,
+        "series": series_name,
+    }
+
+    return json.dumps(q)
+
+
+def events_query(
+    mnemonics: list[str],
+    trajectory=DEFAULT_TRAJECTORY,
+    start=DEFAULT_START,
+    end=DEFAULT_END,
+) -> str:
+    """Build the JSON body expected by the events endpoint."""
+    q = {
+        "start": str(start),
+        "end": str(end),
+        "trajectory": trajectory,
+        "mnemonics": mnemonics,
+    }
+
+    return json.dumps(q)
+
+
+def find_plan_id(plans, name):
+    """The id of the plan called ``name``, ignoring case and surrounding spaces."""
+    for plan in plans:
+        if plan.name.lower().strip() == name.lower().strip():
+            log.debug(f"Plan {name} has id {plan.id}")
+            return plan.id
+
+    log.warning(f"No plan with name {name} found")
+    return None
+
+
+def segment_records(plan):
+    """The segment records of a plan record, none if the plan was not found."""
+    return plan.get("segments", []) if isinstance(plan, dict) else []
+
+
+def trajectory_phases(trajectory):
+    """The phases of a trajectory, record or model."""
+    if isinstance(trajectory, dict):
+        return trajectory.get("phases", [])
+    return trajectory.phases
+
+
+def split_range(window, start, end, phases=None):
+    """Split [start, end] by a pandas offset alias, or at the ``phases``."""
+    if window == "phases":
+        return phase_windows(phases, start, end)
+    return time_windows(start, end, freq=window)
+
+
+def merge_series(results) -> list:
+    """Merge the series records (or models) of consecutive windows."""
+    return merge_windows(results, key=record_key("epoch"))
+
+
+def merge_events(results) -> list:
+    """Merge the events of consecutive windows."""
+    return merge_windows(results, key=record_key("name", "start", "end"))
+
+
+def mnemonic_list(mnemonics) -> list[str]:
+    """The event mnemonics as a list, a single one being given as a string."""
+    return [mnemonics] if isinstance(mnemonics, str) else list(mnemonics)
+
+
+def known_mnemonics(event_types) -> list[str]:
+    """The mnemonics of all the event types of a trajectory."""
+    mnemonics = [m.mnemonic for m in event_types]
+    log.info(f"Retrieving all known events {mnemonics}")
+    return mnemonics
+
+
+def series_output(result, output, series_name=None, *, utc=False):
+    """The series records (models for "raw") fetched, in the requested output."""
+    if output == "pandas":
+        return series_from_records(result, name=series_name, utc=utc)
+    if output != "raw":
+        return as_output(series_to_arrow(result, series_name, utc=utc), output)
+    return result
+
+
 def synchronize_async_helper(to_await):
     async_response = []
 
@@ -161,99 +459,209 @@ def synchronize_async_helper(to_await):
 
 
 @define(auto_attribs=True, eq=False)
-class SHTRestInterface:
+class _BaseInterface:
     """
-    Main entry point for interacting with the Juice Core Uplink API
+    Options, caches and response parsing shared by the sync and async interfaces.
+
+    The interfaces only differ in how they send the requests: building the
+    queries and processing the results goes through the helpers above.
     """
 
     client: Client | None = None
     timeout: float = 40.0
+    max_connections: int | None = None
+    max_keepalive_connections: int | None = None
+    http2: bool = False
+    lazy_models: bool = False
+    dtypes: DtypePolicy | None = None
+    memory_cache: MemoryCache = field(factory=MemoryCache)
+    disk_cache: DiskCache | None = None
+    parsed_memo: ParsedMemo = field(factory=ParsedMemo, repr=False)
 
     def __attrs_post_init__(self):
         if not self.client:
-            self.client = Client(DEFAULT_URL)
-        # self.client.timeout = self.timeout
+            self.client = Client(
+                DEFAULT_URL,
+                coalesce_requests=True,
+                conditional_requests=True,
+                retry=RetryPolicy(),
+                timeout=self.timeout,
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                http2=self.http2,
+            )
 
-    @cache
+    def _parse(self, endpoint, request, response):
+        """Parse the response of a generated endpoint
+
+        Returns the decoded JSON records when building a table (see
+        wants_records), the parsed models otherwise (with lazy list fields if
+        ``lazy_models``), reusing either on a 304 Not Modified.
+        """
+        if wants_records.get():
+            return self.parsed_memo.parse(
+                endpoint, self.client, request, response, decode=decode_records
+            )
+        with lazy_lists(self.lazy_models):
+            return self.parsed_memo.parse(endpoint, self.client, request, response)
+
+
+@define(auto_attribs=True, eq=False)
+class SHTRestInterface(_BaseInterface):
+    """
+    Main entry point for interacting with the Juice Core Uplink API
+
+    ``timeout``, ``max_connections``, ``max_keepalive_connections`` and
+    ``http2`` configure the client built when none is given. With
+    ``lazy_models`` the list fields of the returned models are decoded on
+    access (see juice_core_uplink_api_client.lazy). ``dtypes`` types the
+    columns of the returned tables (see juice_core.dtypes.DtypePolicy), e.g.
+    categoricals for the repeated strings.
+    """
+
+    def _fetch(self, endpoint, *args, **kwargs):
+        """Call a generated endpoint, parsing its response (see _parse)"""
+        request = endpoint._get_kwargs(*args, **kwargs)  # noqa: SLF001
+        response = self.client.get_httpx_client().request(**request)
+        return self._parse(endpoint, request, response)
+
+    @cached
+    @persistent_cache
     @pandas_convertable
     def pcw(self):
-        return get_pcw.sync(client=self.client)
+        return self._fetch(rest_api.get_pcw)
 
-    @cache
+    @cached
+    @persistent_cache
     @pandas_convertable
     def pcw_by_mnemonic(self, mnemonic: str):
-        return get_pcw_by_mnemonic.sync(client=self.client, mnemonic=mnemonic)
+        return self._fetch(rest_api.get_pcw_by_mnemonic, mnemonic=mnemonic)
 
-    @cache
+    @cached
+    @persistent_cache
     @pandas_convertable(time_fields=["created"])
     def plans(self):
         """Retrieve all the plans available on the endpoint"""
-        return get_plan.sync(client=self.client)
+        return self._fetch(rest_api.get_plan)
 
     def plan_id_by_name(self, name):
         """Retrieve the plan id from the plan name"""
-        for plan in self.plans(as_pandas=False):
-            if plan.name.lower().strip() == name.lower().strip():
-                log.debug(f"Plan {name} has id {plan.id}")
-                return plan.id
-
-        log.warning(f"No plan with name {name} found")
-        return None
+        return find_plan_id(self.plans(as_pandas=False), name)
 
-    @cache
+    @cached
+    @persistent_cache
     @pandas_convertable(time_fields=["start", "end"])
     def plan_segments(self, plan_id_or_name):
         """Retrieve the segments of a plan"""
-        plan = self.plan(plan_id_or_name, as_pandas=False)
-        return plan.segments
+        if not wants_records.get():
+            return self.plan(plan_id_or_name, as_pandas=False).segments
+
+        # tables are built from the records, without the Plan and Segment models
+        if isinstance(plan_id_or_name, str):
+            plan_id_or_name = self.plan_id_by_name(plan_id_or_name)
+        return segment_records(self._fetch(rest_api.get_plan_by_id, plan_id_or_name))
 
-    @cache
+    @cached
+    @persistent_cache
     @pandas_convertable(time_fields=["start", "end"])
     def engineering_segments(self, trajectory=DEFAULT_TRAJECTORY) -> pd.DataFrame:
         """Retrieve the engineering segments for a mnemonic"""
-        return get_trajectory_engineering_segments_by_mnemonic.sync(
+        return self._fetch(
+            rest_api.get_trajectory_engineering_segments_by_mnemonic,
             mnemonic=trajectory,
-            client=self.client,
         )
 
-    @cache
+    @cached
+    @persistent_cache
     @pandas_convertable
     def plan(self, plan_id_or_name):
         """Retrieve the plan from the plan id or name"""
         if isinstance(plan_id_or_name, str):
             plan_id_or_name = self.plan_id_by_name(plan_id_or_name)
 
-        return get_plan_by_id.sync(plan_id_or_name, client=self.client)
+        return self._fetch(rest_api.get_plan_by_id, plan_id_or_name)
+
+    @cached
+    @persistent_cache
+    @pandas_convertable(time_fields=["start", "end"])
+    def phases(self, trajectory=DEFAULT_TRAJECTORY):
+        """Retrieve the mission phases of a trajectory"""
+        return trajectory_phases(
+            self._fetch(rest_api.get_trajectory_by_mnemonic, mnemonic=trajectory)
+        )
+
+    def time_windows(
+        self,
+        window,
+        trajectory=DEFAULT_TRAJECTORY,
+        start=DEFAULT_START,
+        end=DEFAULT_END,
+    ):
+        """Split [start, end] into windows
+
+        ``window`` is either a pandas offset alias (e.g. "MS" for one window
+        per month) or "phases" for one window per phase of the trajectory.
+        """
+        phases = (
+            self.phases(trajectory, as_pandas=False) if window == "phases" else None
+        )
+        return split_range(window, start, end, phases)
 
-    @cache
+    def _map_windows(self, fetch, windows):
+        with ThreadPoolExecutor(max_workers=DEFAULT_MAX_CONCURRENCY) as pool:
+            # run in copies of the current context, so wants_records holds
+            futures = [pool.submit(copy_context().run, fetch, *w) for w in windows]
+            return [f.result() for f in futures]
+
+    @cached
+    @persistent_cache
     @pandas_convertable
     def known_series(self, trajectory=DEFAULT_TRAJECTORY):
         """Retrieve all the series available on the endpoint"""
-        return get_trajectory_series_by_mnemonic.sync(
-            client=self.client,
-            mnemonic=trajectory,
+        return self._fetch(
+            rest_api.get_trajectory_series_by_mnemonic, mnemonic=trajectory
         )
 
-    @cache
-    @pandas_convertable(is_timeseries=True)
+    @cached
+    @persistent_cache
     def series(
         self,
         series_name,
         trajectory=DEFAULT_TRAJECTORY,
         start=DEFAULT_START,
         end=DEFAULT_END,
+        window=None,
+        *,
+        as_pandas=True,
+        output=None,
+        utc=False,
     ):
-        """Retrieve a serie from the endpoint"""
+        """Retrieve a serie from the endpoint
+
+        As pandas, the response is decoded directly into epoch and value
+        columns, indexed by naive UTC epochs (tz-aware ones with ``utc``);
+        with ``output="arrow"`` or ``"polars"`` into a table of epoch and
+        value columns; otherwise (``as_pandas=False`` or ``output="raw"``) a
+        list of SeriesData is returned.
 
-        q = {
-            "start": str(start),
-            "end": str(end),
-            "trajectory": trajectory,
-            "series": series_name,
-        }
+        If ``window`` is given (see time_windows) the range is split and the
+        windows are retrieved in parallel, then merged back in order.
+        """
+        output = resolve_output(output, as_pandas)
+        fetch = partial(self._series, series_name, trajectory)
 
-        body = json.dumps(q)
-        return get_series.sync(client=self.client, body=body)
+        with records_wanted(output != "raw"):
+            if window is None:
+                result = fetch(start, end)
+            else:
+                windows = self.time_windows(window, trajectory, start, end)
+                result = merge_series(self._map_windows(fetch, windows))
+
+        return series_output(result, output, series_name, utc=utc)
+
+    def _series(self, series_name, trajectory, start, end):
+        body = series_query(series_name, trajectory, start, end)
+        return self._fetch(rest_api.get_series, body=body)
 
     def series_multi_(
         self,
@@ -281,31 +689,50 @@ class SHTRestInterface:
         """Retrieve multiple series from the endpoint"""
         out = []
         for series_name in series_names:
-            q = {
-                "start": str(start),
-                "end": str(end),
-                "trajectory": trajectory,
-                "series": series_name,
-            }
-
-            body = json.dumps(q)
-            got = get_series.asyncio(client=self.client, body=body)
+            body = series_query(series_name, trajectory, start, end)
+            got = rest_api.get_series.asyncio(client=self.client, body=body)
             out.append(got)
 
         return asyncio.gather(*out)
 
-    @cache
+    def series_bulk(
+        self,
+        series_names,
+        trajectory=DEFAULT_TRAJECTORY,
+        start=DEFAULT_START,
+        end=DEFAULT_END,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        *,
+        utc=False,
+    ) -> pd.DataFrame:
+        """Retrieve multiple series as a single DataFrame indexed by epoch
+
+        Up to ``max_concurrency`` requests are run in parallel and each
+        response is decoded directly into columns (see series). The index is
+        naive UTC, tz-aware (UTC) with ``utc``.
+        """
+
+        def fetch(series_name):
+            return self.series(series_name, trajectory, start, end, utc=utc)
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+            series = list(pool.map(fetch, series_names))
+
+        return align_series(series)
+
+    @cached
+    @persistent_cache
     @pandas_convertable
     def event_types(self, trajectory=DEFAULT_TRAJECTORY):
         """Retrieve all the events applicable for a trajectory"""
-        return get_trajectory_event_by_mnemonic.sync(
-            client=self.client,
-            mnemonic=trajectory,
+        return self._fetch(
+            rest_api.get_trajectory_event_by_mnemonic, mnemonic=trajectory
         )
 
-    @cache
+    @cached
+    @persistent_cache
     def segment_definition(self, mnemonic):
-        return get_segment_definition_by_mnemonic.sync(
+        return rest_api.get_segment_definition_by_mnemonic.sync(
             client=self.client,
             mnemonic=mnemonic,
         )
@@ -314,7 +741,8 @@ class SHTRestInterface:
     def segment_definitions(self, mnemonics: list[str]):
         return [self.segment_definition(m) for m in mnemonics]
 
-    @cache
+    @cached
+    @persistent_cache
     @pandas_convertable(time_fields=["start", "end"])
     def events(
         self,
@@ -322,22 +750,25 @@ class SHTRestInterface:
         trajectory: str = DEFAULT_TRAJECTORY,
         start=DEFAULT_START,
         end=DEFAULT_END,
+        window=None,
     ):
-        """Retrieve events of a given type from the endpoint"""
-        if isinstance(mnemonics, str):
-            mnemonics = [mnemonics]
+        """Retrieve events of a given type from the endpoint
 
+        If ``window`` is given (see time_windows) the range is split and the
+        windows are retrieved in parallel, then merged back in order.
+        """
+        mnemonics = mnemonic_list(mnemonics)
         if len(mnemonics) == 0:
-            types = self.event_types(trajectory=trajectory, as_pandas=False)
-            mnemonics = [m.mnemonic for m in types]
-            log.info(f"Retrieving all known events {mnemonics}")
-
-        q = {
-            "start": str(start),
-            "end": str(end),
-            "trajectory": trajectory,
-            "mnemonics": mnemonics,
-        }
-
-        body = json.dumps(q)
-        return get_events.sync(client=self.client, body=body)
+            mnemonics = known_mnemonics(
+                self.event_types(trajectory=trajectory, as_pandas=False)
+            )
+
+        def fetch(start, end):
+            body = events_query(mnemonics, trajectory, start, end)
+            return self._fetch(rest_api.get_events, body=body)
+
+        if window is None:
+            return fetch(start, end)
+
+        windows = self.time_windows(window, trajectory, start, end)
+        return merge_events(self._map_windows(fetch, windows))
@@ -9,9 +9,16 @@ from loguru import logger as log
 
 log.disable("juice_core")
 
-from importlib_metadata import version
+from .AsyncSHTRestInterface import AsyncSHTRestInterface
+from .SHTRestInterface import SHTRestInterface, expand_column
 
-__version__ = version("juice_core_uplink_api_client")
 
+def __getattr__(name):
+    # reading the package metadata is slow, only do it when asked for, once
+    if name == "__version__":
+        from importlib_metadata import version
 
-from .SHTRestInterface import SHTRestInterface, expand_column
+        globals()["__version__"] = version("juice_core_uplink_api_client")
+        return globals()["__version__"]
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
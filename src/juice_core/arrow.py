@@ -0,0 +1,154 @@
+"""
+Build Arrow tables (and Polars frames) straight from the decoded JSON records.
+
+Pipelines storing and joining the results as Arrow would otherwise go through
+a DataFrame, one more copy of every column with the nested fields left as
+Python objects. The functions below build the table from the records: the
+time columns become ``timestamp[ns]`` columns, the lists of resources and
+other nested objects Arrow list and struct columns. Polars frames are made
+from that table, sharing the buffers of its numeric and time columns.
+
+pyarrow and polars are optional: they are only imported when such an output
+is requested.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from itertools import chain
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+from loguru import logger as log
+
+from .columnar import description_columns, series_columns, times_to_datetime64
+from .imports import lazy_module
+
+if TYPE_CHECKING:
+    import polars as pl
+    import pyarrow as pa
+
+np = lazy_module("numpy")
+
+OUTPUTS = ("pandas", "arrow", "polars", "raw")
+
+
+def require(module: str):
+    """Import an optional dependency, saying how to install it if missing."""
+    try:
+        return import_module(module)
+    except ImportError as error:
+        msg = f"{module} is needed for this output: pip install {module}"
+        raise ImportError(msg, name=module) from error
+
+
+def check_output(output: str) -> str:
+    """Validate an ``output`` and import what it needs, before any request."""
+    if output not in OUTPUTS:
+        msg = f"output must be one of {OUTPUTS}, not {output!r}"
+        raise ValueError(msg)
+    if output in ("arrow", "polars"):
+        require("pyarrow")
+    if output == "polars":
+        require("polars")
+    return output
+
+
+def _column(records: list[dict], name: str) -> list:
+    try:
+        return list(map(itemgetter(name), records))
+    except KeyError:
+        return [r.get(name) for r in records]
+
+
+def _times(values: list, name: str, *, utc=False):
+    pa = require("pyarrow")
+    times, unparsed = times_to_datetime64(values)
+    if unparsed.any():
+        log.warning(
+            f"Could not convert to datetime {name} on {int(unparsed.sum())} rows"
+            f" (first {int(np.flatnonzero(unparsed)[0])})"
+        )
+    kind = pa.timestamp("ns", tz="UTC" if utc else None)
+    return pa.array(times, type=kind, mask=np.isnat(times))
+
+
+def _values(values: list, name: str):
+    pa = require("pyarrow")
+    try:
+        return pa.array(values, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        log.warning(f"Column {name} mixes types, kept as strings")
+        return pa.array([None if v is None else str(v) for v in values], pa.string())
+
+
+def records_to_arrow(
+    records: list, time_fields=(), *, utc=False, expand_fields=()
+) -> pa.Table:
+    """Build an Arrow table from the decoded JSON records (or models) of a response.
+
+    Parameters
+    ----------
+    records (list[dict]):
+        the records, models are converted with their ``to_dict``
+    time_fields (list[str]):
+        ISO8601 UTC time columns, parsed as ``timestamp[ns]``; unparseable
+        values become nulls
+    utc (bool):
+        make the time columns tz-aware (UTC) instead of naive UTC
+    expand_fields (list[str]):
+        ``key = value; ...`` columns split into one string column per key
+        (see juice_core.columnar.description_columns)
+
+    Returns
+    -------
+    pa.Table:
+        one column per key of the records, in their order; nested lists and
+        objects become list and struct columns
+
+    """
+    pa = require("pyarrow")
+    records = [r.to_dict() if hasattr(r, "to_dict") else r for r in records]
+
+    columns = {}
+    for name in dict.fromkeys(chain.from_iterable(records)):
+        values = _column(records, name)
+        if name in expand_fields:
+            for key, column in description_columns(values).items():
+                columns[key] = pa.array(column, from_pandas=True)
+        elif name in time_fields:
+            columns[name] = _times(values, name, utc=utc)
+        else:
+            columns[name] = _values(values, name)
+
+    return pa.table(columns)
+
+
+def series_to_arrow(records: list[dict], name=None, *, utc=False) -> pa.Table:
+    """Build an ``epoch``/value table from the raw JSON records of the series endpoint.
+
+    The value column is named after the series, "value" if it has no name.
+    """
+    pa = require("pyarrow")
+    epochs, values = series_columns(records)
+    kind = pa.timestamp("ns", tz="UTC" if utc else None)
+    return pa.table(
+        {
+            "epoch": pa.array(epochs, type=kind, mask=np.isnat(epochs)),
+            name or "value": pa.array(values, from_pandas=True),
+        }
+    )
+
+
+def to_polars(table: pa.Table) -> pl.DataFrame:
+    """Convert an Arrow table to a Polars frame.
+
+    The numeric and time columns share the buffers of the table; Polars copies
+    the string and nested columns into its own layout.
+    """
+    return require("polars").from_arrow(table, rechunk=False)
+
+
+def as_output(table: pa.Table, output: str):
+    """The Arrow table for "arrow", wrapped by Polars for "polars"."""
+    return to_polars(table) if output == "polars" else table
@@ -0,0 +1,491 @@
+"""
+Caching layers for the results of the REST interfaces.
+"""
+
+import asyncio
+import hashlib
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+from inspect import iscoroutinefunction
+from pathlib import Path
+
+from attrs import define, field, frozen
+from loguru import logger as log
+
+from juice_core_uplink_api_client.decoding import decode_response
+
+DEFAULT_MAX_BYTES = 512 * 1024**2
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_PARSED_ENTRIES = 64
+DEFAULT_TTL = 7 * 24 * 3600.0
+
+# plans are edited on the server, trajectories products are not
+DEFAULT_METHOD_TTL = {
+    "plans": 600.0,
+    "plan": 3600.0,
+    "plan_segments": 3600.0,
+    "pcw": 3600.0,
+    "pcw_by_mnemonic": 3600.0,
+}
+
+
+def default_cache_path() -> Path:
+    """Location of the persistent cache, honouring XDG_CACHE_HOME."""
+    root = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    return Path(root) / "juice_core" / "responses.sqlite"
+
+
+def make_key(base_url: str, method: str, args: tuple, kwargs: dict) -> str:
+    """Build a stable key for a call from its method name, arguments and base url."""
+    ident = repr((base_url, method, args, sorted(kwargs.items())))
+    return hashlib.sha256(ident.encode()).hexdigest()
+
+
+def freeze(value):
+    """Turn (nested) lists, sets and dicts into hashable equivalents."""
+    if isinstance(value, list | tuple):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, set | frozenset):
+        return frozenset(freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    return value
+
+
+def estimate_size(value) -> int:
+    """Rough size in bytes of a cached result."""
+    if hasattr(value, "memory_usage"):  # pandas objects
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    if isinstance(value, list | tuple):
+        return sys.getsizeof(value) + sum(sys.getsizeof(v) for v in value)
+    return sys.getsizeof(value)
+
+
+@frozen
+class CacheStats:
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+
+
+@define(eq=False)
+class MemoryCache:
+    """
+    Bounded in-memory cache of results, meant to be owned by one interface.
+
+    Entries are evicted in least recently used order when there are more than
+    ``max_entries`` of them or, if ``max_bytes`` is set, when their estimated
+    size exceeds it. Entries can also expire after a time to live (``ttl`` per
+    method, in seconds, falling back to ``default_ttl``).
+
+    The cache is thread safe: threads (or tasks) asking for a key that is being
+    computed wait for that computation instead of starting their own.
+    """
+
+    max_entries: int | None = DEFAULT_MAX_ENTRIES
+    max_bytes: int | None = None
+    default_ttl: float | None = None
+    ttl: dict[str, float | None] = field(factory=dict)
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _entries: OrderedDict = field(factory=OrderedDict, init=False, repr=False)
+    _bytes: int = field(default=0, init=False, repr=False)
+    _pending: dict = field(factory=dict, init=False, repr=False)
+    _pending_async: dict = field(factory=dict, init=False, repr=False)
+    _lock: threading.RLock = field(factory=threading.RLock, init=False, repr=False)
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+
+            expires, _, value = entry
+            if expires is not None and time.monotonic() >= expires:
+                self._remove(key)
+                return False, None
+
+            self._entries.move_to_end(key)
+            return True, value
+
+    def _remove(self, key) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def _store(self, key, value) -> None:
+        method = key[0]
+        ttl = self.ttl.get(method, self.default_ttl)
+        expires = None if ttl is None else time.monotonic() + ttl
+        size = estimate_size(value) if self.max_bytes is not None else 0
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (expires, size, value)
+            self._bytes += size
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            key = next(iter(self._entries))
+            log.debug(f"Evicting {key[0]} from the memory cache")
+            self._remove(key)
+
+    def _count(self, *, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for ``key``, computing it at most once."""
+        found, value = self._lookup(key)
+        if found:
+            self._count(hit=True)
+            return value
+
+        with self._lock:
+            key_lock = self._pending.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # somebody else may have computed it while we were waiting
+            found, value = self._lookup(key)
+            self._count(hit=found)
+            if found:
+                return value
+
+            try:
+                value = compute()
+                self._store(key, value)
+            finally:
+                with self._lock:
+                    self._pending.pop(key, None)
+
+        return value
+
+    async def get_or_compute_async(self, key, compute):
+        """Coroutine version of get_or_compute, ``compute`` returns an awaitable.
+
+        Tasks asking for a key that is being computed await the same
+        computation.
+        """
+        found, value = self._lookup(key)
+        if found:
+            self._count(hit=True)
+            return value
+
+        future = self._pending_async.get(key)
+        self._count(hit=future is not None)
+        if future is None:
+
+            async def compute_and_store():
+                value = await compute()
+                self._store(key, value)
+                return value
+
+            future = asyncio.ensure_future(compute_and_store())
+            self._pending_async[key] = future
+            future.add_done_callback(lambda _: self._pending_async.pop(key, None))
+
+        # a cancelled caller must not cancel the computation shared with others
+        return await asyncio.shield(future)
+
+    def invalidate(self, method: str | None = None) -> None:
+        """Drop all the entries of a method, or everything if not given."""
+        with self._lock:
+            for key in list(self._entries):
+                if method is None or key[0] == method:
+                    self._remove(key)
+
+    def clear(self) -> None:
+        """Drop all the entries and reset the statistics."""
+        with self._lock:
+            self.invalidate()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def cached(func):
+    """Cache the results of a REST interface method in its ``memory_cache``.
+
+    Unlike functools.cache, the cache belongs to the instance (it does not
+    keep the instance alive) and list arguments are accepted.
+    """
+    method = func.__name__
+
+    def make_memory_key(args, kwargs):
+        return (method, freeze(args), freeze(kwargs))
+
+    if iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            return await self.memory_cache.get_or_compute_async(
+                make_memory_key(args, kwargs),
+                lambda: func(self, *args, **kwargs),
+            )
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        return self.memory_cache.get_or_compute(
+            make_memory_key(args, kwargs),
+            lambda: func(self, *args, **kwargs),
+        )
+
+    return wrapper
+
+
+@define(eq=False)
+class ParsedMemo:
+    """
+    Parsed results of the responses carrying an ETag or Last-Modified header.
+
+    When the client revalidates a request (see the ``conditional_requests``
+    option of Client) and the server answers 304 Not Modified, the result
+    parsed from the previous response (models, or JSON records) is returned
+    instead of decoding the body again.
+    """
+
+    max_entries: int = DEFAULT_PARSED_ENTRIES
+    _entries: OrderedDict = field(factory=OrderedDict, init=False, repr=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False, repr=False)
+
+    def parse(self, endpoint, client, request: dict, response, decode=None):
+        """Parse ``response``, the answer to ``request`` to a generated endpoint
+
+        ``decode(client, response)`` replaces the parsing into models of the
+        endpoint, e.g. to get the JSON records; its results are kept apart.
+        """
+        key = (request["url"], freeze(request.get("params", {})), decode)
+        validators = (
+            response.headers.get("etag"),
+            response.headers.get("last-modified"),
+        )
+
+        if response.extensions.get("revalidated"):
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] == validators:
+                    log.debug(f"Reusing parsed result for {request['url']}")
+                    self._entries.move_to_end(key)
+                    return entry[1]
+
+        if decode is None:
+            parsed = decode_response(endpoint, client=client, response=response)
+        else:
+            parsed = decode(client, response)
+
+        if any(validators):
+            with self._lock:
+                self._entries[key] = (validators, parsed)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        return parsed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+@define(eq=False)
+class DiskCache:
+    """
+    Persistent cache of results stored in a SQLite database.
+
+    Results are pickled and zlib-compressed. Entries expire after a time to
+    live that can be configured per method (``ttl``, in seconds, falling back
+    to ``default_ttl``); when the stored size exceeds ``max_bytes`` the least
+    recently used entries are evicted.
+    """
+
+    path: Path = field(factory=default_cache_path, converter=Path)
+    max_bytes: int = DEFAULT_MAX_BYTES
+    default_ttl: float | None = DEFAULT_TTL
+    ttl: dict[str, float | None] = field(factory=lambda: dict(DEFAULT_METHOD_TTL))
+    _lock: threading.Lock = field(factory=threading.Lock, init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, method TEXT, created REAL, "
+                "accessed REAL, size INTEGER, value BLOB)",
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)",
+            )
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=30)
+        try:
+            with db:  # commits on success
+                yield db
+        finally:
+            db.close()
+
+    def method_ttl(self, method: str) -> float | None:
+        return self.ttl.get(method, self.default_ttl)
+
+    def get(self, key: str, method: str):
+        """Return ``(True, value)`` for a valid entry, ``(False, None)`` otherwise."""
+        now = time.time()
+        with self._lock, self._connect() as db:
+            row = db.execute(
+                "SELECT created, value FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                return False, None
+
+            created, blob = row
+            ttl = self.method_ttl(method)
+            if ttl is not None and now - created > ttl:
+                db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return False, None
+
+            db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+
+        return True, pickle.loads(zlib.decompress(blob))  # noqa: S301
+
+    def set(self, key: str, method: str, value) -> None:
+        if value is None:
+            return
+
+        blob = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        if len(blob) > self.max_bytes:
+            log.debug(f"Not caching {method}: result larger than the cache")
+            return
+
+        now = time.time()
+        with self._lock, self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (key, method, now, now, len(blob), blob),
+            )
+            self._evict(db)
+
+    def _evict(self, db) -> None:
+        (total,) = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+
+        evicted = []
+        for key, size in db.execute(
+            "SELECT key, size FROM entries ORDER BY accessed ASC",
+        ).fetchall():
+            if excess <= 0:
+                break
+            evicted.append((key,))
+            excess -= size
+
+        log.debug(f"Evicting {len(evicted)} entries from the disk cache")
+        db.executemany("DELETE FROM entries WHERE key = ?", evicted)
+
+    def invalidate(self, method: str | None = None) -> None:
+        """Drop all the entries of a method, or everything if not given."""
+        with self._lock, self._connect() as db:
+            if method is None:
+                db.execute("DELETE FROM entries")
+            else:
+                db.execute("DELETE FROM entries WHERE method = ?", (method,))
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the stored (compressed) results."""
+        with self._connect() as db:
+            (total,) = db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries",
+            ).fetchone()
+        return total
+
+    def __len__(self) -> int:
+        with self._connect() as db:
+            (n,) = db.execute("SELECT COUNT(*) FROM entries").fetchone()
+        return n
+
+
+def persistent_cache(func):
+    """Store the results of a REST interface method in its ``disk_cache``, if set.
+
+    Keys are built from the base url of the client, the method name and the
+    call arguments (``as_pandas`` included), and the dtype policy of the
+    interface if it has one.
+    """
+    method = func.__name__
+
+    def lookup(self, args, kwargs):
+        dtypes = getattr(self, "dtypes", None)
+        if dtypes is not None:  # tables typed differently are different results
+            kwargs = {**kwargs, "dtypes": dtypes}
+        key = make_key(self.client._base_url, method, args, kwargs)  # noqa: SLF001
+        found, value = self.disk_cache.get(key, method)
+        if found:
+            log.debug(f"Disk cache hit for {method}")
+        return key, found, value
+
+    if iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            if self.disk_cache is None:
+                return await func(self, *args, **kwargs)
+
+            key, found, value = lookup(self, args, kwargs)
+            if not found:
+                value = await func(self, *args, **kwargs)
+                self.disk_cache.set(key, method, value)
+            return value
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self.disk_cache is None:
+            return func(self, *args, **kwargs)
+
+        key, found, value = lookup(self, args, kwargs)
+        if not found:
+            value = func(self, *args, **kwargs)
+            self.disk_cache.set(key, method, value)
+        return value
+
+    return wrapper
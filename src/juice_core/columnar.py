@@ -0,0 +1,215 @@
+"""
+Decode the responses of the series endpoint straight into NumPy columns.
+
+The generated client builds one ``SeriesData`` object per sample, which the
+interfaces then turn back into dictionaries to build a DataFrame. For long
+series that is millions of short lived objects: the functions below go from
+the decoded JSON records to a ``datetime64[ns]`` epoch array and a
+``float64`` value array instead.
+
+The ``key = value; ...`` descriptions of the events are likewise split into
+one array per key for the whole column at once (see description_columns).
+"""
+
+from __future__ import annotations
+
+from itertools import compress, repeat
+from operator import itemgetter
+
+from .imports import lazy_module
+
+np = lazy_module("numpy")
+pd = lazy_module("pandas")
+
+_epoch = itemgetter("epoch")
+_value = itemgetter("value")
+
+
+def epochs_to_datetime64(epochs: list) -> np.ndarray:
+    """Convert ISO8601 strings to naive UTC ``datetime64[ns]``.
+
+    The "...Z" strings returned by the API are parsed by NumPy; anything else
+    (other offsets, missing epochs) falls back to pandas.
+    """
+    try:
+        naive = [e[:-1] for e in epochs if e[-1] == "Z"]
+        if len(naive) == len(epochs):
+            return np.array(naive, dtype="datetime64[ns]")
+    except (TypeError, IndexError, ValueError):
+        pass
+
+    times = pd.to_datetime(epochs, format="ISO8601", utc=True, errors="coerce")
+    return times.tz_localize(None).to_numpy(dtype="datetime64[ns]")
+
+
+def times_to_datetime64(values: list) -> tuple[np.ndarray, np.ndarray]:
+    """Convert ISO8601 times to naive UTC ``datetime64[ns]``, finding the invalid ones.
+
+    Returns the times, and a mask of the values that could not be parsed:
+    NaT in the times while neither None nor NaN.
+    """
+    times = epochs_to_datetime64(values)
+    unparsed = np.isnat(times)
+    if unparsed.any():
+        unparsed &= pd.notna(np.array(values, dtype=object))
+    return times, unparsed
+
+
+def values_to_float64(values: list) -> np.ndarray:
+    """Convert the sample values to ``float64``, missing ones becoming NaN."""
+    try:
+        return np.fromiter(values, dtype=np.float64, count=len(values))
+    except (TypeError, ValueError):
+        return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(
+            dtype=np.float64
+        )
+
+
+def series_columns(records: list[dict]) -> tuple[np.ndarray, np.ndarray]:
+    """Split the records of the series endpoint into epoch and value arrays."""
+    try:
+        epochs = list(map(_epoch, records))
+        values = list(map(_value, records))
+    except KeyError:
+        epochs = [r.get("epoch") for r in records]
+        values = [r.get("value") for r in records]
+
+    return epochs_to_datetime64(epochs), values_to_float64(values)
+
+
+def series_from_columns(
+    epochs: np.ndarray, values: np.ndarray, name=None, *, utc=False
+) -> pd.Series:
+    """Wrap epoch and value arrays into a timeseries, without copying them.
+
+    With ``utc`` the index is tz-aware (UTC) rather than naive UTC.
+    """
+    index = pd.DatetimeIndex(epochs, copy=False)
+    if utc:
+        index = index.tz_localize("UTC")
+    return pd.Series(data=values, index=index, name=name, copy=False)
+
+
+def series_from_records(records: list[dict], name=None, *, utc=False) -> pd.Series:
+    """Build a timeseries straight from the raw JSON records of the series endpoint.
+
+    Epochs and values are collected as columns, skipping the creation of the
+    intermediate SeriesData objects and DataFrame.
+    """
+    return series_from_columns(*series_columns(records), name=name, utc=utc)
+
+
+def _tolerant_items(text: str):
+    """The ``key = value`` items of a description, skipping the malformed ones."""
+    for item in text.split(";"):
+        key, sep, value = item.partition("=")
+        if sep:
+            yield key, value.strip()
+
+
+def _tokens(joined: str) -> np.ndarray:
+    """The stripped keys and values of joined descriptions, as an object array.
+
+    The spaces around the separators are removed from the whole text first,
+    which is much cheaper than stripping the tokens one by one; only with other
+    whitespace characters are they stripped individually.
+    """
+    text = joined.strip().replace("=", ";")
+    while " ;" in text:
+        text = text.replace(" ;", ";")
+    while "; " in text:
+        text = text.replace("; ", ";")
+    tokens = text.split(";") if text else []
+    if any(space in text for space in "\t\n\r\x0b\x0c"):
+        tokens = list(map(str.strip, tokens))
+    # an object array: building the columns is then a matter of strided views
+    return np.array(tokens, dtype=object)
+
+
+def _same_keys_columns(tokens: np.ndarray, size: int) -> dict[str, np.ndarray] | None:
+    """The columns of descriptions all made of the same ``size`` keys, in order."""
+    columns = {}
+    step = 2 * size
+    for i in range(size):
+        keys = tokens[2 * i :: step]
+        if not (keys == keys[0]).all():
+            return None
+        columns[keys[0]] = tokens[2 * i + 1 :: step]
+    return columns
+
+
+def _scattered_columns(
+    texts: list[str], regular: np.ndarray, counts: np.ndarray, tokens: np.ndarray
+) -> dict[str, np.ndarray]:
+    """The columns of descriptions with different keys, NaN where a row lacks one."""
+    row = np.repeat(np.flatnonzero(regular), counts)
+    keys = tokens[0::2]
+    values = tokens[1::2]
+
+    extra = [
+        (i, k.strip(), v)
+        for i in np.flatnonzero(~regular)
+        for k, v in _tolerant_items(texts[i])
+    ]
+    if extra:
+        extra_rows, extra_keys, extra_values = zip(*extra, strict=True)
+        row = np.concatenate([row, np.asarray(extra_rows, dtype=np.intp)])
+        keys = np.concatenate([keys, np.array(extra_keys, dtype=object)])
+        values = np.concatenate([values, np.array(extra_values, dtype=object)])
+        # back to the order of the rows, for the order of the keys
+        order = np.argsort(row, kind="stable")
+        row, keys, values = row[order], keys[order], values[order]
+
+    # factorize keeps the order of appearance
+    codes, names = pd.factorize(keys)
+
+    # the items grouped by key, still in row order within a key
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(names) + 1))
+    row, values = row[order], values[order]
+
+    columns = {}
+    for name, start, stop in zip(names, bounds[:-1], bounds[1:], strict=True):
+        column = np.full(len(texts), np.nan, dtype=object)
+        # on repeated rows, the last assignment is the one kept
+        column[row[start:stop]] = values[start:stop]
+        columns[name] = column
+    return columns
+
+
+def description_columns(texts: list, *, categorical=False) -> dict:
+    """One column per key of ``key = value; ...`` descriptions, in order of appearance.
+
+    The descriptions whose items all have exactly one "=" are split all
+    together, with a single ``str.split`` of the joined column; when they all
+    have the same keys, the columns are slices of the result. The others
+    (items without "=" or with several, trailing ";") are split item by item
+    on their first "=", skipping the items without one. Missing descriptions
+    have no items.
+
+    Rows without a key get NaN, and a key repeated in a description keeps its
+    last value. With ``categorical`` the columns are pandas Categoricals.
+    """
+    if not texts:
+        return {}
+    if not set(map(type, texts)) <= {str}:
+        texts = [text if isinstance(text, str) else "" for text in texts]
+
+    # a row is regular when each of its items has exactly one "="
+    items = np.fromiter(map(str.count, texts, repeat(";")), np.intp, len(texts)) + 1
+    split = ";".join(texts).split(";")
+    single = np.fromiter(map(str.count, split, repeat("=")), np.intp, len(split)) == 1
+    irregular = np.repeat(np.arange(len(texts)), items)[~single]
+    regular = np.bincount(irregular, minlength=len(texts)) == 0
+    counts = items[regular]
+    tokens = _tokens(";".join(compress(texts, regular)))
+
+    columns = None
+    if regular.all() and len(counts) and (counts == counts[0]).all():
+        columns = _same_keys_columns(tokens, int(counts[0]))
+    if columns is None:
+        columns = _scattered_columns(texts, regular, counts, tokens)
+
+    if categorical:
+        return {name: pd.Categorical(column) for name, column in columns.items()}
+    return columns
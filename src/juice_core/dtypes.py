@@ -0,0 +1,140 @@
+"""
+Memory-lean column types for the tables returned by the interfaces.
+
+The tables built from the API hold their strings (trajectory, segment
+definition, timeline, event name, ...) as Python objects, repeated on every
+row. A DtypePolicy turns the repetitive ones into categoricals, the others
+optionally into pandas string columns, the flags into booleans and the floats
+into float32 when exact; memory_report shows where the memory goes and what a
+policy saves.
+"""
+
+from __future__ import annotations
+
+from importlib.util import find_spec
+
+from attrs import field, frozen
+from attrs.validators import in_
+
+from .imports import lazy_module
+
+np = lazy_module("numpy")
+pd = lazy_module("pandas")
+
+STRING_DTYPES = {
+    "object": None,
+    "python": "string[python]",
+    "pyarrow": "string[pyarrow]",
+}
+
+
+@frozen
+class DtypePolicy:
+    """
+    How the columns of the tables are typed.
+
+    ``categories``: string columns with at most ``max_unique_ratio`` distinct
+    values per row become categoricals.
+
+    ``strings``: the other string columns stay Python objects ("object"), or
+    become "python" or "pyarrow" (needs pyarrow) pandas string columns; "auto"
+    uses pyarrow when installed.
+
+    ``downcast``: object columns of flags without missing values become
+    ``bool``, and float64 columns ``float32`` when no value changes.
+
+    ``downcast_integers``: integer columns become the smallest integer type
+    holding their values. Off by default, as arithmetic or concatenation on
+    the narrowed columns (ids, counts) can then overflow silently.
+
+    Columns in ``exclude`` are left as they are.
+    """
+
+    categories: bool = True
+    max_unique_ratio: float = 0.5
+    strings: str = field(default="object", validator=in_((*STRING_DTYPES, "auto")))
+    downcast: bool = True
+    downcast_integers: bool = False
+    exclude: tuple[str, ...] = ()
+
+    def string_dtype(self) -> str | None:
+        """The dtype of the string columns that are not categorised, if any."""
+        if self.strings == "auto":
+            return STRING_DTYPES["pyarrow" if find_spec("pyarrow") else "object"]
+        return STRING_DTYPES[self.strings]
+
+    def convert(self, column: pd.Series) -> pd.Series:
+        """The column with the type given by the policy."""
+        if column.dtype == object:
+            kind = pd.api.types.infer_dtype(column, skipna=True)
+            if kind == "string":
+                unique = column.nunique(dropna=True)
+                if self.categories and unique <= self.max_unique_ratio * len(column):
+                    return column.astype("category")
+                dtype = self.string_dtype()
+                return column if dtype is None else column.astype(dtype)
+            if kind == "boolean" and self.downcast and column.notna().all():
+                return column.astype(bool)
+            return column
+
+        if self.downcast and column.dtype == np.float64:
+            narrow = column.astype(np.float32)
+            same = np.array_equal(narrow.to_numpy(np.float64), column, equal_nan=True)
+            return narrow if same else column
+        if self.downcast_integers and column.dtype.kind in "iu":
+            return pd.to_numeric(column, downcast="integer")
+        return column
+
+    def apply(self, table: pd.DataFrame) -> pd.DataFrame:
+        """Convert the columns of ``table``, in place, and return it."""
+        for name, column in table.items():
+            if name in self.exclude:
+                continue
+            converted = self.convert(column)
+            if converted is not column:
+                table[name] = converted
+        return table
+
+
+def memory_report(tables, policy: DtypePolicy | None = None) -> pd.DataFrame:
+    """The memory used by the columns of tables, and with a dtype policy.
+
+    Parameters
+    ----------
+    tables (pd.DataFrame | dict[str, pd.DataFrame]):
+        a table, or tables by name (e.g. several plans and events)
+    policy (DtypePolicy | None):
+        the policy to compare with, DtypePolicy() by default
+
+    Returns
+    -------
+    pd.DataFrame:
+        indexed by table and column, with the ``dtype`` and ``bytes`` (deep
+        memory usage) of each column and its ``lean_dtype`` and ``lean_bytes``
+        with the policy, the largest columns first
+
+    """
+    if isinstance(tables, pd.DataFrame):
+        tables = {"table": tables}
+    policy = DtypePolicy() if policy is None else policy
+
+    rows = []
+    for table_name, table in tables.items():
+        lean = policy.apply(table.copy())
+        usage = table.memory_usage(deep=True, index=False)
+        lean_usage = lean.memory_usage(deep=True, index=False)
+        rows.extend(
+            {
+                "table": table_name,
+                "column": name,
+                "dtype": str(table[name].dtype),
+                "bytes": int(usage[name]),
+                "lean_dtype": str(lean[name].dtype),
+                "lean_bytes": int(lean_usage[name]),
+            }
+            for name in table.columns
+        )
+
+    columns = ["table", "column", "dtype", "bytes", "lean_dtype", "lean_bytes"]
+    report = pd.DataFrame(rows, columns=columns)
+    return report.sort_values("bytes", ascending=False).set_index(["table", "column"])
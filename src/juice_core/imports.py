@@ -0,0 +1,44 @@
+"""
+Deferred imports of the heavy dependencies (pandas, numpy).
+
+Importing juice_core should stay cheap for the tools that never build a
+DataFrame: these modules are imported the first time one of their attributes
+is used.
+"""
+
+import threading
+from importlib import import_module
+
+
+class LazyModule:
+    """Stand-in for a module, imported on first attribute access.
+
+    The import is done under a lock, so threads reaching the module at the
+    same time all wait for it to be fully imported.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._module is None:
+                self._module = import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            module = self._load()
+        return getattr(module, attr)
+
+    def __repr__(self):
+        state = "imported" if self._module is not None else "not imported"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_module(name) -> LazyModule:
+    """A module imported the first time it is used."""
+    return LazyModule(name)
@@ -0,0 +1,411 @@
+"""
+Interval queries over the tables with start and end columns.
+
+Plan segments, engineering segments and events all come as DataFrames of
+intervals. A Timeline indexes such a table once and answers the usual
+questions with binary searches instead of one boolean mask per question:
+which rows contain a time or overlap a range, which row is nearest to a time,
+and which rows of two tables meet (e.g. the segments overlapping each
+perijove, or the engineering segment containing each observation).
+
+Intervals are closed, [start, end]: a time equal to the end of a segment and
+to the start of the next one is in both. A row without an end is a point
+event; a row without a start is left out.
+
+An IntervalSet is the time covered by such a table, for interval algebra: the
+free time within some engineering segments is for instance
+``IntervalSet.from_table(engineering) - IntervalSet.from_table(segments)``.
+"""
+
+from __future__ import annotations
+
+from attrs import define, field
+
+from .columnar import times_to_datetime64
+from .imports import lazy_module
+
+np = lazy_module("numpy")
+pd = lazy_module("pandas")
+
+
+def _nanoseconds(values) -> np.ndarray:
+    """Times as int64 nanoseconds of naive UTC, missing ones as the NaT value."""
+    values = pd.Series(values)
+    if not pd.api.types.is_datetime64_any_dtype(values):
+        values = pd.Series(times_to_datetime64(values.tolist())[0])
+    elif values.dt.tz is not None:
+        values = values.dt.tz_convert("UTC").dt.tz_localize(None)
+    return values.to_numpy("datetime64[ns]").view(np.int64)
+
+
+def _spans(lo: np.ndarray, hi: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Expand the ranges [lo, hi) into (range number, position) pairs."""
+    counts = np.maximum(hi - lo, 0)
+    which = np.repeat(np.arange(len(lo)), counts)
+    firsts = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+    return which, firsts + np.arange(len(which))
+
+
+@define(eq=False)
+class Timeline:
+    """
+    Sorted interval index over the rows of a table.
+
+    The rows are sorted by start, and also grouped by the order of magnitude
+    of their duration: within a group an interval is at most twice as long as
+    another, so the ones overlapping a range are found from a binary search on
+    their start. Queries on ``m`` intervals thus take O(m log n) plus the size
+    of the result, whatever mix of long segments and point events the table
+    holds.
+    """
+
+    table: pd.DataFrame
+    start: str = "start"
+    end: str = "end"
+    _order: np.ndarray = field(init=False, repr=False)
+    _starts: np.ndarray = field(init=False, repr=False)
+    _ends: np.ndarray = field(init=False, repr=False)
+    _latest: np.ndarray = field(init=False, repr=False)
+    _groups: list = field(init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        nat = np.iinfo(np.int64).min
+        starts = _nanoseconds(self.table[self.start])
+        if self.end in self.table:
+            ends = _nanoseconds(self.table[self.end])
+            ends = np.where(ends == nat, starts, np.maximum(ends, starts))
+        else:
+            ends = starts
+
+        valid = np.flatnonzero(starts != nat)
+        self._order = valid[np.argsort(starts[valid], kind="stable")]
+        self._starts = starts[self._order]
+        self._ends = ends[self._order]
+
+        # the position of the latest end among the rows starting so far
+        reach = np.maximum.accumulate(self._ends) if len(self) else self._ends
+        latest = np.arange(len(self))
+        latest[self._ends < reach] = 0
+        self._latest = np.maximum.accumulate(latest) if len(self) else latest
+
+        magnitude = np.frexp((self._ends - self._starts).astype(np.float64))[1]
+        self._groups = []
+        for exponent in np.unique(magnitude):
+            positions = np.flatnonzero(magnitude == exponent)
+            durations = self._ends[positions] - self._starts[positions]
+            self._groups.append((positions, self._starts[positions], durations.max()))
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _pairs(
+        self, starts: np.ndarray, ends: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """The (query, sorted row) pairs of the intervals overlapping each query."""
+        # binary searches for sorted values are much friendlier to the caches
+        by_start = np.argsort(starts, kind="stable")
+        sorted_starts, sorted_ends = starts[by_start], ends[by_start]
+
+        queries, rows = [np.empty(0, np.intp)], [np.empty(0, np.intp)]
+        for positions, group_starts, longest in self._groups:
+            lo = np.searchsorted(group_starts, sorted_starts - longest, "left")
+            hi = np.searchsorted(group_starts, sorted_ends, "right")
+            query, found = _spans(lo, hi)
+            query, found = by_start[query], positions[found]
+            keep = self._ends[found] >= starts[query]
+            queries.append(query[keep])
+            rows.append(found[keep])
+
+        query, row = np.concatenate(queries), np.concatenate(rows)
+        order = np.lexsort((row, query))
+        return query[order], row[order]
+
+    def _rows(self, rows: np.ndarray) -> pd.DataFrame:
+        return self.table.iloc[self._order[rows]]
+
+    def overlapping(self, start, end) -> pd.DataFrame:
+        """The rows overlapping [start, end], by start."""
+        bounds = _nanoseconds([start, end])
+        if (bounds == np.iinfo(np.int64).min).any():
+            msg = f"Not a time range: {start!r}, {end!r}"
+            raise ValueError(msg)
+        _, rows = self._pairs(bounds[:1], bounds[1:])
+        return self._rows(rows)
+
+    def at(self, time) -> pd.DataFrame:
+        """The rows containing ``time``, by start."""
+        return self.overlapping(time, time)
+
+    def containing(self, times) -> pd.DataFrame:
+        """The rows containing each of ``times``.
+
+        Returns
+        -------
+        pd.DataFrame:
+            one row per (time, containing row) pair, ordered by time as given
+            then by start, with the time in a ``time`` column. Times without
+            any containing row, or missing, do not appear.
+
+        """
+        times = _nanoseconds(times)
+        valid = np.flatnonzero(times != np.iinfo(np.int64).min)
+        query, rows = self._pairs(times[valid], times[valid])
+        table = self._rows(rows).copy()
+        table.insert(0, "time", times[valid][query].view("datetime64[ns]"))
+        return table
+
+    def nearest(self, times) -> pd.DataFrame:
+        """The row nearest to each of ``times``, those containing it first.
+
+        Returns
+        -------
+        pd.DataFrame:
+            one row per time (missing times skipped), with the time in a
+            ``time`` column and its distance to the interval, zero when inside,
+            in a ``distance`` column. On a tie, the earlier interval wins.
+
+        """
+        if not len(self):
+            msg = "The timeline has no intervals"
+            raise ValueError(msg)
+
+        times = _nanoseconds(times)
+        times = times[times != np.iinfo(np.int64).min]
+        never = np.iinfo(np.int64).max
+
+        # among the rows starting before the time, the one ending last either
+        # contains it or is the nearest before it; the next row to start is
+        # the nearest after it
+        started = np.searchsorted(self._starts, times, "right")
+        before = self._latest[np.maximum(started - 1, 0)]
+        after = np.minimum(started, len(self) - 1)
+        to_before = np.where(
+            started > 0, np.maximum(times - self._ends[before], 0), never
+        )
+        to_after = np.where(started < len(self), self._starts[after] - times, never)
+
+        rows = np.where(to_before <= to_after, before, after)
+        table = self._rows(rows).copy()
+        table.insert(0, "time", times.view("datetime64[ns]"))
+        table["distance"] = np.minimum(to_before, to_after).view("timedelta64[ns]")
+        return table
+
+    def join(
+        self,
+        other: pd.DataFrame | Timeline,
+        *,
+        how="overlaps",
+        suffixes=("", "_other"),
+    ) -> pd.DataFrame:
+        """Join the rows of the timeline with the rows of ``other`` they meet.
+
+        Parameters
+        ----------
+        other (pd.DataFrame | Timeline):
+            a table with start and end columns (named as in this timeline), or
+            a timeline of one
+        how (str):
+            "overlaps" pairs the intervals sharing at least a time, "within"
+            only the ones of ``other`` lying within the ones of the timeline
+        suffixes (tuple[str, str]):
+            added to the names of the columns found in both tables
+
+        Returns
+        -------
+        pd.DataFrame:
+            one row per pair, ordered as the rows of ``other`` by start then
+            as the rows of the timeline, with a new RangeIndex
+
+        """
+        if how not in ("overlaps", "within"):
+            msg = f"how must be 'overlaps' or 'within', not {how!r}"
+            raise ValueError(msg)
+
+        if not isinstance(other, Timeline):
+            other = Timeline(other, start=self.start, end=self.end)
+
+        starts, ends = other._starts, other._ends
+        query, rows = self._pairs(starts, ends)
+        if how == "within":
+            keep = (self._starts[rows] <= starts[query]) & (
+                ends[query] <= self._ends[rows]
+            )
+            query, rows = query[keep], rows[keep]
+
+        left = self._rows(rows).reset_index(drop=True)
+        right = other.table.iloc[other._order[query]].reset_index(drop=True)
+        return left.join(right, lsuffix=suffixes[0], rsuffix=suffixes[1])
+
+
+def _bounds(rows, start: str, end: str) -> tuple[np.ndarray, np.ndarray]:
+    """The start and end nanoseconds of a table, or of a list of models or records."""
+    if isinstance(rows, pd.DataFrame):
+        return _nanoseconds(rows[start]), _nanoseconds(rows[end])
+
+    def column(name):
+        return _nanoseconds(
+            [r[name] if isinstance(r, dict) else getattr(r, name) for r in rows]
+        )
+
+    return column(start), column(end)
+
+
+def _sweep(a: IntervalSet, b: IntervalSet, keep) -> IntervalSet:
+    """The intervals where ``keep(in a, in b)`` holds, by sweeping their bounds."""
+    times = np.concatenate([a.starts, a.ends, b.starts, b.ends])
+    if not len(times):
+        return IntervalSet.empty()
+    steps = np.zeros((2, len(times)), dtype=np.int64)
+    steps[0, : len(a)] = 1
+    steps[0, len(a) : 2 * len(a)] = -1
+    steps[1, 2 * len(a) : 2 * len(a) + len(b)] = 1
+    steps[1, 2 * len(a) + len(b) :] = -1
+
+    order = np.argsort(times, kind="stable")
+    times = times[order]
+    counts = np.cumsum(steps[:, order], axis=1)
+
+    # the state after all the bounds at a time holds until the next time
+    last = np.append(times[1:] != times[:-1], True)
+    times = times[last]
+    inside = keep(counts[0, last] > 0, counts[1, last] > 0).astype(np.int8)
+    change = np.diff(inside, prepend=np.int8(0))
+    return IntervalSet(times[change == 1], times[change == -1])
+
+
+@define(eq=False)
+class IntervalSet:
+    """
+    A set of times, as sorted disjoint half-open intervals [start, end).
+
+    Build one with ``from_intervals`` or ``from_table``, which merge the
+    overlapping and touching intervals; the bounds are int64 nanoseconds of
+    naive UTC. Union (``|``), intersection (``&``) and difference (``-``) are
+    computed by sweeping the sorted bounds of both sets, in O(n log n).
+
+    Being half-open, intervals without duration (point events) hold no time
+    and are dropped.
+    """
+
+    starts: np.ndarray
+    ends: np.ndarray
+
+    @classmethod
+    def from_intervals(cls, starts, ends) -> IntervalSet:
+        """The union of the intervals [starts[i], ends[i]), missing bounds skipped."""
+        return cls.from_nanoseconds(_nanoseconds(starts), _nanoseconds(ends))
+
+    @classmethod
+    def from_nanoseconds(cls, starts: np.ndarray, ends: np.ndarray) -> IntervalSet:
+        """The union of the intervals given by int64 nanosecond bounds, NaT skipped."""
+        starts, ends = np.asarray(starts, np.int64), np.asarray(ends, np.int64)
+        valid = (starts != np.iinfo(np.int64).min) & (starts < ends)
+        return _sweep(cls(starts[valid], ends[valid]), cls.empty(), lambda a, _: a)
+
+    @classmethod
+    def from_table(cls, rows, start="start", end="end") -> IntervalSet:
+        """The time covered by the rows of a table (e.g. plan_segments,
+        events or engineering_segments), as a DataFrame or as models.
+        """
+        return cls.from_nanoseconds(*_bounds(rows, start, end))
+
+    @classmethod
+    def empty(cls) -> IntervalSet:
+        return cls(np.empty(0, np.int64), np.empty(0, np.int64))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return np.array_equal(self.starts, other.starts) and np.array_equal(
+            self.ends, other.ends
+        )
+
+    def __or__(self, other: IntervalSet) -> IntervalSet:
+        return self.union(other)
+
+    def __and__(self, other: IntervalSet) -> IntervalSet:
+        return self.intersection(other)
+
+    def __sub__(self, other: IntervalSet) -> IntervalSet:
+        return self.difference(other)
+
+    def union(self, other: IntervalSet) -> IntervalSet:
+        return _sweep(self, other, np.logical_or)
+
+    def intersection(self, other: IntervalSet) -> IntervalSet:
+        return _sweep(self, other, np.logical_and)
+
+    def difference(self, other: IntervalSet) -> IntervalSet:
+        return _sweep(self, other, lambda a, b: a & ~b)
+
+    def complement(self, start, end) -> IntervalSet:
+        """The times of [start, end) outside of the set."""
+        return IntervalSet.from_intervals([start], [end]) - self
+
+    def clip(self, start, end) -> IntervalSet:
+        """The times of the set within [start, end)."""
+        return self & IntervalSet.from_intervals([start], [end])
+
+    def gaps(self) -> IntervalSet:
+        """The holes between the intervals of the set."""
+        return IntervalSet(self.ends[:-1], self.starts[1:])
+
+    def contains(self, times) -> np.ndarray:
+        """Whether each of ``times`` is in the set."""
+        times = _nanoseconds(times)
+        if not len(self):
+            return np.zeros(len(times), dtype=bool)
+        i = np.searchsorted(self.starts, times, "right") - 1
+        return (i >= 0) & (times < self.ends[np.maximum(i, 0)])
+
+    @property
+    def durations(self) -> np.ndarray:
+        """The durations of the intervals, as ``timedelta64[ns]``."""
+        return (self.ends - self.starts).view("timedelta64[ns]")
+
+    @property
+    def total(self) -> pd.Timedelta:
+        """The time in the set."""
+        return pd.Timedelta(int((self.ends - self.starts).sum()))
+
+    def stats(self) -> pd.Series:
+        """Statistics of the durations of the intervals and of the gaps between them.
+
+        Returns
+        -------
+        pd.Series:
+            intervals, total, mean, median, shortest, longest, then gaps,
+            total_gap, longest_gap, and coverage: the fraction of the span from
+            the first start to the last end that is in the set
+
+        """
+        durations = pd.Series(self.durations)
+        gaps = pd.Series(self.gaps().durations)
+        span = self.ends[-1] - self.starts[0] if len(self) else 0
+        return pd.Series(
+            {
+                "intervals": len(self),
+                "total": durations.sum(),
+                "mean": durations.mean(),
+                "median": durations.median(),
+                "shortest": durations.min(),
+                "longest": durations.max(),
+                "gaps": len(gaps),
+                "total_gap": gaps.sum(),
+                "longest_gap": gaps.max(),
+                "coverage": durations.sum().value / span if span else float("nan"),
+            },
+            dtype=object,
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """The intervals as a table with start and end columns."""
+        return pd.DataFrame(
+            {
+                "start": self.starts.view("datetime64[ns]"),
+                "end": self.ends.view("datetime64[ns]"),
+            }
+        )
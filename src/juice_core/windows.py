@@ -0,0 +1,120 @@
+"""
+Helpers to split long time ranges into windows that can be queried in parallel.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from .imports import lazy_module
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+pd = lazy_module("pandas")
+
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def to_utc(t) -> pd.Timestamp:
+    """Convert anything pandas understands to a naive UTC timestamp."""
+    t = pd.Timestamp(t)
+    if t.tzinfo is not None:
+        t = t.tz_convert("UTC").tz_localize(None)
+    return t
+
+
+def format_time(t) -> str:
+    """Format a time as expected by the API (ISO8601 in UTC scale)."""
+    return to_utc(t).strftime(TIME_FORMAT)
+
+
+def time_windows(start, end, freq="MS") -> list[tuple[str, str]]:
+    """Split the range [start, end] into consecutive windows.
+
+    Parameters
+    ----------
+    start, end:
+        the range to split, anything accepted by pd.Timestamp
+    freq (str):
+        a pandas offset alias (e.g. "MS" for month starts, "7D" for weeks)
+        marking the boundaries of the windows
+
+    Returns
+    -------
+    list[tuple[str, str]]:
+        windows as (start, end) strings formatted for the API. Consecutive
+        windows share their boundary.
+
+    """
+    start = to_utc(start)
+    end = to_utc(end)
+
+    inner = [e for e in pd.date_range(start, end, freq=freq) if start < e < end]
+    edges = [start, *inner, end]
+
+    return [(format_time(a), format_time(b)) for a, b in zip(edges[:-1], edges[1:])]
+
+
+def phase_windows(phases, start, end) -> list[tuple[str, str]]:
+    """Split the range [start, end] at the boundaries of the phases of a trajectory.
+
+    The stretches before the first phase, between two phases and after the
+    last one are windows of their own, so the windows cover the whole range
+    whatever the phases. Phases without a start or end are ignored.
+
+    Returns
+    -------
+    list[tuple[str, str]]:
+        windows as (start, end) strings formatted for the API. Consecutive
+        windows share their boundary.
+
+    """
+    start = to_utc(start)
+    end = to_utc(end)
+
+    bounds = set()
+    for phase in phases:
+        if not phase.start or not phase.end:
+            continue
+        bounds.update((to_utc(phase.start), to_utc(phase.end)))
+
+    edges = [start, *sorted(b for b in bounds if start < b < end), end]
+
+    return [(format_time(a), format_time(b)) for a, b in zip(edges[:-1], edges[1:])]
+
+
+def record_key(*names) -> Callable:
+    """A key function reading ``names`` from API models and raw records alike."""
+
+    def key(item):
+        if isinstance(item, dict):
+            return tuple(item.get(n) for n in names)
+        return tuple(getattr(item, n) for n in names)
+
+    return key
+
+
+def merge_windows(results: Iterable[list | None], key: Callable) -> list:
+    """Concatenate the results of consecutive windows, in order.
+
+    Items also returned by the previous window (samples on the boundary the two
+    windows share, events overlapping both) are dropped, as many times as they
+    appear there. Identical items within a window, e.g. events of different
+    sources, are all kept.
+    """
+    merged = []
+    previous = Counter()
+    for result in results:
+        if not result:
+            continue
+        keys = [key(item) for item in result]
+        for k, item in zip(keys, result, strict=True):
+            if previous[k]:
+                previous[k] -= 1
+                continue
+            merged.append(item)
+        previous = Counter(keys)
+
+    return merged
@@ -1,8 +1,17 @@
 """A client library for accessing Juice Core Uplink API"""
 
 from .client import AuthenticatedClient, Client
+from .lazy import LazyList, lazy_lists
+from .ratelimit import RateLimit, RateLimiter
+from .retry import RetryBudget, RetryPolicy
 
 __all__ = (
     "AuthenticatedClient",
     "Client",
+    "LazyList",
+    "RateLimit",
+    "RateLimiter",
+    "RetryBudget",
+    "RetryPolicy",
+    "lazy_lists",
 )
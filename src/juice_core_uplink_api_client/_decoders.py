@@ -0,0 +1,1328 @@
+"""Contains the compiled decoders of the models, equivalent to their from_dict
+
+Generated from openapi.json by scripts/generate_decoders.py, do not edit.
+"""
+
+from typing import Any
+
+from dateutil.parser import isoparse
+
+from .lazy import decode_list
+from .models.api_version import ApiVersion
+from .models.configuration import Configuration
+from .models.configuration_item import ConfigurationItem
+from .models.data_profile import DataProfile
+from .models.detailed_scenario import DetailedScenario
+from .models.detailed_scenario_list import DetailedScenarioList
+from .models.engineering_segment import EngineeringSegment
+from .models.engineering_segment_type import EngineeringSegmentType
+from .models.event import Event
+from .models.fdyn_event import FdynEvent
+from .models.fdyn_event_definition import FdynEventDefinition
+from .models.fdyn_event_file import FdynEventFile
+from .models.instrument_membership import InstrumentMembership
+from .models.instrument_membership_type import InstrumentMembershipType
+from .models.instrument_resource_profile import InstrumentResourceProfile
+from .models.instrument_type import InstrumentType
+from .models.json_web_token import JSONWebToken
+from .models.kernel_file import KernelFile
+from .models.mode import Mode
+from .models.observation_definition import ObservationDefinition
+from .models.observation_definition_extend import ObservationDefinitionExtend
+from .models.payload_checkout_unit import PayloadCheckoutUnit
+from .models.payload_checkout_window import PayloadCheckoutWindow
+from .models.phase import Phase
+from .models.plan import Plan
+from .models.plan_list import PlanList
+from .models.plan_stats import PlanStats
+from .models.platform_power_profile import PlatformPowerProfile
+from .models.pln_view_file import PlnViewFile
+from .models.pln_view_session import PlnViewSession
+from .models.power_profile import PowerProfile
+from .models.read_only_instrument_resource_profile import (
+    ReadOnlyInstrumentResourceProfile,
+)
+from .models.read_only_plan import ReadOnlyPlan
+from .models.read_only_resource_profile import ReadOnlyResourceProfile
+from .models.read_only_segment_group import ReadOnlySegmentGroup
+from .models.refresh_json_web_token import RefreshJSONWebToken
+from .models.resource_category import ResourceCategory
+from .models.resource_profile import ResourceProfile
+from .models.segment import Segment
+from .models.segment_definition import SegmentDefinition
+from .models.segment_group import SegmentGroup
+from .models.series_data import SeriesData
+from .models.series_definition import SeriesDefinition
+from .models.simphony_plan_swagger import SimphonyPlanSwagger
+from .models.spice_info_swagger import SpiceInfoSwagger
+from .models.trajectory import Trajectory
+from .models.trajectory_list import TrajectoryList
+from .models.unit import Unit
+from .models.user import User
+from .models.uvt_event import UvtEvent
+from .models.uvt_event_file import UvtEventFile
+from .models.working_group_membership import WorkingGroupMembership
+from .models.working_group_membership_type import WorkingGroupMembershipType
+from .types import UNSET, Unset
+
+
+def _extra(d: dict[str, Any], known: frozenset[str]) -> dict[str, Any]:
+    return {key: value for key, value in d.items() if key not in known}
+
+
+def _datetime(data: Any) -> Any:
+    if isinstance(data, Unset):
+        return data
+    return isoparse(data)
+
+
+def _nullable_datetime(data: Any) -> Any:
+    if isinstance(data, str):
+        try:
+            return isoparse(data)
+        except:  # noqa: E722
+            pass
+    return data
+
+
+def _nullable_list(data: Any, decode: Any) -> Any:
+    if isinstance(data, list):
+        return decode_list(data, decode)
+    return data
+
+
+_API_VERSION_KEYS = frozenset(["version"])
+
+
+def decode_api_version(d: dict[str, Any]) -> ApiVersion:
+    api_version = ApiVersion(
+        d["version"],
+    )
+    if not _API_VERSION_KEYS.issuperset(d):
+        api_version.additional_properties = _extra(d, _API_VERSION_KEYS)
+    return api_version
+
+
+_CONFIGURATION_KEYS = frozenset(
+    [
+        "instrument_types",
+        "instruments",
+        "platform_power_profiles",
+        "resource_categories",
+        "slew_policies",
+        "targets",
+        "timelines",
+        "units",
+        "version",
+    ]
+)
+
+
+def decode_configuration(d: dict[str, Any]) -> Configuration:
+    configuration = Configuration(
+        d["version"],
+        decode_list(d.get("targets") or [], decode_configuration_item),
+        decode_list(d.get("instruments") or [], decode_configuration_item),
+        decode_list(d.get("units") or [], decode_unit),
+        decode_list(d.get("instrument_types") or [], decode_instrument_type),
+        decode_list(d.get("resource_categories") or [], decode_resource_category),
+        decode_list(d.get("slew_policies") or [], decode_configuration_item),
+        decode_list(d.get("timelines") or [], decode_configuration_item),
+        decode_list(
+            d.get("platform_power_profiles") or [], decode_platform_power_profile
+        ),
+    )
+    if not _CONFIGURATION_KEYS.issuperset(d):
+        configuration.additional_properties = _extra(d, _CONFIGURATION_KEYS)
+    return configuration
+
+
+_CONFIGURATION_ITEM_KEYS = frozenset(["mnemonic", "name"])
+
+
+def decode_configuration_item(d: dict[str, Any]) -> ConfigurationItem:
+    configuration_item = ConfigurationItem(
+        d["name"],
+        d["mnemonic"],
+    )
+    if not _CONFIGURATION_ITEM_KEYS.issuperset(d):
+        configuration_item.additional_properties = _extra(d, _CONFIGURATION_ITEM_KEYS)
+    return configuration_item
+
+
+_DATA_PROFILE_KEYS = frozenset(
+    ["comment", "data_rate", "event", "mode", "time", "unit"]
+)
+
+
+def decode_data_profile(d: dict[str, Any]) -> DataProfile:
+    data_profile = DataProfile(
+        d["event"],
+        d["time"],
+        d["mode"],
+        d.get("data_rate", UNSET),
+        d.get("comment", UNSET),
+        d.get("unit", UNSET),
+    )
+    if not _DATA_PROFILE_KEYS.issuperset(d):
+        data_profile.additional_properties = _extra(d, _DATA_PROFILE_KEYS)
+    return data_profile
+
+
+_DETAILED_SCENARIO_KEYS = frozenset(
+    [
+        "description",
+        "end",
+        "id",
+        "mnemonic",
+        "name",
+        "scenario_json_file",
+        "start",
+        "trajectory",
+    ]
+)
+
+
+def decode_detailed_scenario(d: dict[str, Any]) -> DetailedScenario:
+    detailed_scenario = DetailedScenario(
+        d["trajectory"],
+        d["mnemonic"],
+        d["name"],
+        d.get("id", UNSET),
+        d.get("description", UNSET),
+        d.get("scenario_json_file", UNSET),
+        d.get("start", UNSET),
+        d.get("end", UNSET),
+    )
+    if not _DETAILED_SCENARIO_KEYS.issuperset(d):
+        detailed_scenario.additional_properties = _extra(d, _DETAILED_SCENARIO_KEYS)
+    return detailed_scenario
+
+
+_DETAILED_SCENARIO_LIST_KEYS = frozenset(
+    [
+        "author",
+        "created",
+        "description",
+        "end",
+        "id",
+        "mnemonic",
+        "name",
+        "scenario_json_file",
+        "start",
+        "trajectory",
+    ]
+)
+
+
+def decode_detailed_scenario_list(d: dict[str, Any]) -> DetailedScenarioList:
+    detailed_scenario_list = DetailedScenarioList(
+        d["trajectory"],
+        d["name"],
+        d["mnemonic"],
+        _datetime(d.get("created", UNSET)),
+        d.get("id", UNSET),
+        d.get("author", UNSET),
+        d.get("description", UNSET),
+        d.get("scenario_json_file", UNSET),
+        d.get("start", UNSET),
+        d.get("end", UNSET),
+    )
+    if not _DETAILED_SCENARIO_LIST_KEYS.issuperset(d):
+        detailed_scenario_list.additional_properties = _extra(
+            d, _DETAILED_SCENARIO_LIST_KEYS
+        )
+    return detailed_scenario_list
+
+
+_ENGINEERING_SEGMENT_KEYS = frozenset(
+    ["end", "power", "segment_type", "segment_type_raw", "start"]
+)
+
+
+def decode_engineering_segment(d: dict[str, Any]) -> EngineeringSegment:
+    engineering_segment = EngineeringSegment(
+        d["start"],
+        d["end"],
+        d.get("segment_type", UNSET),
+        d.get("power", UNSET),
+        d.get("segment_type_raw", UNSET),
+    )
+    if not _ENGINEERING_SEGMENT_KEYS.issuperset(d):
+        engineering_segment.additional_properties = _extra(d, _ENGINEERING_SEGMENT_KEYS)
+    return engineering_segment
+
+
+_ENGINEERING_SEGMENT_TYPE_KEYS = frozenset(["description", "mnemonic", "name", "power"])
+
+
+def decode_engineering_segment_type(d: dict[str, Any]) -> EngineeringSegmentType:
+    engineering_segment_type = EngineeringSegmentType(
+        d["mnemonic"],
+        d["name"],
+        d.get("description", UNSET),
+        d.get("power", UNSET),
+    )
+    if not _ENGINEERING_SEGMENT_TYPE_KEYS.issuperset(d):
+        engineering_segment_type.additional_properties = _extra(
+            d, _ENGINEERING_SEGMENT_TYPE_KEYS
+        )
+    return engineering_segment_type
+
+
+_EVENT_KEYS = frozenset(["definition", "description", "end", "name", "start"])
+
+
+def decode_event(d: dict[str, Any]) -> Event:
+    event = Event(
+        d["name"],
+        d.get("start", UNSET),
+        d.get("end", UNSET),
+        d.get("description", UNSET),
+        d.get("definition", UNSET),
+    )
+    if not _EVENT_KEYS.issuperset(d):
+        event.additional_properties = _extra(d, _EVENT_KEYS)
+    return event
+
+
+_FDYN_EVENT_KEYS = frozenset(
+    ["count", "definition", "description", "end", "name", "start"]
+)
+
+
+def decode_fdyn_event(d: dict[str, Any]) -> FdynEvent:
+    fdyn_event = FdynEvent(
+        d["name"],
+        d["count"],
+        d.get("start", UNSET),
+        d.get("end", UNSET),
+        d.get("description", UNSET),
+        d.get("definition", UNSET),
+    )
+    if not _FDYN_EVENT_KEYS.issuperset(d):
+        fdyn_event.additional_properties = _extra(d, _FDYN_EVENT_KEYS)
+    return fdyn_event
+
+
+_FDYN_EVENT_DEFINITION_KEYS = frozenset(
+    ["category", "color", "description", "mnemonic", "name"]
+)
+
+
+def decode_fdyn_event_definition(d: dict[str, Any]) -> FdynEventDefinition:
+    fdyn_event_definition = FdynEventDefinition(
+        d["mnemonic"],
+        d["name"],
+        d.get("description", UNSET),
+        d.get("category", UNSET),
+        d.get("color", UNSET),
+    )
+    if not _FDYN_EVENT_DEFINITION_KEYS.issuperset(d):
+        fdyn_event_definition.additional_properties = _extra(
+            d, _FDYN_EVENT_DEFINITION_KEYS
+        )
+    return fdyn_event_definition
+
+
+_FDYN_EVENT_FILE_KEYS = frozenset(["description", "mnemonic", "name"])
+
+
+def decode_fdyn_event_file(d: dict[str, Any]) -> FdynEventFile:
+    fdyn_event_file = FdynEventFile(
+        d["mnemonic"],
+        d["name"],
+        d.get("description", UNSET),
+    )
+    if not _FDYN_EVENT_FILE_KEYS.issuperset(d):
+        fdyn_event_file.additional_properties = _extra(d, _FDYN_EVENT_FILE_KEYS)
+    return fdyn_event_file
+
+
+_INSTRUMENT_MEMBERSHIP_KEYS = frozenset(["instrument", "type"])
+
+
+def decode_instrument_membership(d: dict[str, Any]) -> InstrumentMembership:
+    instrument_membership = InstrumentMembership(
+        InstrumentMembershipType(d["type"]),
+        d.get("instrument", UNSET),
+    )
+    if not _INSTRUMENT_MEMBERSHIP_KEYS.issuperset(d):
+        instrument_membership.additional_properties = _extra(
+            d, _INSTRUMENT_MEMBERSHIP_KEYS
+        )
+    return instrument_membership
+
+
+_INSTRUMENT_RESOURCE_PROFILE_KEYS = frozenset(
+    ["category", "instrument", "target", "unit", "value"]
+)
+
+
+def decode_instrument_resource_profile(d: dict[str, Any]) -> InstrumentResourceProfile:
+    instrument_resource_profile = InstrumentResourceProfile(
+        d["category"],
+        d["target"],
+        d["unit"],
+        d["instrument"],
+        d.get("value", UNSET),
+    )
+    if not _INSTRUMENT_RESOURCE_PROFILE_KEYS.issuperset(d):
+        instrument_resource_profile.additional_properties = _extra(
+            d, _INSTRUMENT_RESOURCE_PROFILE_KEYS
+        )
+    return instrument_resource_profile
+
+
+_INSTRUMENT_TYPE_KEYS = frozenset(["instrument_set", "mnemonic", "name"])
+
+
+def decode_instrument_type(d: dict[str, Any]) -> InstrumentType:
+    instrument_type = InstrumentType(
+        d["name"],
+        d["mnemonic"],
+        d.get("instrument_set", UNSET),
+    )
+    if not _INSTRUMENT_TYPE_KEYS.issuperset(d):
+        instrument_type.additional_properties = _extra(d, _INSTRUMENT_TYPE_KEYS)
+    return instrument_type
+
+
+_JSON_WEB_TOKEN_KEYS = frozenset(["password", "username"])
+
+
+def decode_json_web_token(d: dict[str, Any]) -> JSONWebToken:
+    json_web_token = JSONWebToken(
+        d["username"],
+        d["password"],
+    )
+    if not _JSON_WEB_TOKEN_KEYS.issuperset(d):
+        json_web_token.additional_properties = _extra(d, _JSON_WEB_TOKEN_KEYS)
+    return json_web_token
+
+
+_KERNEL_FILE_KEYS = frozenset(["mnemonic", "name", "path"])
+
+
+def decode_kernel_file(d: dict[str, Any]) -> KernelFile:
+    kernel_file = KernelFile(
+        d["name"],
+        d["mnemonic"],
+        d["path"],
+    )
+    if not _KERNEL_FILE_KEYS.issuperset(d):
+        kernel_file.additional_properties = _extra(d, _KERNEL_FILE_KEYS)
+    return kernel_file
+
+
+_MODE_KEYS = frozenset(
+    [
+        "comments",
+        "data_rate",
+        "description",
+        "inactive",
+        "mapps_mode",
+        "mnemonic",
+        "name",
+        "payload",
+        "power",
+    ]
+)
+
+
+def decode_mode(d: dict[str, Any]) -> Mode:
+    mode = Mode(
+        d["name"],
+        d["mnemonic"],
+        d["payload"],
+        d.get("description", UNSET),
+        d.get("mapps_mode", UNSET),
+        d.get("power", UNSET),
+        d.get("data_rate", UNSET),
+        d.get("inactive", UNSET),
+        d.get("comments", UNSET),
+    )
+    if not _MODE_KEYS.issuperset(d):
+        mode.additional_properties = _extra(d, _MODE_KEYS)
+    return mode
+
+
+_OBSERVATION_DEFINITION_KEYS = frozenset(
+    [
+        "ITLSnippet",
+        "ITLSnippet_file",
+        "PTRSnippet",
+        "PTRSnippet_file",
+        "data_profile",
+        "description",
+        "id",
+        "mnemonic",
+        "name",
+        "payload",
+        "pointing_type",
+        "power_profile",
+        "segment_definitions",
+        "target",
+    ]
+)
+
+
+def decode_observation_definition(d: dict[str, Any]) -> ObservationDefinition:
+    observation_definition = ObservationDefinition(
+        d["name"],
+        d["mnemonic"],
+        d["payload"],
+        d["pointing_type"],
+        d["target"],
+        d["segment_definitions"],
+        d.get("id", UNSET),
+        d.get("description", UNSET),
+        _nullable_list(d.get("data_profile", UNSET), decode_data_profile),
+        _nullable_list(d.get("power_profile", UNSET), decode_power_profile),
+        d.get("PTRSnippet_file", UNSET),
+        d.get("ITLSnippet_file", UNSET),
+        d.get("PTRSnippet", UNSET),
+        d.get("ITLSnippet", UNSET),
+    )
+    if not _OBSERVATION_DEFINITION_KEYS.issuperset(d):
+        observation_definition.additional_properties = _extra(
+            d, _OBSERVATION_DEFINITION_KEYS
+        )
+    return observation_definition
+
+
+_OBSERVATION_DEFINITION_EXTEND_KEYS = frozenset(
+    [
+        "AvoidanceRules",
+        "Comments",
+        "ITLSnippet",
+        "ITLSnippet_file",
+        "PTRSnippet",
+        "PTRSnippet_file",
+        "SchedulingRules",
+        "Support_Plot_1",
+        "Support_Plot_2",
+        "Support_Plot_3",
+        "changeReason",
+        "data_profile",
+        "description",
+        "id",
+        "log",
+        "mnemonic",
+        "name",
+        "payload",
+        "pointing_type",
+        "power_profile",
+        "segment_definitions",
+        "target",
+    ]
+)
+
+
+def decode_observation_definition_extend(
+    d: dict[str, Any],
+) -> ObservationDefinitionExtend:
+    observation_definition_extend = ObservationDefinitionExtend(
+        d["name"],
+        d["mnemonic"],
+        d["payload"],
+        d["pointing_type"],
+        d["target"],
+        d["segment_definitions"],
+        d["SchedulingRules"],
+        d["AvoidanceRules"],
+        d.get("id", UNSET),
+        d.get("description", UNSET),
+        _nullable_list(d.get("data_profile", UNSET), decode_data_profile),
+        _nullable_list(d.get("power_profile", UNSET), decode_power_profile),
+        d.get("PTRSnippet_file", UNSET),
+        d.get("ITLSnippet_file", UNSET),
+        d.get("PTRSnippet", UNSET),
+        d.get("ITLSnippet", UNSET),
+        d.get("log", UNSET),
+        d.get("Comments", UNSET),
+        d.get("changeReason", UNSET),
+        d.get("Support_Plot_1", UNSET),
+        d.get("Support_Plot_2", UNSET),
+        d.get("Support_Plot_3", UNSET),
+    )
+    if not _OBSERVATION_DEFINITION_EXTEND_KEYS.issuperset(d):
+        observation_definition_extend.additional_properties = _extra(
+            d, _OBSERVATION_DEFINITION_EXTEND_KEYS
+        )
+    return observation_definition_extend
+
+
+_PAYLOAD_CHECKOUT_UNIT_KEYS = frozenset(
+    ["color", "description", "instrument", "mnemonic", "name", "sub_instrument"]
+)
+
+
+def decode_payload_checkout_unit(d: dict[str, Any]) -> PayloadCheckoutUnit:
+    payload_checkout_unit = PayloadCheckoutUnit(
+        d["name"],
+        d["mnemonic"],
+        d.get("description", UNSET),
+        d.get("color", UNSET),
+        d.get("instrument", UNSET),
+        d.get("sub_instrument", UNSET),
+    )
+    if not _PAYLOAD_CHECKOUT_UNIT_KEYS.issuperset(d):
+        payload_checkout_unit.additional_properties = _extra(
+            d, _PAYLOAD_CHECKOUT_UNIT_KEYS
+        )
+    return payload_checkout_unit
+
+
+_PAYLOAD_CHECKOUT_WINDOW_KEYS = frozenset(
+    [
+        "baseline",
+        "description",
+        "end",
+        "git_branch",
+        "mnemonic",
+        "name",
+        "ref_event_counter",
+        "ref_event_name",
+        "sevt_file",
+        "start",
+        "uevt_file",
+    ]
+)
+
+
+def decode_payload_checkout_window(d: dict[str, Any]) -> PayloadCheckoutWindow:
+    payload_checkout_window = PayloadCheckoutWindow(
+        d["name"],
+        d["mnemonic"],
+        d.get("description", UNSET),
+        d.get("uevt_file", UNSET),
+        d.get("sevt_file", UNSET),
+        d.get("git_branch", UNSET),
+        d.get("baseline", UNSET),
+        d.get("start", UNSET),
+        d.get("end", UNSET),
+        d.get("ref_event_name", UNSET),
+        d.get("ref_event_counter", UNSET),
+    )
+    if not _PAYLOAD_CHECKOUT_WINDOW_KEYS.issuperset(d):
+        payload_checkout_window.additional_properties = _extra(
+            d, _PAYLOAD_CHECKOUT_WINDOW_KEYS
+        )
+    return payload_checkout_window
+
+
+_PHASE_KEYS = frozenset(["end", "mnemonic", "name", "start"])
+
+
+def decode_phase(d: dict[str, Any]) -> Phase:
+    phase = Phase(
+        d["name"],
+        d["mnemonic"],
+        _nullable_datetime(d.get("start", UNSET)),
+        _nullable_datetime(d.get("end", UNSET)),
+    )
+    if not _PHASE_KEYS.issuperset(d):
+        phase.additional_properties = _extra(d, _PHASE_KEYS)
+    return phase
+
+
+_PLAN_KEYS = frozenset(
+    [
+        "default_block",
+        "default_slew_policy",
+        "description",
+        "is_public",
+        "mnemonic",
+        "name",
+        "refine_log",
+        "segment_groups",
+        "segments",
+        "spice_info",
+        "trajectory",
+    ]
+)
+
+
+def decode_plan(d: dict[str, Any]) -> Plan:
+    plan = Plan(
+        d["trajectory"],
+        d["mnemonic"],
+        d["name"],
+        d["is_public"],
+        decode_list(d["segments"], decode_segment),
+        decode_list(d["segment_groups"], decode_segment_group),
+        d.get("description", UNSET),
+        d.get("default_block", UNSET),
+        d.get("default_slew_policy", UNSET),
+        d.get("spice_info", UNSET),
+        d.get("refine_log", UNSET),
+    )
+    if not _PLAN_KEYS.issuperset(d):
+        plan.additional_properties = _extra(d, _PLAN_KEYS)
+    return plan
+
+
+_PLAN_LIST_KEYS = frozenset(
+    [
+        "author",
+        "created",
+        "description",
+        "id",
+        "is_public",
+        "mnemonic",
+        "name",
+        "ptr_file",
+        "refine_log",
+        "trajectory",
+    ]
+)
+
+
+def decode_plan_list(d: dict[str, Any]) -> PlanList:
+    plan_list = PlanList(
+        d["trajectory"],
+        d["name"],
+        d["mnemonic"],
+        d["is_public"],
+        _datetime(d.get("created", UNSET)),
+        d.get("id", UNSET),
+        d.get("author", UNSET),
+        d.get("description", UNSET),
+        d.get("refine_log", UNSET),
+        d.get("ptr_file", UNSET),
+    )
+    if not _PLAN_LIST_KEYS.issuperset(d):
+        plan_list.additional_properties = _extra(d, _PLAN_LIST_KEYS)
+    return plan_list
+
+
+_PLAN_STATS_KEYS = frozenset(
+    ["end", "group_number", "segment_number", "start", "stats"]
+)
+
+
+def decode_plan_stats(d: dict[str, Any]) -> PlanStats:
+    plan_stats = PlanStats(
+        d.get("segment_number", UNSET),
+        d.get("group_number", UNSET),
+        d.get("start", UNSET),
+        d.get("end", UNSET),
+        d.get("stats", UNSET),
+    )
+    if not _PLAN_STATS_KEYS.issuperset(d):
+        plan_stats.additional_properties = _extra(d, _PLAN_STATS_KEYS)
+    return plan_stats
+
+
+_PLATFORM_POWER_PROFILE_KEYS = frozenset(["mnemonic", "name", "power"])
+
+
+def decode_platform_power_profile(d: dict[str, Any]) -> PlatformPowerProfile:
+    platform_power_profile = PlatformPowerProfile(
+        d["name"],
+        d["mnemonic"],
+        d["power"],
+    )
+    if not _PLATFORM_POWER_PROFILE_KEYS.issuperset(d):
+        platform_power_profile.additional_properties = _extra(
+            d, _PLATFORM_POWER_PROFILE_KEYS
+        )
+    return platform_power_profile
+
+
+_PLN_VIEW_FILE_KEYS = frozenset(["description", "mnemonic", "name"])
+
+
+def decode_pln_view_file(d: dict[str, Any]) -> PlnViewFile:
+    pln_view_file = PlnViewFile(
+        d["mnemonic"],
+        d["name"],
+        d.get("description", UNSET),
+    )
+    if not _PLN_VIEW_FILE_KEYS.issuperset(d):
+        pln_view_file.additional_properties = _extra(d, _PLN_VIEW_FILE_KEYS)
+    return pln_view_file
+
+
+_PLN_VIEW_SESSION_KEYS = frozenset(
+    [
+        "activity_end",
+        "activity_start",
+        "description",
+        "ground_station",
+        "origin",
+        "tracking_end",
+        "tracking_start",
+    ]
+)
+
+
+def decode_pln_view_session(d: dict[str, Any]) -> PlnViewSession:
+    pln_view_session = PlnViewSession(
+        d["ground_station"],
+        d.get("activity_start", UNSET),
+        d.get("activity_end", UNSET),
+        d.get("tracking_start", UNSET),
+        d.get("tracking_end", UNSET),
+        d.get("description", UNSET),
+        d.get("origin", UNSET),
+    )
+    if not _PLN_VIEW_SESSION_KEYS.issuperset(d):
+        pln_view_session.additional_properties = _extra(d, _PLN_VIEW_SESSION_KEYS)
+    return pln_view_session
+
+
+_POWER_PROFILE_KEYS = frozenset(["comment", "event", "mode", "power", "time", "unit"])
+
+
+def decode_power_profile(d: dict[str, Any]) -> PowerProfile:
+    power_profile = PowerProfile(
+        d["event"],
+        d["time"],
+        d["mode"],
+        d.get("power", UNSET),
+        d.get("comment", UNSET),
+        d.get("unit", UNSET),
+    )
+    if not _POWER_PROFILE_KEYS.issuperset(d):
+        power_profile.additional_properties = _extra(d, _POWER_PROFILE_KEYS)
+    return power_profile
+
+
+_READ_ONLY_INSTRUMENT_RESOURCE_PROFILE_KEYS = frozenset(
+    ["category", "instrument", "target", "unit", "value"]
+)
+
+
+def decode_read_only_instrument_resource_profile(
+    d: dict[str, Any],
+) -> ReadOnlyInstrumentResourceProfile:
+    read_only_instrument_resource_profile = ReadOnlyInstrumentResourceProfile(
+        d["value"],
+        d.get("instrument", UNSET),
+        d.get("category", UNSET),
+        d.get("target", UNSET),
+        d.get("unit", UNSET),
+    )
+    if not _READ_ONLY_INSTRUMENT_RESOURCE_PROFILE_KEYS.issuperset(d):
+        read_only_instrument_resource_profile.additional_properties = _extra(
+            d, _READ_ONLY_INSTRUMENT_RESOURCE_PROFILE_KEYS
+        )
+    return read_only_instrument_resource_profile
+
+
+_READ_ONLY_PLAN_KEYS = frozenset(
+    [
+        "default_block",
+        "default_slew_policy",
+        "description",
+        "is_public",
+        "mnemonic",
+        "name",
+        "refine_log",
+        "segment_groups",
+        "segments",
+        "spice_info",
+        "trajectory",
+    ]
+)
+
+
+def decode_read_only_plan(d: dict[str, Any]) -> ReadOnlyPlan:
+    read_only_plan = ReadOnlyPlan(
+        d["trajectory"],
+        d["mnemonic"],
+        d["name"],
+        d["is_public"],
+        decode_list(d["segment_groups"], decode_read_only_segment_group),
+        d.get("description", UNSET),
+        d.get("segments", UNSET),
+        d.get("refine_log", UNSET),
+        d.get("spice_info", UNSET),
+        d.get("default_block", UNSET),
+        d.get("default_slew_policy", UNSET),
+    )
+    if not _READ_ONLY_PLAN_KEYS.issuperset(d):
+        read_only_plan.additional_properties = _extra(d, _READ_ONLY_PLAN_KEYS)
+    return read_only_plan
+
+
+_READ_ONLY_RESOURCE_PROFILE_KEYS = frozenset(
+    ["category", "instrument_type", "target", "unit", "value"]
+)
+
+
+def decode_read_only_resource_profile(d: dict[str, Any]) -> ReadOnlyResourceProfile:
+    read_only_resource_profile = ReadOnlyResourceProfile(
+        d["value"],
+        d.get("instrument_type", UNSET),
+        d.get("category", UNSET),
+        d.get("target", UNSET),
+        d.get("unit", UNSET),
+    )
+    if not _READ_ONLY_RESOURCE_PROFILE_KEYS.issuperset(d):
+        read_only_resource_profile.additional_properties = _extra(
+            d, _READ_ONLY_RESOURCE_PROFILE_KEYS
+        )
+    return read_only_resource_profile
+
+
+_READ_ONLY_SEGMENT_GROUP_KEYS = frozenset(
+    ["instrument_resources", "mnemonic", "name", "platform_power_profile", "resources"]
+)
+
+
+def decode_read_only_segment_group(d: dict[str, Any]) -> ReadOnlySegmentGroup:
+    read_only_segment_group = ReadOnlySegmentGroup(
+        d["name"],
+        d["mnemonic"],
+        decode_list(d["resources"], decode_read_only_resource_profile),
+        decode_list(
+            d["instrument_resources"], decode_read_only_instrument_resource_profile
+        ),
+        d.get("platform_power_profile", UNSET),
+    )
+    if not _READ_ONLY_SEGMENT_GROUP_KEYS.issuperset(d):
+        read_only_segment_group.additional_properties = _extra(
+            d, _READ_ONLY_SEGMENT_GROUP_KEYS
+        )
+    return read_only_segment_group
+
+
+_REFRESH_JSON_WEB_TOKEN_KEYS = frozenset(["token"])
+
+
+def decode_refresh_json_web_token(d: dict[str, Any]) -> RefreshJSONWebToken:
+    refresh_json_web_token = RefreshJSONWebToken(
+        d["token"],
+    )
+    if not _REFRESH_JSON_WEB_TOKEN_KEYS.issuperset(d):
+        refresh_json_web_token.additional_properties = _extra(
+            d, _REFRESH_JSON_WEB_TOKEN_KEYS
+        )
+    return refresh_json_web_token
+
+
+_RESOURCE_CATEGORY_KEYS = frozenset(["category_type", "mnemonic", "name"])
+
+
+def decode_resource_category(d: dict[str, Any]) -> ResourceCategory:
+    resource_category = ResourceCategory(
+        d["name"],
+        d["mnemonic"],
+        d["category_type"],
+    )
+    if not _RESOURCE_CATEGORY_KEYS.issuperset(d):
+        resource_category.additional_properties = _extra(d, _RESOURCE_CATEGORY_KEYS)
+    return resource_category
+
+
+_RESOURCE_PROFILE_KEYS = frozenset(
+    ["category", "instrument_type", "target", "unit", "value"]
+)
+
+
+def decode_resource_profile(d: dict[str, Any]) -> ResourceProfile:
+    resource_profile = ResourceProfile(
+        d["category"],
+        d["target"],
+        d["unit"],
+        d["instrument_type"],
+        d.get("value", UNSET),
+    )
+    if not _RESOURCE_PROFILE_KEYS.issuperset(d):
+        resource_profile.additional_properties = _extra(d, _RESOURCE_PROFILE_KEYS)
+    return resource_profile
+
+
+_SEGMENT_KEYS = frozenset(
+    [
+        "end",
+        "instrument_overwritten",
+        "instrument_resources",
+        "name",
+        "origin",
+        "overwritten",
+        "platform_power",
+        "platform_power_profile",
+        "pointing_request_snippet",
+        "pointing_target",
+        "prime",
+        "resources",
+        "riders",
+        "scheduling_priority",
+        "segment_definition",
+        "segment_group",
+        "slew_policy",
+        "start",
+        "timeline",
+    ]
+)
+
+
+def decode_segment(d: dict[str, Any]) -> Segment:
+    segment = Segment(
+        d["start"],
+        d["end"],
+        d["segment_definition"],
+        d["overwritten"],
+        d["instrument_overwritten"],
+        d["timeline"],
+        d.get("name", UNSET),
+        _nullable_list(d.get("resources", UNSET), decode_resource_profile),
+        _nullable_list(
+            d.get("instrument_resources", UNSET), decode_instrument_resource_profile
+        ),
+        d.get("segment_group", UNSET),
+        d.get("platform_power_profile", UNSET),
+        d.get("platform_power", UNSET),
+        d.get("pointing_request_snippet", UNSET),
+        d.get("slew_policy", UNSET),
+        d.get("pointing_target", UNSET),
+        d.get("scheduling_priority", UNSET),
+        d.get("origin", UNSET),
+        d.get("prime", UNSET),
+        list(d.get("riders") or ()),
+    )
+    if not _SEGMENT_KEYS.issuperset(d):
+        segment.additional_properties = _extra(d, _SEGMENT_KEYS)
+    return segment
+
+
+_SEGMENT_DEFINITION_KEYS = frozenset(
+    [
+        "color",
+        "description",
+        "group",
+        "instrument_resources",
+        "mnemonic",
+        "name",
+        "observation_definitions",
+        "platform_power_profile",
+        "pointing_request_file",
+        "pointing_target",
+        "prime_segment",
+        "resources",
+        "riders",
+        "scheduler_flag",
+        "scheduling_priority",
+        "slew_policy",
+    ]
+)
+
+
+def decode_segment_definition(d: dict[str, Any]) -> SegmentDefinition:
+    segment_definition = SegmentDefinition(
+        d["name"],
+        d["mnemonic"],
+        d["riders"],
+        d["prime_segment"],
+        d["observation_definitions"],
+        d.get("description", UNSET),
+        _nullable_list(d.get("resources", UNSET), decode_resource_profile),
+        _nullable_list(
+            d.get("instrument_resources", UNSET), decode_instrument_resource_profile
+        ),
+        d.get("group", UNSET),
+        d.get("pointing_request_file", UNSET),
+        d.get("slew_policy", UNSET),
+        d.get("pointing_target", UNSET),
+        d.get("platform_power_profile", UNSET),
+        d.get("scheduler_flag", UNSET),
+        d.get("scheduling_priority", UNSET),
+        d.get("color", UNSET),
+    )
+    if not _SEGMENT_DEFINITION_KEYS.issuperset(d):
+        segment_definition.additional_properties = _extra(d, _SEGMENT_DEFINITION_KEYS)
+    return segment_definition
+
+
+_SEGMENT_GROUP_KEYS = frozenset(
+    ["instrument_resources", "mnemonic", "name", "platform_power_profile", "resources"]
+)
+
+
+def decode_segment_group(d: dict[str, Any]) -> SegmentGroup:
+    segment_group = SegmentGroup(
+        d["name"],
+        d["mnemonic"],
+        _nullable_list(d.get("resources", UNSET), decode_resource_profile),
+        _nullable_list(
+            d.get("instrument_resources", UNSET), decode_instrument_resource_profile
+        ),
+        d.get("platform_power_profile", UNSET),
+    )
+    if not _SEGMENT_GROUP_KEYS.issuperset(d):
+        segment_group.additional_properties = _extra(d, _SEGMENT_GROUP_KEYS)
+    return segment_group
+
+
+_SERIES_DATA_KEYS = frozenset(["epoch", "value"])
+
+
+def decode_series_data(d: dict[str, Any]) -> SeriesData:
+    series_data = SeriesData(
+        d.get("epoch", UNSET),
+        d.get("value", UNSET),
+    )
+    if not _SERIES_DATA_KEYS.issuperset(d):
+        series_data.additional_properties = _extra(d, _SERIES_DATA_KEYS)
+    return series_data
+
+
+_SERIES_DEFINITION_KEYS = frozenset(
+    ["category", "description", "mnemonic", "name", "unit"]
+)
+
+
+def decode_series_definition(d: dict[str, Any]) -> SeriesDefinition:
+    series_definition = SeriesDefinition(
+        d["name"],
+        d["mnemonic"],
+        d.get("unit", UNSET),
+        d.get("category", UNSET),
+        d.get("description", UNSET),
+    )
+    if not _SERIES_DEFINITION_KEYS.issuperset(d):
+        series_definition.additional_properties = _extra(d, _SERIES_DEFINITION_KEYS)
+    return series_definition
+
+
+_SIMPHONY_PLAN_SWAGGER_KEYS = frozenset(
+    [
+        "default_block",
+        "default_slew_policy",
+        "description",
+        "is_public",
+        "mnemonic",
+        "name",
+        "segment_opportunities",
+        "segment_timeline",
+        "spice_info",
+        "trajectory",
+    ]
+)
+
+
+def decode_simphony_plan_swagger(d: dict[str, Any]) -> SimphonyPlanSwagger:
+    simphony_plan_swagger = SimphonyPlanSwagger(
+        d["trajectory"],
+        d["mnemonic"],
+        d["is_public"],
+        decode_list(d["segment_timeline"], decode_segment),
+        decode_list(d["segment_opportunities"], decode_segment),
+        decode_list(d["spice_info"], decode_spice_info_swagger),
+        d["default_block"],
+        d["default_slew_policy"],
+        d.get("name", UNSET),
+        d.get("description", UNSET),
+    )
+    if not _SIMPHONY_PLAN_SWAGGER_KEYS.issuperset(d):
+        simphony_plan_swagger.additional_properties = _extra(
+            d, _SIMPHONY_PLAN_SWAGGER_KEYS
+        )
+    return simphony_plan_swagger
+
+
+_SPICE_INFO_SWAGGER_KEYS = frozenset(["kernels", "metakernel", "skd_version"])
+
+
+def decode_spice_info_swagger(d: dict[str, Any]) -> SpiceInfoSwagger:
+    spice_info_swagger = SpiceInfoSwagger(
+        decode_list(d["kernels"], decode_kernel_file),
+        d["skd_version"],
+        d["metakernel"],
+    )
+    if not _SPICE_INFO_SWAGGER_KEYS.issuperset(d):
+        spice_info_swagger.additional_properties = _extra(d, _SPICE_INFO_SWAGGER_KEYS)
+    return spice_info_swagger
+
+
+_TRAJECTORY_KEYS = frozenset(
+    [
+        "id",
+        "mnemonic",
+        "name",
+        "phases",
+        "pt_context",
+        "ptr_file",
+        "spice_info",
+        "trajectory_type",
+    ]
+)
+
+
+def decode_trajectory(d: dict[str, Any]) -> Trajectory:
+    trajectory = Trajectory(
+        d["name"],
+        d["mnemonic"],
+        decode_list(d["phases"], decode_phase),
+        d.get("id", UNSET),
+        d.get("pt_context", UNSET),
+        d.get("trajectory_type", UNSET),
+        d.get("spice_info", UNSET),
+        d.get("ptr_file", UNSET),
+    )
+    if not _TRAJECTORY_KEYS.issuperset(d):
+        trajectory.additional_properties = _extra(d, _TRAJECTORY_KEYS)
+    return trajectory
+
+
+_TRAJECTORY_LIST_KEYS = frozenset(["id", "mnemonic", "name", "trajectory_type"])
+
+
+def decode_trajectory_list(d: dict[str, Any]) -> TrajectoryList:
+    trajectory_list = TrajectoryList(
+        d["name"],
+        d["mnemonic"],
+        d.get("id", UNSET),
+        d.get("trajectory_type", UNSET),
+    )
+    if not _TRAJECTORY_LIST_KEYS.issuperset(d):
+        trajectory_list.additional_properties = _extra(d, _TRAJECTORY_LIST_KEYS)
+    return trajectory_list
+
+
+_UNIT_KEYS = frozenset(["category", "mnemonic", "name", "ratio"])
+
+
+def decode_unit(d: dict[str, Any]) -> Unit:
+    unit = Unit(
+        d["name"],
+        d["mnemonic"],
+        d["ratio"],
+        d.get("category", UNSET),
+    )
+    if not _UNIT_KEYS.issuperset(d):
+        unit.additional_properties = _extra(d, _UNIT_KEYS)
+    return unit
+
+
+_USER_KEYS = frozenset(
+    [
+        "email",
+        "first_name",
+        "instruments",
+        "last_name",
+        "role",
+        "username",
+        "working_groups",
+    ]
+)
+
+
+def decode_user(d: dict[str, Any]) -> User:
+    user = User(
+        decode_list(d["working_groups"], decode_working_group_membership),
+        decode_list(d["instruments"], decode_instrument_membership),
+        d.get("username", UNSET),
+        d.get("email", UNSET),
+        d.get("first_name", UNSET),
+        d.get("last_name", UNSET),
+        d.get("role", UNSET),
+    )
+    if not _USER_KEYS.issuperset(d):
+        user.additional_properties = _extra(d, _USER_KEYS)
+    return user
+
+
+_UVT_EVENT_KEYS = frozenset(["count", "duration", "mnemonic", "name", "source", "time"])
+
+
+def decode_uvt_event(d: dict[str, Any]) -> UvtEvent:
+    uvt_event = UvtEvent(
+        d["count"],
+        d["mnemonic"],
+        d.get("time", UNSET),
+        d.get("name", UNSET),
+        d.get("source", UNSET),
+        d.get("duration", UNSET),
+    )
+    if not _UVT_EVENT_KEYS.issuperset(d):
+        uvt_event.additional_properties = _extra(d, _UVT_EVENT_KEYS)
+    return uvt_event
+
+
+_UVT_EVENT_FILE_KEYS = frozenset(["description", "mnemonic", "name"])
+
+
+def decode_uvt_event_file(d: dict[str, Any]) -> UvtEventFile:
+    uvt_event_file = UvtEventFile(
+        d["mnemonic"],
+        d["name"],
+        d.get("description", UNSET),
+    )
+    if not _UVT_EVENT_FILE_KEYS.issuperset(d):
+        uvt_event_file.additional_properties = _extra(d, _UVT_EVENT_FILE_KEYS)
+    return uvt_event_file
+
+
+_WORKING_GROUP_MEMBERSHIP_KEYS = frozenset(["type", "working_group"])
+
+
+def decode_working_group_membership(d: dict[str, Any]) -> WorkingGroupMembership:
+    working_group_membership = WorkingGroupMembership(
+        WorkingGroupMembershipType(d["type"]),
+        d.get("working_group", UNSET),
+    )
+    if not _WORKING_GROUP_MEMBERSHIP_KEYS.issuperset(d):
+        working_group_membership.additional_properties = _extra(
+            d, _WORKING_GROUP_MEMBERSHIP_KEYS
+        )
+    return working_group_membership
+
+
+DECODERS = {
+    ApiVersion: decode_api_version,
+    Configuration: decode_configuration,
+    ConfigurationItem: decode_configuration_item,
+    DataProfile: decode_data_profile,
+    DetailedScenario: decode_detailed_scenario,
+    DetailedScenarioList: decode_detailed_scenario_list,
+    EngineeringSegment: decode_engineering_segment,
+    EngineeringSegmentType: decode_engineering_segment_type,
+    Event: decode_event,
+    FdynEvent: decode_fdyn_event,
+    FdynEventDefinition: decode_fdyn_event_definition,
+    FdynEventFile: decode_fdyn_event_file,
+    InstrumentMembership: decode_instrument_membership,
+    InstrumentResourceProfile: decode_instrument_resource_profile,
+    InstrumentType: decode_instrument_type,
+    JSONWebToken: decode_json_web_token,
+    KernelFile: decode_kernel_file,
+    Mode: decode_mode,
+    ObservationDefinition: decode_observation_definition,
+    ObservationDefinitionExtend: decode_observation_definition_extend,
+    PayloadCheckoutUnit: decode_payload_checkout_unit,
+    PayloadCheckoutWindow: decode_payload_checkout_window,
+    Phase: decode_phase,
+    Plan: decode_plan,
+    PlanList: decode_plan_list,
+    PlanStats: decode_plan_stats,
+    PlatformPowerProfile: decode_platform_power_profile,
+    PlnViewFile: decode_pln_view_file,
+    PlnViewSession: decode_pln_view_session,
+    PowerProfile: decode_power_profile,
+    ReadOnlyInstrumentResourceProfile: decode_read_only_instrument_resource_profile,
+    ReadOnlyPlan: decode_read_only_plan,
+    ReadOnlyResourceProfile: decode_read_only_resource_profile,
+    ReadOnlySegmentGroup: decode_read_only_segment_group,
+    RefreshJSONWebToken: decode_refresh_json_web_token,
+    ResourceCategory: decode_resource_category,
+    ResourceProfile: decode_resource_profile,
+    Segment: decode_segment,
+    SegmentDefinition: decode_segment_definition,
+    SegmentGroup: decode_segment_group,
+    SeriesData: decode_series_data,
+    SeriesDefinition: decode_series_definition,
+    SimphonyPlanSwagger: decode_simphony_plan_swagger,
+    SpiceInfoSwagger: decode_spice_info_swagger,
+    Trajectory: decode_trajectory,
+    TrajectoryList: decode_trajectory_list,
+    Unit: decode_unit,
+    User: decode_user,
+    UvtEvent: decode_uvt_event,
+    UvtEventFile: decode_uvt_event_file,
+    WorkingGroupMembership: decode_working_group_membership,
+}
@@ -1 +1,25 @@
-"""Contains methods for accessing the API"""
+"""Contains methods for accessing the API
+
+The endpoint modules are imported on first access, e.g. ``rest_api.get_plan``
+after ``from juice_core_uplink_api_client.api import rest_api``.
+"""
+
+from collections.abc import Callable
+from importlib import import_module
+from importlib.util import find_spec
+from types import ModuleType
+
+
+def lazy_submodules(package: str) -> Callable[[str], ModuleType]:
+    """A module ``__getattr__`` importing the submodules of ``package`` on access"""
+
+    def __getattr__(name: str) -> ModuleType:
+        if name.startswith("_") or find_spec(f"{package}.{name}") is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        return import_module(f"{package}.{name}")
+
+    return __getattr__
+
+
+__getattr__ = lazy_submodules(__name__)
@@ -0,0 +1,3 @@
+from .. import lazy_submodules
+
+__getattr__ = lazy_submodules(__name__)
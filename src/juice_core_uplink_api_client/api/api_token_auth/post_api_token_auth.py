@@ -33,7 +33,7 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> JSONWebToken | None:
     if response.status_code == HTTPStatus.CREATED:
-        response_201 = JSONWebToken.from_dict(response.json())
+        response_201 = JSONWebToken.from_dict(client.json_decoder(response.content))
 
         return response_201
     if client.raise_on_unexpected_status:
@@ -24,7 +24,7 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> Any | Plan | None:
     if response.status_code == HTTPStatus.NO_CONTENT:
-        response_204 = Plan.from_dict(response.json())
+        response_204 = Plan.from_dict(client.json_decoder(response.content))
 
         return response_204
     if response.status_code == HTTPStatus.NOT_FOUND:
@@ -24,7 +24,9 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> DetailedScenarioList | None:
     if response.status_code == HTTPStatus.OK:
-        response_200 = DetailedScenarioList.from_dict(response.json())
+        response_200 = DetailedScenarioList.from_dict(
+            client.json_decoder(response.content)
+        )
 
         return response_200
     if client.raise_on_unexpected_status:
@@ -24,7 +24,7 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> Any | DetailedScenario | None:
     if response.status_code == HTTPStatus.OK:
-        response_200 = DetailedScenario.from_dict(response.json())
+        response_200 = DetailedScenario.from_dict(client.json_decoder(response.content))
 
         return response_200
     if response.status_code == HTTPStatus.UNAUTHORIZED:
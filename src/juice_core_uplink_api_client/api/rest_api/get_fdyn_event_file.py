@@ -22,7 +22,7 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> FdynEventFile | None:
     if response.status_code == HTTPStatus.OK:
-        response_200 = FdynEventFile.from_dict(response.json())
+        response_200 = FdynEventFile.from_dict(client.json_decoder(response.content))
 
         return response_200
     if client.raise_on_unexpected_status:
@@ -46,7 +46,9 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> Any | SimphonyPlanSwagger | None:
     if response.status_code == HTTPStatus.OK:
-        response_200 = SimphonyPlanSwagger.from_dict(response.json())
+        response_200 = SimphonyPlanSwagger.from_dict(
+            client.json_decoder(response.content)
+        )
 
         return response_200
     if response.status_code == HTTPStatus.NOT_FOUND:
@@ -27,7 +27,7 @@ def _parse_response(
         response_404 = cast(Any, None)
         return response_404
     if response.status_code == HTTPStatus.OK:
-        response_200 = Trajectory.from_dict(response.json())
+        response_200 = Trajectory.from_dict(client.json_decoder(response.content))
 
         return response_200
     if client.raise_on_unexpected_status:
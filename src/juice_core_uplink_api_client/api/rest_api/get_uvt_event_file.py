@@ -23,7 +23,7 @@ def _parse_response(
 ) -> list["UvtEventFile"] | None:
     if response.status_code == HTTPStatus.OK:
         response_200 = []
-        _response_200 = response.json()
+        _response_200 = client.json_decoder(response.content)
         for response_200_item_data in _response_200:
             response_200_item = UvtEventFile.from_dict(response_200_item_data)
 
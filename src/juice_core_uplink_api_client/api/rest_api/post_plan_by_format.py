@@ -34,7 +34,7 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> Any | Plan | None:
     if response.status_code == HTTPStatus.CREATED:
-        response_201 = Plan.from_dict(response.json())
+        response_201 = Plan.from_dict(client.json_decoder(response.content))
 
         return response_201
     if response.status_code == HTTPStatus.UNAUTHORIZED:
@@ -25,7 +25,7 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> Any | Plan | None:
     if response.status_code == HTTPStatus.OK:
-        response_200 = Plan.from_dict(response.json())
+        response_200 = Plan.from_dict(client.json_decoder(response.content))
 
         return response_200
     if response.status_code == HTTPStatus.BAD_REQUEST:
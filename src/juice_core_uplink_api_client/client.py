@@ -4,6 +4,11 @@ from typing import Any
 import httpx
 from attrs import define, evolve, field
 
+from .decoding import JSONDecoder, get_json_decoder
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .transport import httpx_client_args, phase_timeout, pool_limits
+
 
 @define
 class Client:
@@ -32,9 +37,48 @@ class Client:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document. Can also be provided as a keyword
             argument to the constructor.
+        coalesce_requests: Whether or not identical GET requests sent while one of them is still in flight share
+            its response instead of reaching the server again. Can also be provided as a keyword argument to the
+            constructor.
+        conditional_requests: Whether or not to keep the responses carrying an ETag or Last-Modified header and
+            revalidate them with If-None-Match/If-Modified-Since, reusing the kept body on a 304. At most 128
+            responses and 32 MiB of bodies are kept (see transport.ValidatorStore). Can also be provided as a keyword
+            argument to the constructor.
+        retry: The RetryPolicy deciding which failed requests are sent again, and after how long. None (the default)
+            disables retries. Can also be provided as a keyword argument to the constructor.
+        rate_limiter: The RateLimiter throttling the requests sent, shared by the sync and async httpx clients (and by
+            any other client given the same instance). Can also be provided as a keyword argument to the constructor.
+        max_connections: Maximum number of connections open at the same time, httpx's default (100) if None. Can
+            also be provided as a keyword argument to the constructor.
+        max_keepalive_connections: Maximum number of idle connections kept open for reuse, httpx's default (20) if
+            None. Can also be provided as a keyword argument to the constructor.
+        keepalive_expiry: Seconds an idle connection is kept open, httpx's default (5) if None. Can also be provided
+            as a keyword argument to the constructor.
+        http2: Whether or not to negotiate HTTP/2 with the server, which requires the ``h2`` package (``pip install
+            httpx[http2]``). Can also be provided as a keyword argument to the constructor.
+        connect_timeout, read_timeout, write_timeout, pool_timeout: Seconds allowed for each phase of a request,
+            overriding ``timeout`` for that phase. Can also be provided as keyword arguments to the constructor.
+        json_decoder: The function decoding the JSON responses. Given as "orjson", "msgspec", "json" (the standard
+            library), "auto" (the default, the fastest one installed) or a function taking the raw body. Can also be
+            provided as a keyword argument to the constructor.
     """
 
     raise_on_unexpected_status: bool = field(default=False, kw_only=True)
+    coalesce_requests: bool = field(default=False, kw_only=True)
+    conditional_requests: bool = field(default=False, kw_only=True)
+    retry: RetryPolicy | None = field(default=None, kw_only=True)
+    rate_limiter: RateLimiter | None = field(default=None, kw_only=True)
+    max_connections: int | None = field(default=None, kw_only=True)
+    max_keepalive_connections: int | None = field(default=None, kw_only=True)
+    keepalive_expiry: float | None = field(default=None, kw_only=True)
+    http2: bool = field(default=False, kw_only=True)
+    connect_timeout: float | None = field(default=None, kw_only=True)
+    read_timeout: float | None = field(default=None, kw_only=True)
+    write_timeout: float | None = field(default=None, kw_only=True)
+    pool_timeout: float | None = field(default=None, kw_only=True)
+    json_decoder: JSONDecoder = field(
+        default="auto", converter=get_json_decoder, kw_only=True
+    )
     _base_url: str = field(alias="base_url")
     _cookies: dict[str, str] = field(factory=dict, kw_only=True, alias="cookies")
     _headers: dict[str, str] = field(factory=dict, kw_only=True, alias="headers")
@@ -67,11 +111,12 @@ class Client:
 
     def with_timeout(self, timeout: httpx.Timeout) -> "Client":
         """Get a new client matching this one with a new timeout (in seconds)"""
+        client = evolve(self, timeout=timeout)
         if self._client is not None:
-            self._client.timeout = timeout
+            self._client.timeout = client._httpx_timeout()
         if self._async_client is not None:
-            self._async_client.timeout = timeout
-        return evolve(self, timeout=timeout)
+            self._async_client.timeout = client._httpx_timeout()
+        return client
 
     def set_httpx_client(self, client: httpx.Client) -> "Client":
         """Manually the underlying httpx.Client
@@ -81,6 +126,32 @@ class Client:
         self._client = client
         return self
 
+    def _client_args(self, *, asynchronous: bool) -> dict[str, Any]:
+        return httpx_client_args(
+            self._httpx_args,
+            verify=self._verify_ssl,
+            asynchronous=asynchronous,
+            limits=pool_limits(
+                self.max_connections,
+                self.max_keepalive_connections,
+                self.keepalive_expiry,
+            ),
+            http2=self.http2,
+            coalesce_requests=self.coalesce_requests,
+            conditional_requests=self.conditional_requests,
+            retry=self.retry,
+            rate_limiter=self.rate_limiter,
+        )
+
+    def _httpx_timeout(self) -> httpx.Timeout | None:
+        return phase_timeout(
+            self._timeout,
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
     def get_httpx_client(self) -> httpx.Client:
         """Get the underlying httpx.Client, constructing a new one if not previously set"""
         if self._client is None:
@@ -88,10 +159,10 @@ class Client:
                 base_url=self._base_url,
                 cookies=self._cookies,
                 headers=self._headers,
-                timeout=self._timeout,
+                timeout=self._httpx_timeout(),
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **self._client_args(asynchronous=False),
             )
         return self._client
 
@@ -119,10 +190,10 @@ class Client:
                 base_url=self._base_url,
                 cookies=self._cookies,
                 headers=self._headers,
-                timeout=self._timeout,
+                timeout=self._httpx_timeout(),
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **self._client_args(asynchronous=True),
             )
         return self._async_client
 
@@ -163,12 +234,51 @@ class AuthenticatedClient:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document. Can also be provided as a keyword
             argument to the constructor.
+        coalesce_requests: Whether or not identical GET requests sent while one of them is still in flight share
+            its response instead of reaching the server again. Can also be provided as a keyword argument to the
+            constructor.
+        conditional_requests: Whether or not to keep the responses carrying an ETag or Last-Modified header and
+            revalidate them with If-None-Match/If-Modified-Since, reusing the kept body on a 304. At most 128
+            responses and 32 MiB of bodies are kept (see transport.ValidatorStore). Can also be provided as a keyword
+            argument to the constructor.
+        retry: The RetryPolicy deciding which failed requests are sent again, and after how long. None (the default)
+            disables retries. Can also be provided as a keyword argument to the constructor.
+        rate_limiter: The RateLimiter throttling the requests sent, shared by the sync and async httpx clients (and by
+            any other client given the same instance). Can also be provided as a keyword argument to the constructor.
+        max_connections: Maximum number of connections open at the same time, httpx's default (100) if None. Can
+            also be provided as a keyword argument to the constructor.
+        max_keepalive_connections: Maximum number of idle connections kept open for reuse, httpx's default (20) if
+            None. Can also be provided as a keyword argument to the constructor.
+        keepalive_expiry: Seconds an idle connection is kept open, httpx's default (5) if None. Can also be provided
+            as a keyword argument to the constructor.
+        http2: Whether or not to negotiate HTTP/2 with the server, which requires the ``h2`` package (``pip install
+            httpx[http2]``). Can also be provided as a keyword argument to the constructor.
+        connect_timeout, read_timeout, write_timeout, pool_timeout: Seconds allowed for each phase of a request,
+            overriding ``timeout`` for that phase. Can also be provided as keyword arguments to the constructor.
+        json_decoder: The function decoding the JSON responses. Given as "orjson", "msgspec", "json" (the standard
+            library), "auto" (the default, the fastest one installed) or a function taking the raw body. Can also be
+            provided as a keyword argument to the constructor.
         token: The token to use for authentication
         prefix: The prefix to use for the Authorization header
         auth_header_name: The name of the Authorization header
     """
 
     raise_on_unexpected_status: bool = field(default=False, kw_only=True)
+    coalesce_requests: bool = field(default=False, kw_only=True)
+    conditional_requests: bool = field(default=False, kw_only=True)
+    retry: RetryPolicy | None = field(default=None, kw_only=True)
+    rate_limiter: RateLimiter | None = field(default=None, kw_only=True)
+    max_connections: int | None = field(default=None, kw_only=True)
+    max_keepalive_connections: int | None = field(default=None, kw_only=True)
+    keepalive_expiry: float | None = field(default=None, kw_only=True)
+    http2: bool = field(default=False, kw_only=True)
+    connect_timeout: float | None = field(default=None, kw_only=True)
+    read_timeout: float | None = field(default=None, kw_only=True)
+    write_timeout: float | None = field(default=None, kw_only=True)
+    pool_timeout: float | None = field(default=None, kw_only=True)
+    json_decoder: JSONDecoder = field(
+        default="auto", converter=get_json_decoder, kw_only=True
+    )
     _base_url: str = field(alias="base_url")
     _cookies: dict[str, str] = field(factory=dict, kw_only=True, alias="cookies")
     _headers: dict[str, str] = field(factory=dict, kw_only=True, alias="headers")
@@ -205,11 +315,12 @@ class AuthenticatedClient:
 
     def with_timeout(self, timeout: httpx.Timeout) -> "AuthenticatedClient":
         """Get a new client matching this one with a new timeout (in seconds)"""
+        client = evolve(self, timeout=timeout)
         if self._client is not None:
-            self._client.timeout = timeout
+            self._client.timeout = client._httpx_timeout()
         if self._async_client is not None:
-            self._async_client.timeout = timeout
-        return evolve(self, timeout=timeout)
+            self._async_client.timeout = client._httpx_timeout()
+        return client
 
     def set_httpx_client(self, client: httpx.Client) -> "AuthenticatedClient":
         """Manually the underlying httpx.Client
@@ -219,6 +330,32 @@ class AuthenticatedClient:
         self._client = client
         return self
 
+    def _client_args(self, *, asynchronous: bool) -> dict[str, Any]:
+        return httpx_client_args(
+            self._httpx_args,
+            verify=self._verify_ssl,
+            asynchronous=asynchronous,
+            limits=pool_limits(
+                self.max_connections,
+                self.max_keepalive_connections,
+                self.keepalive_expiry,
+            ),
+            http2=self.http2,
+            coalesce_requests=self.coalesce_requests,
+            conditional_requests=self.conditional_requests,
+            retry=self.retry,
+            rate_limiter=self.rate_limiter,
+        )
+
+    def _httpx_timeout(self) -> httpx.Timeout | None:
+        return phase_timeout(
+            self._timeout,
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
     def get_httpx_client(self) -> httpx.Client:
         """Get the underlying httpx.Client, constructing a new one if not previously set"""
         if self._client is None:
@@ -229,10 +366,10 @@ class AuthenticatedClient:
                 base_url=self._base_url,
                 cookies=self._cookies,
                 headers=self._headers,
-                timeout=self._timeout,
+                timeout=self._httpx_timeout(),
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **self._client_args(asynchronous=False),
             )
         return self._client
 
@@ -265,10 +402,10 @@ class AuthenticatedClient:
                 base_url=self._base_url,
                 cookies=self._cookies,
                 headers=self._headers,
-                timeout=self._timeout,
+                timeout=self._httpx_timeout(),
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **self._client_args(asynchronous=True),
             )
         return self._async_client
 
@@ -0,0 +1,146 @@
+"""Contains the JSON decoders Client and AuthenticatedClient can parse responses with
+
+and the compiled decoders of the models, turning the decoded JSON into models.
+"""
+
+import json
+from collections.abc import Callable
+from functools import cache
+from http import HTTPStatus
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, get_args, get_origin, get_type_hints
+
+if TYPE_CHECKING:
+    import httpx
+
+    from .client import AuthenticatedClient, Client
+
+JSONDecoder = Callable[[bytes], Any]
+
+# tried in this order by the "auto" backend
+AUTO_BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _with_fallback(
+    loads: JSONDecoder, errors: tuple[type[Exception], ...]
+) -> JSONDecoder:
+    """Decode with ``loads``, retrying with the standard library on ``errors``
+
+    The fast decoders are stricter than ``json`` (e.g. they reject the NaN and
+    Infinity literals), such documents are still decoded as before.
+    """
+
+    def decode(content: bytes) -> Any:
+        try:
+            return loads(content)
+        except errors:
+            return json.loads(content)
+
+    return decode
+
+
+def _orjson() -> JSONDecoder:
+    import orjson
+
+    return _with_fallback(orjson.loads, (orjson.JSONDecodeError,))
+
+
+def _msgspec() -> JSONDecoder:
+    import msgspec
+
+    return _with_fallback(msgspec.json.decode, (msgspec.DecodeError,))
+
+
+def _json() -> JSONDecoder:
+    return json.loads
+
+
+JSON_BACKENDS: dict[str, Callable[[], JSONDecoder]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "json": _json,
+}
+
+
+def get_json_decoder(backend: str | JSONDecoder = "auto") -> JSONDecoder:
+    """The function decoding response bodies for ``backend``
+
+    Args:
+        backend: "orjson", "msgspec", "json" (the standard library), "auto" for the fastest one installed, or a
+            function taking the raw body and returning the decoded document.
+
+    Raises:
+        ValueError: If ``backend`` is unknown.
+        ImportError: If the library of ``backend`` is not installed.
+    """
+    if callable(backend):
+        return backend
+
+    if backend == "auto":
+        for name in AUTO_BACKENDS:
+            try:
+                return JSON_BACKENDS[name]()
+            except ImportError:
+                continue
+
+    if backend not in JSON_BACKENDS:
+        msg = f"Unknown JSON backend {backend!r}, expected one of {list(JSON_BACKENDS)}"
+        raise ValueError(msg)
+
+    return JSON_BACKENDS[backend]()
+
+
+def model_decoder(model: type) -> Callable[[Any], Any]:
+    """The compiled decoder of ``model``, its from_dict if it has none
+
+    The compiled decoders (generated from openapi.json by
+    scripts/generate_decoders.py) give the same models as from_dict without
+    its per call closures and copies.
+    """
+    from ._decoders import DECODERS
+
+    return DECODERS.get(model, model.from_dict)
+
+
+@cache
+def response_model(endpoint: ModuleType) -> tuple[type | None, bool]:
+    """The model returned by ``endpoint``, and whether it returns a list of them"""
+    returns = get_type_hints(endpoint.sync).get("return")
+    for option in get_args(returns) or (returns,):
+        many = get_origin(option) is list
+        model = get_args(option)[0] if many else option
+        if hasattr(model, "from_dict"):
+            return model, many
+    return None, False
+
+
+def decode_response(
+    endpoint: ModuleType,
+    *,
+    client: "AuthenticatedClient | Client",
+    response: "httpx.Response",
+) -> Any:
+    """The parsed result of ``response`` to a call of ``endpoint``
+
+    The same as ``endpoint.sync`` would return, the successful responses being
+    decoded by the compiled decoders.
+    """
+    model, many = response_model(endpoint)
+    if model is None or response.status_code != HTTPStatus.OK:
+        return endpoint._build_response(client=client, response=response).parsed  # noqa: SLF001
+
+    decode = model_decoder(model)
+    data = client.json_decoder(response.content)
+    if many:
+        return [decode(item) for item in data]
+    return decode(data)
+
+
+__all__ = [
+    "JSON_BACKENDS",
+    "JSONDecoder",
+    "decode_response",
+    "get_json_decoder",
+    "model_decoder",
+    "response_model",
+]
@@ -0,0 +1,119 @@
+"""Contains the lazy decoding of the list fields of the models"""
+
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar, overload
+
+T = TypeVar("T")
+
+_lazy: ContextVar[bool] = ContextVar("lazy_lists", default=False)
+_MISSING = object()
+
+
+@contextmanager
+def lazy_lists(enabled: bool = True) -> Iterator[None]:
+    """Decode the list fields of the models parsed in this block lazily
+
+    Within the block, ``from_dict`` turns the list fields of models (e.g. the
+    segment groups of a plan) into LazyList proxies over the raw JSON instead
+    of decoding all their items upfront.
+    """
+    token = _lazy.set(enabled)
+    try:
+        yield
+    finally:
+        _lazy.reset(token)
+
+
+class LazyList(Sequence[T]):
+    """A read-only list of models, each decoded from its JSON the first time it is accessed
+
+    Items are decoded in lazy mode as well, so their own list fields are also
+    LazyList.
+    """
+
+    __slots__ = ("_decode", "_items", "_raw")
+
+    def __init__(self, raw: list[Any], decode: Callable[[Any], T]) -> None:
+        self._raw = raw
+        self._decode = decode
+        self._items: list[Any] = [_MISSING] * len(raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "LazyList index out of range"
+            raise IndexError(msg)
+        return self._item(index)
+
+    def _item(self, index: int) -> T:
+        item = self._items[index]
+        if item is _MISSING:
+            token = _lazy.set(True)
+            try:
+                item = self._decode(self._raw[index])
+            finally:
+                _lazy.reset(token)
+            self._items[index] = item
+        return item
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(len(self)):
+            yield self._item(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyList | list):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self, other, strict=True)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def decoded(self) -> int:
+        """Number of items decoded so far"""
+        return sum(item is not _MISSING for item in self._items)
+
+    def __repr__(self) -> str:
+        return f"LazyList({len(self)} items, {self.decoded} decoded)"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # _MISSING is not the same object once unpickled: keep the raw items
+        # and the decoder, and the items decoded so far by index
+        decoded = {
+            i: item for i, item in enumerate(self._items) if item is not _MISSING
+        }
+        return LazyList, (self._raw, self._decode), decoded
+
+    def __setstate__(self, decoded: dict[int, T]) -> None:
+        for index, item in decoded.items():
+            self._items[index] = item
+
+
+def decode_list(raw: list[Any], decode: Callable[[Any], T]) -> list[T] | LazyList[T]:
+    """Decode the items of a list field, lazily within lazy_lists()"""
+    if _lazy.get():
+        return LazyList(raw, decode)
+    return [decode(item) for item in raw]
+
+
+__all__ = [
+    "LazyList",
+    "decode_list",
+    "lazy_lists",
+]
@@ -1,68 +1,158 @@
-"""Contains all the data models used in inputs/outputs"""
+"""Contains all the data models used in inputs/outputs
+
+The models are imported on first access, so that importing a single one does
+not load all the others.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api_version import ApiVersion
+    from .configuration import Configuration
+    from .configuration_item import ConfigurationItem
+    from .data_profile import DataProfile
+    from .detailed_scenario import DetailedScenario
+    from .detailed_scenario_list import DetailedScenarioList
+    from .engineering_segment import EngineeringSegment
+    from .engineering_segment_type import EngineeringSegmentType
+    from .event import Event
+    from .fdyn_event import FdynEvent
+    from .fdyn_event_definition import FdynEventDefinition
+    from .fdyn_event_file import FdynEventFile
+    from .get_plan_simphony_by_id_and_format_mode import (
+        GetPlanSimphonyByIdAndFormatMode,
+    )
+    from .get_plan_simphony_by_id_mode import GetPlanSimphonyByIdMode
+    from .get_plan_simphony_opps_by_id_and_format_mode import (
+        GetPlanSimphonyOppsByIdAndFormatMode,
+    )
+    from .get_plan_simphony_opps_by_id_mode import GetPlanSimphonyOppsByIdMode
+    from .get_plan_simphony_timeline_by_id_and_format_mode import (
+        GetPlanSimphonyTimelineByIdAndFormatMode,
+    )
+    from .get_plan_simphony_timeline_by_id_mode import GetPlanSimphonyTimelineByIdMode
+    from .instrument_membership import InstrumentMembership
+    from .instrument_membership_type import InstrumentMembershipType
+    from .instrument_resource_profile import InstrumentResourceProfile
+    from .instrument_type import InstrumentType
+    from .json_web_token import JSONWebToken
+    from .kernel_file import KernelFile
+    from .mode import Mode
+    from .observation_definition import ObservationDefinition
+    from .observation_definition_extend import ObservationDefinitionExtend
+    from .payload_checkout_unit import PayloadCheckoutUnit
+    from .payload_checkout_window import PayloadCheckoutWindow
+    from .phase import Phase
+    from .plan import Plan
+    from .plan_list import PlanList
+    from .plan_stats import PlanStats
+    from .platform_power_profile import PlatformPowerProfile
+    from .pln_view_file import PlnViewFile
+    from .pln_view_session import PlnViewSession
+    from .power_profile import PowerProfile
+    from .read_only_instrument_resource_profile import ReadOnlyInstrumentResourceProfile
+    from .read_only_plan import ReadOnlyPlan
+    from .read_only_resource_profile import ReadOnlyResourceProfile
+    from .read_only_segment_group import ReadOnlySegmentGroup
+    from .refresh_json_web_token import RefreshJSONWebToken
+    from .resource_category import ResourceCategory
+    from .resource_profile import ResourceProfile
+    from .segment import Segment
+    from .segment_definition import SegmentDefinition
+    from .segment_group import SegmentGroup
+    from .series_data import SeriesData
+    from .series_definition import SeriesDefinition
+    from .simphony_plan_swagger import SimphonyPlanSwagger
+    from .spice_info_swagger import SpiceInfoSwagger
+    from .trajectory import Trajectory
+    from .trajectory_list import TrajectoryList
+    from .unit import Unit
+    from .user import User
+    from .uvt_event import UvtEvent
+    from .uvt_event_file import UvtEventFile
+    from .working_group_membership import WorkingGroupMembership
+    from .working_group_membership_type import WorkingGroupMembershipType
+
+# the module defining each model
+_MODULES = {
+    "ApiVersion": "api_version",
+    "Configuration": "configuration",
+    "ConfigurationItem": "configuration_item",
+    "DataProfile": "data_profile",
+    "DetailedScenario": "detailed_scenario",
+    "DetailedScenarioList": "detailed_scenario_list",
+    "EngineeringSegment": "engineering_segment",
+    "EngineeringSegmentType": "engineering_segment_type",
+    "Event": "event",
+    "FdynEvent": "fdyn_event",
+    "FdynEventDefinition": "fdyn_event_definition",
+    "FdynEventFile": "fdyn_event_file",
+    "GetPlanSimphonyByIdAndFormatMode": "get_plan_simphony_by_id_and_format_mode",
+    "GetPlanSimphonyByIdMode": "get_plan_simphony_by_id_mode",
+    "GetPlanSimphonyOppsByIdAndFormatMode": "get_plan_simphony_opps_by_id_and_format_mode",
+    "GetPlanSimphonyOppsByIdMode": "get_plan_simphony_opps_by_id_mode",
+    "GetPlanSimphonyTimelineByIdAndFormatMode": "get_plan_simphony_timeline_by_id_and_format_mode",
+    "GetPlanSimphonyTimelineByIdMode": "get_plan_simphony_timeline_by_id_mode",
+    "InstrumentMembership": "instrument_membership",
+    "InstrumentMembershipType": "instrument_membership_type",
+    "InstrumentResourceProfile": "instrument_resource_profile",
+    "InstrumentType": "instrument_type",
+    "JSONWebToken": "json_web_token",
+    "KernelFile": "kernel_file",
+    "Mode": "mode",
+    "ObservationDefinition": "observation_definition",
+    "ObservationDefinitionExtend": "observation_definition_extend",
+    "PayloadCheckoutUnit": "payload_checkout_unit",
+    "PayloadCheckoutWindow": "payload_checkout_window",
+    "Phase": "phase",
+    "Plan": "plan",
+    "PlanList": "plan_list",
+    "PlanStats": "plan_stats",
+    "PlatformPowerProfile": "platform_power_profile",
+    "PlnViewFile": "pln_view_file",
+    "PlnViewSession": "pln_view_session",
+    "PowerProfile": "power_profile",
+    "ReadOnlyInstrumentResourceProfile": "read_only_instrument_resource_profile",
+    "ReadOnlyPlan": "read_only_plan",
+    "ReadOnlyResourceProfile": "read_only_resource_profile",
+    "ReadOnlySegmentGroup": "read_only_segment_group",
+    "RefreshJSONWebToken": "refresh_json_web_token",
+    "ResourceCategory": "resource_category",
+    "ResourceProfile": "resource_profile",
+    "Segment": "segment",
+    "SegmentDefinition": "segment_definition",
+    "SegmentGroup": "segment_group",
+    "SeriesData": "series_data",
+    "SeriesDefinition": "series_definition",
+    "SimphonyPlanSwagger": "simphony_plan_swagger",
+    "SpiceInfoSwagger": "spice_info_swagger",
+    "Trajectory": "trajectory",
+    "TrajectoryList": "trajectory_list",
+    "Unit": "unit",
+    "User": "user",
+    "UvtEvent": "uvt_event",
+    "UvtEventFile": "uvt_event_file",
+    "WorkingGroupMembership": "working_group_membership",
+    "WorkingGroupMembershipType": "working_group_membership_type",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    model = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = model
+    return model
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_MODULES])
 
-from .api_version import ApiVersion
-from .configuration import Configuration
-from .configuration_item import ConfigurationItem
-from .data_profile import DataProfile
-from .detailed_scenario import DetailedScenario
-from .detailed_scenario_list import DetailedScenarioList
-from .engineering_segment import EngineeringSegment
-from .engineering_segment_type import EngineeringSegmentType
-from .event import Event
-from .fdyn_event import FdynEvent
-from .fdyn_event_definition import FdynEventDefinition
-from .fdyn_event_file import FdynEventFile
-from .get_plan_simphony_by_id_and_format_mode import GetPlanSimphonyByIdAndFormatMode
-from .get_plan_simphony_by_id_mode import GetPlanSimphonyByIdMode
-from .get_plan_simphony_opps_by_id_and_format_mode import (
-    GetPlanSimphonyOppsByIdAndFormatMode,
-)
-from .get_plan_simphony_opps_by_id_mode import GetPlanSimphonyOppsByIdMode
-from .get_plan_simphony_timeline_by_id_and_format_mode import (
-    GetPlanSimphonyTimelineByIdAndFormatMode,
-)
-from .get_plan_simphony_timeline_by_id_mode import GetPlanSimphonyTimelineByIdMode
-from .instrument_membership import InstrumentMembership
-from .instrument_membership_type import InstrumentMembershipType
-from .instrument_resource_profile import InstrumentResourceProfile
-from .instrument_type import InstrumentType
-from .json_web_token import JSONWebToken
-from .kernel_file import KernelFile
-from .mode import Mode
-from .observation_definition import ObservationDefinition
-from .observation_definition_extend import ObservationDefinitionExtend
-from .payload_checkout_unit import PayloadCheckoutUnit
-from .payload_checkout_window import PayloadCheckoutWindow
-from .phase import Phase
-from .plan import Plan
-from .plan_list import PlanList
-from .plan_stats import PlanStats
-from .platform_power_profile import PlatformPowerProfile
-from .pln_view_file import PlnViewFile
-from .pln_view_session import PlnViewSession
-from .power_profile import PowerProfile
-from .read_only_instrument_resource_profile import ReadOnlyInstrumentResourceProfile
-from .read_only_plan import ReadOnlyPlan
-from .read_only_resource_profile import ReadOnlyResourceProfile
-from .read_only_segment_group import ReadOnlySegmentGroup
-from .refresh_json_web_token import RefreshJSONWebToken
-from .resource_category import ResourceCategory
-from .resource_profile import ResourceProfile
-from .segment import Segment
-from .segment_definition import SegmentDefinition
-from .segment_group import SegmentGroup
-from .series_data import SeriesData
-from .series_definition import SeriesDefinition
-from .simphony_plan_swagger import SimphonyPlanSwagger
-from .spice_info_swagger import SpiceInfoSwagger
-from .trajectory import Trajectory
-from .trajectory_list import TrajectoryList
-from .unit import Unit
-from .user import User
-from .uvt_event import UvtEvent
-from .uvt_event_file import UvtEventFile
-from .working_group_membership import WorkingGroupMembership
-from .working_group_membership_type import WorkingGroupMembershipType
 
 __all__ = (
     "ApiVersion",
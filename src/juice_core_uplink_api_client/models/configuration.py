@@ -3,7 +3,8 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..lazy import decode_list
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 if TYPE_CHECKING:
     from ..models.configuration_item import ConfigurationItem
@@ -17,7 +18,7 @@ T = TypeVar("T", bound="Configuration")
 
 
 @_attrs_define
-class Configuration:
+class Configuration(AdditionalProperties):
     """
     Attributes:
         version (str):
@@ -40,7 +41,9 @@ class Configuration:
     slew_policies: Unset | list["ConfigurationItem"] = UNSET
     timelines: Unset | list["ConfigurationItem"] = UNSET
     platform_power_profiles: Unset | list["PlatformPowerProfile"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         version = self.version
@@ -104,7 +107,7 @@ class Configuration:
                 platform_power_profiles.append(platform_power_profiles_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "version": version,
@@ -140,65 +143,35 @@ class Configuration:
         d = src_dict.copy()
         version = d.pop("version")
 
-        targets = []
         _targets = d.pop("targets", UNSET)
-        for targets_item_data in _targets or []:
-            targets_item = ConfigurationItem.from_dict(targets_item_data)
+        targets = decode_list(_targets or [], ConfigurationItem.from_dict)
 
-            targets.append(targets_item)
-
-        instruments = []
         _instruments = d.pop("instruments", UNSET)
-        for instruments_item_data in _instruments or []:
-            instruments_item = ConfigurationItem.from_dict(instruments_item_data)
-
-            instruments.append(instruments_item)
+        instruments = decode_list(_instruments or [], ConfigurationItem.from_dict)
 
-        units = []
         _units = d.pop("units", UNSET)
-        for units_item_data in _units or []:
-            units_item = Unit.from_dict(units_item_data)
-
-            units.append(units_item)
+        units = decode_list(_units or [], Unit.from_dict)
 
-        instrument_types = []
         _instrument_types = d.pop("instrument_types", UNSET)
-        for instrument_types_item_data in _instrument_types or []:
-            instrument_types_item = InstrumentType.from_dict(instrument_types_item_data)
-
-            instrument_types.append(instrument_types_item)
+        instrument_types = decode_list(
+            _instrument_types or [], InstrumentType.from_dict
+        )
 
-        resource_categories = []
         _resource_categories = d.pop("resource_categories", UNSET)
-        for resource_categories_item_data in _resource_categories or []:
-            resource_categories_item = ResourceCategory.from_dict(
-                resource_categories_item_data
-            )
-
-            resource_categories.append(resource_categories_item)
+        resource_categories = decode_list(
+            _resource_categories or [], ResourceCategory.from_dict
+        )
 
-        slew_policies = []
         _slew_policies = d.pop("slew_policies", UNSET)
-        for slew_policies_item_data in _slew_policies or []:
-            slew_policies_item = ConfigurationItem.from_dict(slew_policies_item_data)
-
-            slew_policies.append(slew_policies_item)
+        slew_policies = decode_list(_slew_policies or [], ConfigurationItem.from_dict)
 
-        timelines = []
         _timelines = d.pop("timelines", UNSET)
-        for timelines_item_data in _timelines or []:
-            timelines_item = ConfigurationItem.from_dict(timelines_item_data)
-
-            timelines.append(timelines_item)
+        timelines = decode_list(_timelines or [], ConfigurationItem.from_dict)
 
-        platform_power_profiles = []
         _platform_power_profiles = d.pop("platform_power_profiles", UNSET)
-        for platform_power_profiles_item_data in _platform_power_profiles or []:
-            platform_power_profiles_item = PlatformPowerProfile.from_dict(
-                platform_power_profiles_item_data
-            )
-
-            platform_power_profiles.append(platform_power_profiles_item)
+        platform_power_profiles = decode_list(
+            _platform_power_profiles or [], PlatformPowerProfile.from_dict
+        )
 
         configuration = cls(
             version=version,
@@ -212,21 +185,21 @@ class Configuration:
             platform_power_profiles=platform_power_profiles,
         )
 
-        configuration.additional_properties = d
+        configuration.additional_properties = d or EMPTY_PROPERTIES
         return configuration
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
@@ -3,13 +3,13 @@ from typing import Any, TypeVar, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 T = TypeVar("T", bound="DetailedScenario")
 
 
 @_attrs_define
-class DetailedScenario:
+class DetailedScenario(AdditionalProperties):
     """
     Attributes:
         trajectory (str):
@@ -30,7 +30,9 @@ class DetailedScenario:
     scenario_json_file: None | Unset | str = UNSET
     start: None | Unset | str = UNSET
     end: None | Unset | str = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         trajectory = self.trajectory
@@ -66,7 +68,7 @@ class DetailedScenario:
             end = self.end
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "trajectory": trajectory,
@@ -147,21 +149,21 @@ class DetailedScenario:
             end=end,
         )
 
-        detailed_scenario.additional_properties = d
+        detailed_scenario.additional_properties = d or EMPTY_PROPERTIES
         return detailed_scenario
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
@@ -3,13 +3,13 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 T = TypeVar("T", bound="EngineeringSegment")
 
 
 @_attrs_define
-class EngineeringSegment:
+class EngineeringSegment(AdditionalProperties):
     """
     Attributes:
         start (str):
@@ -24,7 +24,9 @@ class EngineeringSegment:
     segment_type: Unset | str = UNSET
     power: Unset | float = UNSET
     segment_type_raw: Unset | str = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         start = self.start
@@ -38,7 +40,7 @@ class EngineeringSegment:
         segment_type_raw = self.segment_type_raw
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "start": start,
@@ -75,21 +77,21 @@ class EngineeringSegment:
             segment_type_raw=segment_type_raw,
         )
 
-        engineering_segment.additional_properties = d
+        engineering_segment.additional_properties = d or EMPTY_PROPERTIES
         return engineering_segment
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
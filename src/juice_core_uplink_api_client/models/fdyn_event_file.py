@@ -3,13 +3,13 @@ from typing import Any, TypeVar, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 T = TypeVar("T", bound="FdynEventFile")
 
 
 @_attrs_define
-class FdynEventFile:
+class FdynEventFile(AdditionalProperties):
     """
     Attributes:
         mnemonic (str):
@@ -20,7 +20,9 @@ class FdynEventFile:
     mnemonic: str
     name: str
     description: None | Unset | str = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         mnemonic = self.mnemonic
@@ -34,7 +36,7 @@ class FdynEventFile:
             description = self.description
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "mnemonic": mnemonic,
@@ -68,21 +70,21 @@ class FdynEventFile:
             description=description,
         )
 
-        fdyn_event_file.additional_properties = d
+        fdyn_event_file.additional_properties = d or EMPTY_PROPERTIES
         return fdyn_event_file
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
@@ -4,13 +4,13 @@ from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..models.instrument_membership_type import InstrumentMembershipType
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 T = TypeVar("T", bound="InstrumentMembership")
 
 
 @_attrs_define
-class InstrumentMembership:
+class InstrumentMembership(AdditionalProperties):
     """
     Attributes:
         type (InstrumentMembershipType):
@@ -19,7 +19,9 @@ class InstrumentMembership:
 
     type: InstrumentMembershipType
     instrument: Unset | str = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         type = self.type.value
@@ -27,7 +29,7 @@ class InstrumentMembership:
         instrument = self.instrument
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "type": type,
@@ -50,21 +52,21 @@ class InstrumentMembership:
             instrument=instrument,
         )
 
-        instrument_membership.additional_properties = d
+        instrument_membership.additional_properties = d or EMPTY_PROPERTIES
         return instrument_membership
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
@@ -3,13 +3,13 @@ from typing import Any, TypeVar, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 T = TypeVar("T", bound="InstrumentResourceProfile")
 
 
 @_attrs_define
-class InstrumentResourceProfile:
+class InstrumentResourceProfile(AdditionalProperties):
     """
     Attributes:
         category (str):
@@ -24,7 +24,9 @@ class InstrumentResourceProfile:
     unit: str
     instrument: str
     value: None | Unset | float = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         category = self.category
@@ -42,7 +44,7 @@ class InstrumentResourceProfile:
             value = self.value
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "category": category,
@@ -84,21 +86,21 @@ class InstrumentResourceProfile:
             value=value,
         )
 
-        instrument_resource_profile.additional_properties = d
+        instrument_resource_profile.additional_properties = d or EMPTY_PROPERTIES
         return instrument_resource_profile
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
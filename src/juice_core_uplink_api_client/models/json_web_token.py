@@ -3,11 +3,13 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES, AdditionalProperties
+
 T = TypeVar("T", bound="JSONWebToken")
 
 
 @_attrs_define
-class JSONWebToken:
+class JSONWebToken(AdditionalProperties):
     """
     Attributes:
         username (str):
@@ -16,7 +18,9 @@ class JSONWebToken:
 
     username: str
     password: str
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         username = self.username
@@ -24,7 +28,7 @@ class JSONWebToken:
         password = self.password
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "username": username,
@@ -46,21 +50,21 @@ class JSONWebToken:
             password=password,
         )
 
-        json_web_token.additional_properties = d
+        json_web_token.additional_properties = d or EMPTY_PROPERTIES
         return json_web_token
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
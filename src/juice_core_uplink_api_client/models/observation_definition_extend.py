@@ -3,7 +3,8 @@ from typing import TYPE_CHECKING, Any, TypeVar, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..lazy import LazyList, decode_list
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 if TYPE_CHECKING:
     from ..models.data_profile import DataProfile
@@ -14,7 +15,7 @@ T = TypeVar("T", bound="ObservationDefinitionExtend")
 
 
 @_attrs_define
-class ObservationDefinitionExtend:
+class ObservationDefinitionExtend(AdditionalProperties):
     """
     Attributes:
         name (str):
@@ -64,7 +65,9 @@ class ObservationDefinitionExtend:
     support_plot_1: None | Unset | str = UNSET
     support_plot_2: None | Unset | str = UNSET
     support_plot_3: None | Unset | str = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         name = self.name
@@ -94,7 +97,7 @@ class ObservationDefinitionExtend:
         data_profile: list[dict[str, Any]] | None | Unset
         if isinstance(self.data_profile, Unset):
             data_profile = UNSET
-        elif isinstance(self.data_profile, list):
+        elif isinstance(self.data_profile, list | LazyList):
             data_profile = []
             for data_profile_type_0_item_data in self.data_profile:
                 data_profile_type_0_item = data_profile_type_0_item_data.to_dict()
@@ -106,7 +109,7 @@ class ObservationDefinitionExtend:
         power_profile: list[dict[str, Any]] | None | Unset
         if isinstance(self.power_profile, Unset):
             power_profile = UNSET
-        elif isinstance(self.power_profile, list):
+        elif isinstance(self.power_profile, list | LazyList):
             power_profile = []
             for power_profile_type_0_item_data in self.power_profile:
                 power_profile_type_0_item = power_profile_type_0_item_data.to_dict()
@@ -176,7 +179,7 @@ class ObservationDefinitionExtend:
             support_plot_3 = self.support_plot_3
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -261,14 +264,10 @@ class ObservationDefinitionExtend:
             try:
                 if not isinstance(data, list):
                     raise TypeError
-                data_profile_type_0 = []
                 _data_profile_type_0 = data
-                for data_profile_type_0_item_data in _data_profile_type_0:
-                    data_profile_type_0_item = DataProfile.from_dict(
-                        data_profile_type_0_item_data
-                    )
-
-                    data_profile_type_0.append(data_profile_type_0_item)
+                data_profile_type_0 = decode_list(
+                    _data_profile_type_0, DataProfile.from_dict
+                )
 
                 return data_profile_type_0
             except:  # noqa: E722
@@ -285,14 +284,10 @@ class ObservationDefinitionExtend:
             try:
                 if not isinstance(data, list):
                     raise TypeError
-                power_profile_type_0 = []
                 _power_profile_type_0 = data
-                for power_profile_type_0_item_data in _power_profile_type_0:
-                    power_profile_type_0_item = PowerProfile.from_dict(
-                        power_profile_type_0_item_data
-                    )
-
-                    power_profile_type_0.append(power_profile_type_0_item)
+                power_profile_type_0 = decode_list(
+                    _power_profile_type_0, PowerProfile.from_dict
+                )
 
                 return power_profile_type_0
             except:  # noqa: E722
@@ -416,21 +411,21 @@ class ObservationDefinitionExtend:
             support_plot_3=support_plot_3,
         )
 
-        observation_definition_extend.additional_properties = d
+        observation_definition_extend.additional_properties = d or EMPTY_PROPERTIES
         return observation_definition_extend
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
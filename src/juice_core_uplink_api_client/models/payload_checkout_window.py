@@ -3,13 +3,13 @@ from typing import Any, TypeVar, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 T = TypeVar("T", bound="PayloadCheckoutWindow")
 
 
 @_attrs_define
-class PayloadCheckoutWindow:
+class PayloadCheckoutWindow(AdditionalProperties):
     """
     Attributes:
         name (str):
@@ -36,7 +36,9 @@ class PayloadCheckoutWindow:
     end: None | Unset | str = UNSET
     ref_event_name: None | Unset | str = UNSET
     ref_event_counter: None | Unset | int = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         name = self.name
@@ -98,7 +100,7 @@ class PayloadCheckoutWindow:
             ref_event_counter = self.ref_event_counter
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -228,21 +230,21 @@ class PayloadCheckoutWindow:
             ref_event_counter=ref_event_counter,
         )
 
-        payload_checkout_window.additional_properties = d
+        payload_checkout_window.additional_properties = d or EMPTY_PROPERTIES
         return payload_checkout_window
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
@@ -3,7 +3,8 @@ from typing import TYPE_CHECKING, Any, TypeVar, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..lazy import decode_list
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 if TYPE_CHECKING:
     from ..models.segment import Segment
@@ -14,7 +15,7 @@ T = TypeVar("T", bound="Plan")
 
 
 @_attrs_define
-class Plan:
+class Plan(AdditionalProperties):
     """
     Attributes:
         trajectory (str):
@@ -41,7 +42,9 @@ class Plan:
     default_slew_policy: Unset | str = UNSET
     spice_info: Unset | str = UNSET
     refine_log: Unset | str = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         trajectory = self.trajectory
@@ -77,7 +80,7 @@ class Plan:
         refine_log = self.refine_log
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "trajectory": trajectory,
@@ -115,19 +118,11 @@ class Plan:
 
         is_public = d.pop("is_public")
 
-        segments = []
         _segments = d.pop("segments")
-        for segments_item_data in _segments:
-            segments_item = Segment.from_dict(segments_item_data)
-
-            segments.append(segments_item)
+        segments = decode_list(_segments, Segment.from_dict)
 
-        segment_groups = []
         _segment_groups = d.pop("segment_groups")
-        for segment_groups_item_data in _segment_groups:
-            segment_groups_item = SegmentGroup.from_dict(segment_groups_item_data)
-
-            segment_groups.append(segment_groups_item)
+        segment_groups = decode_list(_segment_groups, SegmentGroup.from_dict)
 
         def _parse_description(data: object) -> None | Unset | str:
             if data is None:
@@ -160,21 +155,21 @@ class Plan:
             refine_log=refine_log,
         )
 
-        plan.additional_properties = d
+        plan.additional_properties = d or EMPTY_PROPERTIES
         return plan
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
@@ -3,13 +3,13 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 T = TypeVar("T", bound="PlanStats")
 
 
 @_attrs_define
-class PlanStats:
+class PlanStats(AdditionalProperties):
     """
     Attributes:
         segment_number (Union[Unset, str]):
@@ -24,7 +24,9 @@ class PlanStats:
     start: Unset | str = UNSET
     end: Unset | str = UNSET
     stats: Unset | str = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         segment_number = self.segment_number
@@ -38,7 +40,7 @@ class PlanStats:
         stats = self.stats
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update({})
         if segment_number is not UNSET:
             field_dict["segment_number"] = segment_number
@@ -74,21 +76,21 @@ class PlanStats:
             stats=stats,
         )
 
-        plan_stats.additional_properties = d
+        plan_stats.additional_properties = d or EMPTY_PROPERTIES
         return plan_stats
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
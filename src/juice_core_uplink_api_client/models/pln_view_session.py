@@ -3,13 +3,13 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 T = TypeVar("T", bound="PlnViewSession")
 
 
 @_attrs_define
-class PlnViewSession:
+class PlnViewSession(AdditionalProperties):
     """
     Attributes:
         ground_station (str):
@@ -28,7 +28,9 @@ class PlnViewSession:
     tracking_end: Unset | str = UNSET
     description: Unset | str = UNSET
     origin: Unset | str = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         ground_station = self.ground_station
@@ -46,7 +48,7 @@ class PlnViewSession:
         origin = self.origin
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "ground_station": ground_station,
@@ -94,21 +96,21 @@ class PlnViewSession:
             origin=origin,
         )
 
-        pln_view_session.additional_properties = d
+        pln_view_session.additional_properties = d or EMPTY_PROPERTIES
         return pln_view_session
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
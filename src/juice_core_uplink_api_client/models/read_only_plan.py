@@ -3,7 +3,8 @@ from typing import TYPE_CHECKING, Any, TypeVar, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..lazy import decode_list
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 if TYPE_CHECKING:
     from ..models.read_only_segment_group import ReadOnlySegmentGroup
@@ -13,7 +14,7 @@ T = TypeVar("T", bound="ReadOnlyPlan")
 
 
 @_attrs_define
-class ReadOnlyPlan:
+class ReadOnlyPlan(AdditionalProperties):
     """
     Attributes:
         trajectory (str):
@@ -40,7 +41,9 @@ class ReadOnlyPlan:
     spice_info: Unset | str = UNSET
     default_block: Unset | str = UNSET
     default_slew_policy: Unset | str = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         trajectory = self.trajectory
@@ -73,7 +76,7 @@ class ReadOnlyPlan:
         default_slew_policy = self.default_slew_policy
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "trajectory": trajectory,
@@ -111,14 +114,8 @@ class ReadOnlyPlan:
 
         is_public = d.pop("is_public")
 
-        segment_groups = []
         _segment_groups = d.pop("segment_groups")
-        for segment_groups_item_data in _segment_groups:
-            segment_groups_item = ReadOnlySegmentGroup.from_dict(
-                segment_groups_item_data
-            )
-
-            segment_groups.append(segment_groups_item)
+        segment_groups = decode_list(_segment_groups, ReadOnlySegmentGroup.from_dict)
 
         def _parse_description(data: object) -> None | Unset | str:
             if data is None:
@@ -153,21 +150,21 @@ class ReadOnlyPlan:
             default_slew_policy=default_slew_policy,
         )
 
-        read_only_plan.additional_properties = d
+        read_only_plan.additional_properties = d or EMPTY_PROPERTIES
         return read_only_plan
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
@@ -3,7 +3,8 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..lazy import decode_list
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 if TYPE_CHECKING:
     from ..models.read_only_instrument_resource_profile import (
@@ -16,7 +17,7 @@ T = TypeVar("T", bound="ReadOnlySegmentGroup")
 
 
 @_attrs_define
-class ReadOnlySegmentGroup:
+class ReadOnlySegmentGroup(AdditionalProperties):
     """
     Attributes:
         name (str):
@@ -31,7 +32,9 @@ class ReadOnlySegmentGroup:
     resources: list["ReadOnlyResourceProfile"]
     instrument_resources: list["ReadOnlyInstrumentResourceProfile"]
     platform_power_profile: Unset | int = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         name = self.name
@@ -51,7 +54,7 @@ class ReadOnlySegmentGroup:
         platform_power_profile = self.platform_power_profile
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -77,21 +80,13 @@ class ReadOnlySegmentGroup:
 
         mnemonic = d.pop("mnemonic")
 
-        resources = []
         _resources = d.pop("resources")
-        for resources_item_data in _resources:
-            resources_item = ReadOnlyResourceProfile.from_dict(resources_item_data)
-
-            resources.append(resources_item)
+        resources = decode_list(_resources, ReadOnlyResourceProfile.from_dict)
 
-        instrument_resources = []
         _instrument_resources = d.pop("instrument_resources")
-        for instrument_resources_item_data in _instrument_resources:
-            instrument_resources_item = ReadOnlyInstrumentResourceProfile.from_dict(
-                instrument_resources_item_data
-            )
-
-            instrument_resources.append(instrument_resources_item)
+        instrument_resources = decode_list(
+            _instrument_resources, ReadOnlyInstrumentResourceProfile.from_dict
+        )
 
         platform_power_profile = d.pop("platform_power_profile", UNSET)
 
@@ -103,21 +98,21 @@ class ReadOnlySegmentGroup:
             platform_power_profile=platform_power_profile,
         )
 
-        read_only_segment_group.additional_properties = d
+        read_only_segment_group.additional_properties = d or EMPTY_PROPERTIES
         return read_only_segment_group
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
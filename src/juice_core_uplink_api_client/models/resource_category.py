@@ -3,11 +3,13 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import EMPTY_PROPERTIES, AdditionalProperties
+
 T = TypeVar("T", bound="ResourceCategory")
 
 
 @_attrs_define
-class ResourceCategory:
+class ResourceCategory(AdditionalProperties):
     """
     Attributes:
         name (str):
@@ -18,7 +20,9 @@ class ResourceCategory:
     name: str
     mnemonic: str
     category_type: str
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         name = self.name
@@ -28,7 +32,7 @@ class ResourceCategory:
         category_type = self.category_type
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -54,21 +58,21 @@ class ResourceCategory:
             category_type=category_type,
         )
 
-        resource_category.additional_properties = d
+        resource_category.additional_properties = d or EMPTY_PROPERTIES
         return resource_category
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
@@ -3,7 +3,8 @@ from typing import TYPE_CHECKING, Any, TypeVar, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..lazy import LazyList, decode_list
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 if TYPE_CHECKING:
     from ..models.instrument_resource_profile import InstrumentResourceProfile
@@ -14,7 +15,7 @@ T = TypeVar("T", bound="Segment")
 
 
 @_attrs_define
-class Segment:
+class Segment(AdditionalProperties):
     """
     Attributes:
         start (str):
@@ -57,7 +58,9 @@ class Segment:
     origin: None | Unset | str = UNSET
     prime: None | Unset | str = UNSET
     riders: Unset | list[None | str] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         start = self.start
@@ -77,7 +80,7 @@ class Segment:
         resources: list[dict[str, Any]] | None | Unset
         if isinstance(self.resources, Unset):
             resources = UNSET
-        elif isinstance(self.resources, list):
+        elif isinstance(self.resources, list | LazyList):
             resources = []
             for resources_type_0_item_data in self.resources:
                 resources_type_0_item = resources_type_0_item_data.to_dict()
@@ -89,7 +92,7 @@ class Segment:
         instrument_resources: list[dict[str, Any]] | None | Unset
         if isinstance(self.instrument_resources, Unset):
             instrument_resources = UNSET
-        elif isinstance(self.instrument_resources, list):
+        elif isinstance(self.instrument_resources, list | LazyList):
             instrument_resources = []
             for instrument_resources_type_0_item_data in self.instrument_resources:
                 instrument_resources_type_0_item = (
@@ -163,7 +166,7 @@ class Segment:
                 riders.append(riders_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "start": start,
@@ -231,14 +234,10 @@ class Segment:
             try:
                 if not isinstance(data, list):
                     raise TypeError
-                resources_type_0 = []
                 _resources_type_0 = data
-                for resources_type_0_item_data in _resources_type_0:
-                    resources_type_0_item = ResourceProfile.from_dict(
-                        resources_type_0_item_data
-                    )
-
-                    resources_type_0.append(resources_type_0_item)
+                resources_type_0 = decode_list(
+                    _resources_type_0, ResourceProfile.from_dict
+                )
 
                 return resources_type_0
             except:  # noqa: E722
@@ -257,18 +256,10 @@ class Segment:
             try:
                 if not isinstance(data, list):
                     raise TypeError
-                instrument_resources_type_0 = []
                 _instrument_resources_type_0 = data
-                for (
-                    instrument_resources_type_0_item_data
-                ) in _instrument_resources_type_0:
-                    instrument_resources_type_0_item = (
-                        InstrumentResourceProfile.from_dict(
-                            instrument_resources_type_0_item_data
-                        )
-                    )
-
-                    instrument_resources_type_0.append(instrument_resources_type_0_item)
+                instrument_resources_type_0 = decode_list(
+                    _instrument_resources_type_0, InstrumentResourceProfile.from_dict
+                )
 
                 return instrument_resources_type_0
             except:  # noqa: E722
@@ -401,21 +392,21 @@ class Segment:
             riders=riders,
         )
 
-        segment.additional_properties = d
+        segment.additional_properties = d or EMPTY_PROPERTIES
         return segment
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
@@ -3,7 +3,8 @@ from typing import TYPE_CHECKING, Any, TypeVar, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..lazy import LazyList, decode_list
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 if TYPE_CHECKING:
     from ..models.instrument_resource_profile import InstrumentResourceProfile
@@ -14,7 +15,7 @@ T = TypeVar("T", bound="SegmentDefinition")
 
 
 @_attrs_define
-class SegmentDefinition:
+class SegmentDefinition(AdditionalProperties):
     """
     Attributes:
         name (str):
@@ -51,7 +52,9 @@ class SegmentDefinition:
     scheduler_flag: None | Unset | bool = UNSET
     scheduling_priority: None | Unset | int = UNSET
     color: None | Unset | str = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         name = self.name
@@ -73,7 +76,7 @@ class SegmentDefinition:
         resources: list[dict[str, Any]] | None | Unset
         if isinstance(self.resources, Unset):
             resources = UNSET
-        elif isinstance(self.resources, list):
+        elif isinstance(self.resources, list | LazyList):
             resources = []
             for resources_type_0_item_data in self.resources:
                 resources_type_0_item = resources_type_0_item_data.to_dict()
@@ -85,7 +88,7 @@ class SegmentDefinition:
         instrument_resources: list[dict[str, Any]] | None | Unset
         if isinstance(self.instrument_resources, Unset):
             instrument_resources = UNSET
-        elif isinstance(self.instrument_resources, list):
+        elif isinstance(self.instrument_resources, list | LazyList):
             instrument_resources = []
             for instrument_resources_type_0_item_data in self.instrument_resources:
                 instrument_resources_type_0_item = (
@@ -133,7 +136,7 @@ class SegmentDefinition:
             color = self.color
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -201,14 +204,10 @@ class SegmentDefinition:
             try:
                 if not isinstance(data, list):
                     raise TypeError
-                resources_type_0 = []
                 _resources_type_0 = data
-                for resources_type_0_item_data in _resources_type_0:
-                    resources_type_0_item = ResourceProfile.from_dict(
-                        resources_type_0_item_data
-                    )
-
-                    resources_type_0.append(resources_type_0_item)
+                resources_type_0 = decode_list(
+                    _resources_type_0, ResourceProfile.from_dict
+                )
 
                 return resources_type_0
             except:  # noqa: E722
@@ -323,21 +322,21 @@ class SegmentDefinition:
             color=color,
         )
 
-        segment_definition.additional_properties = d
+        segment_definition.additional_properties = d or EMPTY_PROPERTIES
         return segment_definition
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
@@ -3,13 +3,13 @@ from typing import Any, TypeVar, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 T = TypeVar("T", bound="SeriesData")
 
 
 @_attrs_define
-class SeriesData:
+class SeriesData(AdditionalProperties):
     """
     Attributes:
         epoch (Union[None, Unset, str]):
@@ -18,7 +18,9 @@ class SeriesData:
 
     epoch: None | Unset | str = UNSET
     value: None | Unset | float = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         epoch: None | Unset | str
@@ -34,7 +36,7 @@ class SeriesData:
             value = self.value
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update({})
         if epoch is not UNSET:
             field_dict["epoch"] = epoch
@@ -70,21 +72,21 @@ class SeriesData:
             value=value,
         )
 
-        series_data.additional_properties = d
+        series_data.additional_properties = d or EMPTY_PROPERTIES
         return series_data
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
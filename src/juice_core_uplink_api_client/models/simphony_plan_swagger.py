@@ -3,7 +3,8 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..lazy import decode_list
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 if TYPE_CHECKING:
     from ..models.segment import Segment
@@ -14,7 +15,7 @@ T = TypeVar("T", bound="SimphonyPlanSwagger")
 
 
 @_attrs_define
-class SimphonyPlanSwagger:
+class SimphonyPlanSwagger(AdditionalProperties):
     """
     Attributes:
         trajectory (str):
@@ -39,7 +40,9 @@ class SimphonyPlanSwagger:
     default_slew_policy: str
     name: Unset | str = UNSET
     description: Unset | str = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         trajectory = self.trajectory
@@ -72,7 +75,7 @@ class SimphonyPlanSwagger:
         description = self.description
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "trajectory": trajectory,
@@ -104,28 +107,14 @@ class SimphonyPlanSwagger:
 
         is_public = d.pop("is_public")
 
-        segment_timeline = []
         _segment_timeline = d.pop("segment_timeline")
-        for segment_timeline_item_data in _segment_timeline:
-            segment_timeline_item = Segment.from_dict(segment_timeline_item_data)
-
-            segment_timeline.append(segment_timeline_item)
+        segment_timeline = decode_list(_segment_timeline, Segment.from_dict)
 
-        segment_opportunities = []
         _segment_opportunities = d.pop("segment_opportunities")
-        for segment_opportunities_item_data in _segment_opportunities:
-            segment_opportunities_item = Segment.from_dict(
-                segment_opportunities_item_data
-            )
+        segment_opportunities = decode_list(_segment_opportunities, Segment.from_dict)
 
-            segment_opportunities.append(segment_opportunities_item)
-
-        spice_info = []
         _spice_info = d.pop("spice_info")
-        for spice_info_item_data in _spice_info:
-            spice_info_item = SpiceInfoSwagger.from_dict(spice_info_item_data)
-
-            spice_info.append(spice_info_item)
+        spice_info = decode_list(_spice_info, SpiceInfoSwagger.from_dict)
 
         default_block = d.pop("default_block")
 
@@ -148,21 +137,21 @@ class SimphonyPlanSwagger:
             description=description,
         )
 
-        simphony_plan_swagger.additional_properties = d
+        simphony_plan_swagger.additional_properties = d or EMPTY_PROPERTIES
         return simphony_plan_swagger
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
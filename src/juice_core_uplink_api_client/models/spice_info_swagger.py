@@ -3,6 +3,9 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..lazy import decode_list
+from ..types import EMPTY_PROPERTIES, AdditionalProperties
+
 if TYPE_CHECKING:
     from ..models.kernel_file import KernelFile
 
@@ -11,7 +14,7 @@ T = TypeVar("T", bound="SpiceInfoSwagger")
 
 
 @_attrs_define
-class SpiceInfoSwagger:
+class SpiceInfoSwagger(AdditionalProperties):
     """
     Attributes:
         kernels (List['KernelFile']):
@@ -22,7 +25,9 @@ class SpiceInfoSwagger:
     kernels: list["KernelFile"]
     skd_version: str
     metakernel: str
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         kernels = []
@@ -35,7 +40,7 @@ class SpiceInfoSwagger:
         metakernel = self.metakernel
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "kernels": kernels,
@@ -51,12 +56,8 @@ class SpiceInfoSwagger:
         from ..models.kernel_file import KernelFile
 
         d = src_dict.copy()
-        kernels = []
         _kernels = d.pop("kernels")
-        for kernels_item_data in _kernels:
-            kernels_item = KernelFile.from_dict(kernels_item_data)
-
-            kernels.append(kernels_item)
+        kernels = decode_list(_kernels, KernelFile.from_dict)
 
         skd_version = d.pop("skd_version")
 
@@ -68,21 +69,21 @@ class SpiceInfoSwagger:
             metakernel=metakernel,
         )
 
-        spice_info_swagger.additional_properties = d
+        spice_info_swagger.additional_properties = d or EMPTY_PROPERTIES
         return spice_info_swagger
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
@@ -3,7 +3,8 @@ from typing import TYPE_CHECKING, Any, TypeVar, cast
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..lazy import decode_list
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 if TYPE_CHECKING:
     from ..models.phase import Phase
@@ -13,7 +14,7 @@ T = TypeVar("T", bound="Trajectory")
 
 
 @_attrs_define
-class Trajectory:
+class Trajectory(AdditionalProperties):
     """
     Attributes:
         name (str):
@@ -34,7 +35,9 @@ class Trajectory:
     trajectory_type: Unset | str = UNSET
     spice_info: Unset | str = UNSET
     ptr_file: Unset | str = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         name = self.name
@@ -61,7 +64,7 @@ class Trajectory:
         ptr_file = self.ptr_file
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -91,12 +94,8 @@ class Trajectory:
 
         mnemonic = d.pop("mnemonic")
 
-        phases = []
         _phases = d.pop("phases")
-        for phases_item_data in _phases:
-            phases_item = Phase.from_dict(phases_item_data)
-
-            phases.append(phases_item)
+        phases = decode_list(_phases, Phase.from_dict)
 
         id = d.pop("id", UNSET)
 
@@ -126,21 +125,21 @@ class Trajectory:
             ptr_file=ptr_file,
         )
 
-        trajectory.additional_properties = d
+        trajectory.additional_properties = d or EMPTY_PROPERTIES
         return trajectory
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
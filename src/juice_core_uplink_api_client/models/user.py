@@ -3,7 +3,8 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..lazy import decode_list
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 if TYPE_CHECKING:
     from ..models.instrument_membership import InstrumentMembership
@@ -14,7 +15,7 @@ T = TypeVar("T", bound="User")
 
 
 @_attrs_define
-class User:
+class User(AdditionalProperties):
     """
     Attributes:
         working_groups (List['WorkingGroupMembership']):
@@ -33,7 +34,9 @@ class User:
     first_name: Unset | str = UNSET
     last_name: Unset | str = UNSET
     role: Unset | str = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         working_groups = []
@@ -57,7 +60,7 @@ class User:
         role = self.role
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "working_groups": working_groups,
@@ -83,21 +86,11 @@ class User:
         from ..models.working_group_membership import WorkingGroupMembership
 
         d = src_dict.copy()
-        working_groups = []
         _working_groups = d.pop("working_groups")
-        for working_groups_item_data in _working_groups:
-            working_groups_item = WorkingGroupMembership.from_dict(
-                working_groups_item_data
-            )
-
-            working_groups.append(working_groups_item)
+        working_groups = decode_list(_working_groups, WorkingGroupMembership.from_dict)
 
-        instruments = []
         _instruments = d.pop("instruments")
-        for instruments_item_data in _instruments:
-            instruments_item = InstrumentMembership.from_dict(instruments_item_data)
-
-            instruments.append(instruments_item)
+        instruments = decode_list(_instruments, InstrumentMembership.from_dict)
 
         username = d.pop("username", UNSET)
 
@@ -119,21 +112,21 @@ class User:
             role=role,
         )
 
-        user.additional_properties = d
+        user.additional_properties = d or EMPTY_PROPERTIES
         return user
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
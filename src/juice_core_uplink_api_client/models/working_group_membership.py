@@ -4,13 +4,13 @@ from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..models.working_group_membership_type import WorkingGroupMembershipType
-from ..types import UNSET, Unset
+from ..types import EMPTY_PROPERTIES, UNSET, AdditionalProperties, Unset
 
 T = TypeVar("T", bound="WorkingGroupMembership")
 
 
 @_attrs_define
-class WorkingGroupMembership:
+class WorkingGroupMembership(AdditionalProperties):
     """
     Attributes:
         type (WorkingGroupMembershipType):
@@ -19,7 +19,9 @@ class WorkingGroupMembership:
 
     type: WorkingGroupMembershipType
     working_group: Unset | str = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] = _attrs_field(
+        init=False, default=EMPTY_PROPERTIES
+    )
 
     def to_dict(self) -> dict[str, Any]:
         type = self.type.value
@@ -27,7 +29,7 @@ class WorkingGroupMembership:
         working_group = self.working_group
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "type": type,
@@ -50,21 +52,21 @@ class WorkingGroupMembership:
             working_group=working_group,
         )
 
-        working_group_membership.additional_properties = d
+        working_group_membership.additional_properties = d or EMPTY_PROPERTIES
         return working_group_membership
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties.keys())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
+        del self._additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in self._additional_properties
@@ -0,0 +1,304 @@
+"""Contains the client side rate limiting applied by Client and AuthenticatedClient"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+
+import httpx
+from attrs import define, evolve, field
+
+
+class TokenBucket:
+    """Allow ``rate`` events per second on average, with bursts of ``burst`` events"""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, returning how many seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class ConcurrencyLimit:
+    """A semaphore that threads and coroutines (of any event loop) can share"""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._active = 0
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+        self._async_waiters: deque[
+            tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]
+        ] = deque()
+
+    def acquire(self) -> None:
+        with self._released:
+            while self._active >= self.limit:
+                self._released.wait()
+            self._active += 1
+
+    async def acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._active < self.limit:
+                    self._active += 1
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    try:
+                        self._async_waiters.remove((loop, waiter))
+                    except ValueError:
+                        # already woken by release: pass the wakeup on
+                        self._wake_next()
+                raise
+
+    def release(self) -> None:
+        with self._lock:
+            self._active -= 1
+            self._released.notify()
+            self._wake_next()
+
+    def _wake_next(self) -> None:
+        """Wake the first live waiting coroutine (with the lock held)"""
+        while self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            if waiter.done():
+                continue
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:  # its event loop is closed
+                continue
+            return
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+
+def _wake(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+@define
+class RateLimit:
+    """A limit on the requests sent
+
+    Attributes:
+        requests_per_second: Average number of requests per second, None for no rate limit.
+        burst: Number of requests that can be sent at once before being limited to the rate.
+        max_concurrency: Maximum number of requests in flight at the same time, None for no limit.
+    """
+
+    requests_per_second: float | None = None
+    burst: int = 1
+    max_concurrency: int | None = None
+    _bucket: TokenBucket | None = field(init=False, default=None, repr=False)
+    _concurrency: ConcurrencyLimit | None = field(init=False, default=None, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        if self.requests_per_second is not None:
+            self._bucket = TokenBucket(self.requests_per_second, self.burst)
+        if self.max_concurrency is not None:
+            self._concurrency = ConcurrencyLimit(self.max_concurrency)
+
+    def acquire(self) -> None:
+        if self._concurrency is not None:
+            self._concurrency.acquire()
+        if self._bucket is not None:
+            time.sleep(self._bucket.reserve())
+
+    async def acquire_async(self) -> None:
+        if self._concurrency is not None:
+            await self._concurrency.acquire_async()
+        if self._bucket is not None:
+            await asyncio.sleep(self._bucket.reserve())
+
+    def release(self) -> None:
+        if self._concurrency is not None:
+            self._concurrency.release()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests holding a concurrency slot"""
+        return 0 if self._concurrency is None else self._concurrency.active
+
+
+@define
+class RateLimiter:
+    """The rate limits applied to the requests of a client
+
+    The same RateLimiter can be given to several clients, which then share
+    its limits.
+
+    Attributes:
+        default: The limit applied to each host not listed in ``hosts`` (every host gets its own copy).
+        hosts: Limits for specific hosts, replacing ``default``.
+        paths: Additional limits for the requests whose url path starts with the given prefix (e.g.
+            "/rest_api/series/"). Only the longest matching prefix applies.
+    """
+
+    default: RateLimit | None = None
+    hosts: dict[str, RateLimit] = field(factory=dict)
+    paths: dict[str, RateLimit] = field(factory=dict)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False, repr=False)
+
+    def limits_for(self, request: httpx.Request) -> list[RateLimit]:
+        limits = []
+
+        host = request.url.host
+        with self._lock:
+            if host not in self.hosts and self.default is not None:
+                self.hosts[host] = evolve(self.default)
+        if host in self.hosts:
+            limits.append(self.hosts[host])
+
+        path = request.url.path
+        matching = [p for p in self.paths if path.startswith(p)]
+        if matching:
+            limits.append(self.paths[max(matching, key=len)])
+
+        return limits
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    def __init__(
+        self, stream: httpx.SyncByteStream, release: Callable[[], None]
+    ) -> None:
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._release()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    def __init__(
+        self, stream: httpx.AsyncByteStream, release: Callable[[], None]
+    ) -> None:
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+def _releaser(limits: list[RateLimit]) -> Callable[[], None]:
+    released = False
+
+    def release() -> None:
+        nonlocal released
+        if not released:
+            released = True
+            for limit in limits:
+                limit.release()
+
+    return release
+
+
+class RateLimitTransport(httpx.BaseTransport):
+    """Wait for the limits of a RateLimiter before sending each request
+
+    The concurrency slots are held until the response is closed.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: RateLimiter) -> None:
+        self._transport = transport
+        self.limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        limits = self.limiter.limits_for(request)
+        acquired = []
+        release = _releaser(acquired)
+        try:
+            for limit in limits:
+                limit.acquire()
+                acquired.append(limit)
+            response = self._transport.handle_request(request)
+        except BaseException:
+            release()
+            raise
+
+        if response.is_closed:
+            release()
+        else:
+            response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRateLimitTransport(httpx.AsyncBaseTransport):
+    """Asynchronous version of RateLimitTransport"""
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter
+    ) -> None:
+        self._transport = transport
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        limits = self.limiter.limits_for(request)
+        acquired = []
+        release = _releaser(acquired)
+        try:
+            for limit in limits:
+                await limit.acquire_async()
+                acquired.append(limit)
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+
+        if response.is_closed:
+            release()
+        else:
+            response.stream = _AsyncReleasingStream(response.stream, release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+__all__ = [
+    "AsyncRateLimitTransport",
+    "ConcurrencyLimit",
+    "RateLimit",
+    "RateLimitTransport",
+    "RateLimiter",
+    "TokenBucket",
+]
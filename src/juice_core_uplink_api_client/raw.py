@@ -0,0 +1,176 @@
+"""Contains the raw mode of the endpoints: their response bytes, with no JSON decoding or models
+
+Any endpoint module of ``api`` can be called in raw mode, with the same
+arguments as its own functions, e.g.
+``raw.sync(get_plan_by_id_and_format, id="1", format_=".json", client=client)``
+returns the plan as sent by the server, and ``raw.stream(...)`` iterates over
+it as it arrives.
+"""
+
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from http import HTTPStatus
+from types import ModuleType
+from typing import Any
+
+import httpx
+
+from . import errors
+from .client import AuthenticatedClient, Client
+from .transport import UNBUFFERED
+from .types import Response
+
+
+def _build_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> Response[bytes]:
+    content = response.content
+    if response.is_success:
+        parsed = content
+    elif client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, content)
+    else:
+        parsed = None
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=content,
+        headers=response.headers,
+        parsed=parsed,
+    )
+
+
+def _stream_kwargs(endpoint: ModuleType, *args: Any, **kwargs: Any) -> dict[str, Any]:
+    request = endpoint._get_kwargs(*args, **kwargs)  # noqa: SLF001
+    # the coalescing and conditional layers would read the whole body first
+    request["extensions"] = {**request.get("extensions", {}), UNBUFFERED: True}
+    return request
+
+
+def sync_detailed(
+    endpoint: ModuleType,
+    *args: Any,
+    client: AuthenticatedClient | Client,
+    **kwargs: Any,
+) -> Response[bytes]:
+    """Call ``endpoint`` and keep its response body as bytes
+
+    Args:
+        endpoint (ModuleType): A module of ``api``, e.g. ``get_plan_by_id``.
+        *args, **kwargs: The arguments of the endpoint.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an error status and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[bytes]: ``parsed`` is the body on a success status, None otherwise.
+    """
+    request = endpoint._get_kwargs(*args, **kwargs)  # noqa: SLF001
+    response = client.get_httpx_client().request(**request)
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    endpoint: ModuleType,
+    *args: Any,
+    client: AuthenticatedClient | Client,
+    **kwargs: Any,
+) -> bytes | None:
+    """Call ``endpoint`` and return its response body, None on an error status
+
+    See sync_detailed.
+    """
+    return sync_detailed(endpoint, *args, client=client, **kwargs).parsed
+
+
+async def asyncio_detailed(
+    endpoint: ModuleType,
+    *args: Any,
+    client: AuthenticatedClient | Client,
+    **kwargs: Any,
+) -> Response[bytes]:
+    """Asynchronous version of sync_detailed"""
+    request = endpoint._get_kwargs(*args, **kwargs)  # noqa: SLF001
+    response = await client.get_async_httpx_client().request(**request)
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    endpoint: ModuleType,
+    *args: Any,
+    client: AuthenticatedClient | Client,
+    **kwargs: Any,
+) -> bytes | None:
+    """Asynchronous version of sync"""
+    return (await asyncio_detailed(endpoint, *args, client=client, **kwargs)).parsed
+
+
+@contextmanager
+def stream(
+    endpoint: ModuleType,
+    *args: Any,
+    client: AuthenticatedClient | Client,
+    chunk_size: int | None = None,
+    decode_content: bool = True,
+    **kwargs: Any,
+) -> Iterator[Iterator[bytes]]:
+    """Call ``endpoint`` and iterate over its response body as it arrives
+
+    The request bypasses request coalescing and conditional requests, which
+    need the whole body, and its connection (and rate limiter slot) is
+    released when leaving the block.
+
+    Args:
+        endpoint (ModuleType): A module of ``api``, e.g. ``get_plan_by_id``.
+        chunk_size (int | None): Size of the chunks, as received if None.
+        decode_content (bool): Undo the Content-Encoding (gzip, ...) of the
+            response, or pass the bytes on as sent.
+        *args, **kwargs: The arguments of the endpoint.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an error status. A
+            stream has no None to fall back on, so it is raised whatever
+            Client.raise_on_unexpected_status.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Yields:
+        Iterator[bytes]: The chunks of the body.
+    """
+    request = _stream_kwargs(endpoint, *args, **kwargs)
+    with client.get_httpx_client().stream(**request) as response:
+        if not response.is_success:
+            raise errors.UnexpectedStatus(response.status_code, response.read())
+        if decode_content:
+            yield response.iter_bytes(chunk_size)
+        else:
+            yield response.iter_raw(chunk_size)
+
+
+@asynccontextmanager
+async def astream(
+    endpoint: ModuleType,
+    *args: Any,
+    client: AuthenticatedClient | Client,
+    chunk_size: int | None = None,
+    decode_content: bool = True,
+    **kwargs: Any,
+) -> AsyncIterator[AsyncIterator[bytes]]:
+    """Asynchronous version of stream"""
+    request = _stream_kwargs(endpoint, *args, **kwargs)
+    async with client.get_async_httpx_client().stream(**request) as response:
+        if not response.is_success:
+            raise errors.UnexpectedStatus(response.status_code, await response.aread())
+        if decode_content:
+            yield response.aiter_bytes(chunk_size)
+        else:
+            yield response.aiter_raw(chunk_size)
+
+
+__all__ = [
+    "astream",
+    "asyncio",
+    "asyncio_detailed",
+    "stream",
+    "sync",
+    "sync_detailed",
+]
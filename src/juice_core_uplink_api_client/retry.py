@@ -0,0 +1,230 @@
+"""Contains the retry policy applied by Client and AuthenticatedClient"""
+
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+from attrs import define, field
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+RETRY_EXCEPTIONS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadError,
+    httpx.RemoteProtocolError,
+)
+
+
+@define
+class RetryBudget:
+    """Limit retries to a fraction of the requests sent
+
+    Every request deposits ``ratio`` tokens (up to ``capacity``) and every
+    retry withdraws one: when the server is failing for everybody, retries
+    stop instead of multiplying the load on it.
+
+    Attributes:
+        ratio: Retries allowed for each request sent.
+        capacity: Maximum number of tokens, the budget starts full.
+    """
+
+    ratio: float = 0.2
+    capacity: float = 20.0
+    _tokens: float = field(init=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._tokens = self.capacity
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a token for a retry, False if the budget is exhausted"""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait according to a Retry-After header (delay or HTTP date)"""
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@define
+class RetryPolicy:
+    """When and how long to wait before sending a request again
+
+    Attributes:
+        max_attempts: Maximum number of attempts, the first one included.
+        status_codes: Response status codes worth retrying.
+        methods: HTTP methods that can be retried, idempotent ones only by default.
+        exceptions: Transport errors worth retrying.
+        backoff_factor: Base delay in seconds, doubled at each attempt.
+        max_backoff: Longest delay in seconds. A Retry-After asking for more than this is not honoured
+            and the response is returned as it is.
+        jitter: Whether or not to draw each delay uniformly between 0 and the exponential backoff ("full jitter").
+        respect_retry_after: Whether or not to wait as long as a Retry-After header asks.
+        budget: The RetryBudget shared by all the requests using this policy, None for no budget.
+    """
+
+    max_attempts: int = 3
+    status_codes: frozenset[int] = field(
+        default=RETRY_STATUS_CODES, converter=frozenset
+    )
+    methods: frozenset[str] = field(default=IDEMPOTENT_METHODS, converter=frozenset)
+    exceptions: tuple[type[Exception], ...] = RETRY_EXCEPTIONS
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    budget: RetryBudget | None = field(factory=RetryBudget)
+
+    def applies_to(self, request: httpx.Request) -> bool:
+        return request.method in self.methods
+
+    def backoff(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay  # noqa: S311
+
+    def delay(
+        self, attempt: int, response: httpx.Response | None = None
+    ) -> float | None:
+        """Seconds to wait before attempt ``attempt + 1``, None to give up"""
+        if attempt >= self.max_attempts:
+            return None
+
+        if response is not None and response.status_code not in self.status_codes:
+            return None
+
+        delay = self.backoff(attempt)
+        if response is not None and self.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                if retry_after > self.max_backoff:
+                    return None
+                delay = max(delay, retry_after)
+
+        if self.budget is not None and not self.budget.withdraw():
+            return None
+
+        return delay
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Send again the requests that failed according to a RetryPolicy"""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        policy: RetryPolicy,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._transport = transport
+        self.policy = policy
+        self._sleep = sleep
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.policy.applies_to(request):
+            return self._transport.handle_request(request)
+
+        if self.policy.budget is not None:
+            self.policy.budget.deposit()
+
+        attempt = 1
+        while True:
+            try:
+                response = self._transport.handle_request(request)
+            except self.policy.exceptions:
+                delay = self.policy.delay(attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self.policy.delay(attempt, response)
+                if delay is None:
+                    return response
+                response.close()
+
+            self._sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Asynchronous version of RetryTransport"""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        policy: RetryPolicy,
+        sleep: Callable[[float], object] = asyncio.sleep,
+    ) -> None:
+        self._transport = transport
+        self.policy = policy
+        self._sleep = sleep
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.policy.applies_to(request):
+            return await self._transport.handle_async_request(request)
+
+        if self.policy.budget is not None:
+            self.policy.budget.deposit()
+
+        attempt = 1
+        while True:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except self.policy.exceptions:
+                delay = self.policy.delay(attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self.policy.delay(attempt, response)
+                if delay is None:
+                    return response
+                await response.aclose()
+
+            await self._sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+__all__ = [
+    "AsyncRetryTransport",
+    "RetryBudget",
+    "RetryPolicy",
+    "RetryTransport",
+    "parse_retry_after",
+]
@@ -0,0 +1,220 @@
+"""Contains the streaming mode of the list endpoints: their items, decoded as the response arrives
+
+The generated endpoints read the whole response, then decode the whole JSON
+document, then build all the models. For long series or event queries that
+holds the body, its decoded JSON and the models in memory at once; here the
+body is streamed (see raw.stream) through an incremental parser of the JSON
+array, and each item is handed over as soon as it is complete, e.g.
+``for event in streaming.sync(get_events, client=client, body=query): ...``
+"""
+
+import codecs
+import json
+from collections.abc import AsyncIterator, Callable, Iterator
+from types import ModuleType
+from typing import Any
+
+from . import raw
+from .client import AuthenticatedClient, Client
+from .decoding import model_decoder, response_model
+from .types import UNSET, Unset
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_START, _FIRST_ITEM, _ITEM, _AFTER_ITEM, _DONE = range(5)
+_WHITESPACE = " \t\n\r"
+# the values complete only once followed by something else: a number read up
+# to the end of the buffer, or to a "." or an exponent, may go on
+_OPEN_ENDED = frozenset("-0123456789tfn")
+_GOES_ON = ("", ".", "e", "E", "+", "-")
+
+
+class JSONArrayParser:
+    """Incremental parser of a JSON array
+
+    ``feed`` takes the bytes of the document as they come and returns the
+    items of the array completed so far; ``close`` checks that the document
+    is complete. Only the text of the item being received is kept.
+    """
+
+    def __init__(self) -> None:
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._scan = json.JSONDecoder().raw_decode
+        self._buffer = ""
+        self._state = _START
+
+    def feed(self, data: bytes) -> list[Any]:
+        self._buffer += self._text.decode(data)
+        return self._items(final=False)
+
+    def close(self) -> list[Any]:
+        self._buffer += self._text.decode(b"", final=True)
+        items = self._items(final=True)
+        if self._state != _DONE:
+            msg = "Incomplete JSON array"
+            raise ValueError(msg)
+        return items
+
+    def _items(self, *, final: bool) -> list[Any]:
+        items: list[Any] = []
+        buffer = self._buffer
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos == len(buffer):
+                break
+
+            char = buffer[pos]
+            if self._state == _START:
+                if char != "[":
+                    msg = f"Expected a JSON array, got {char!r}"
+                    raise ValueError(msg)
+                self._state = _FIRST_ITEM
+                pos += 1
+            elif self._state == _DONE:
+                msg = "Extra data after the JSON array"
+                raise ValueError(msg)
+            elif char == "]" and self._state in (_FIRST_ITEM, _AFTER_ITEM):
+                self._state = _DONE
+                pos += 1
+            elif self._state == _AFTER_ITEM:
+                if char != ",":
+                    msg = f"Expected ',' or ']' in the JSON array, got {char!r}"
+                    raise ValueError(msg)
+                self._state = _ITEM
+                pos += 1
+            else:
+                try:
+                    item, end = self._scan(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break  # the item is not complete yet
+                if (
+                    not final
+                    and char in _OPEN_ENDED
+                    and buffer[end : end + 1] in _GOES_ON
+                ):
+                    break  # a number may go on in the next chunk
+                items.append(item)
+                self._state = _AFTER_ITEM
+                pos = end
+
+        self._buffer = buffer[pos:]
+        return items
+
+
+def item_model(endpoint: ModuleType) -> type | None:
+    """The model of the items of the list returned by ``endpoint``, if any"""
+    model, many = response_model(endpoint)
+    return model if many else None
+
+
+def _item_decoder(
+    endpoint: ModuleType, model: type | None | Unset
+) -> Callable[[Any], Any] | None:
+    if isinstance(model, Unset):
+        model = item_model(endpoint)
+    return None if model is None else model_decoder(model)
+
+
+class _Batches:
+    """Group the decoded items in lists of ``batch_size``, or pass them one by one"""
+
+    def __init__(
+        self, decode: Callable[[Any], Any] | None, batch_size: int | None
+    ) -> None:
+        self.decode = decode
+        self.batch_size = batch_size
+        self.pending: list[Any] = []
+
+    def add(self, records: list[Any]) -> list[Any]:
+        if self.decode is not None:
+            records = [self.decode(record) for record in records]
+        if self.batch_size is None:
+            return records
+        self.pending.extend(records)
+        batches = []
+        while len(self.pending) >= self.batch_size:
+            batches.append(self.pending[: self.batch_size])
+            del self.pending[: self.batch_size]
+        return batches
+
+    def flush(self) -> list[Any]:
+        if self.batch_size is None or not self.pending:
+            return []
+        batch, self.pending = self.pending, []
+        return [batch]
+
+
+def sync(
+    endpoint: ModuleType,
+    *args: Any,
+    client: AuthenticatedClient | Client,
+    model: type | None | Unset = UNSET,
+    batch_size: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Call a list endpoint and yield its items as the response arrives
+
+    The response is read in chunks of ``chunk_size`` bytes, so the memory
+    held stays the same whatever the length of the list. The request is
+    closed once the items are exhausted, or when the iterator is closed.
+
+    Args:
+        endpoint (ModuleType): A module of ``api`` returning a list, e.g. ``get_events``.
+        model (type | None | Unset): Model the items are decoded into, by
+            default the one of the endpoint; None yields the decoded JSON.
+        batch_size (int | None): Yield lists of up to ``batch_size`` items
+            instead of the items one by one.
+        *args, **kwargs: The arguments of the endpoint.
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an error status.
+        ValueError: If the response is not a JSON array.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Yields:
+        The items, or lists of items with ``batch_size``.
+    """
+    parser = JSONArrayParser()
+    batches = _Batches(_item_decoder(endpoint, model), batch_size)
+    with raw.stream(
+        endpoint, *args, client=client, chunk_size=chunk_size, **kwargs
+    ) as chunks:
+        for chunk in chunks:
+            yield from batches.add(parser.feed(chunk))
+    yield from batches.add(parser.close())
+    yield from batches.flush()
+
+
+async def asyncio(
+    endpoint: ModuleType,
+    *args: Any,
+    client: AuthenticatedClient | Client,
+    model: type | None | Unset = UNSET,
+    batch_size: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """Asynchronous version of sync"""
+    parser = JSONArrayParser()
+    batches = _Batches(_item_decoder(endpoint, model), batch_size)
+    async with raw.astream(
+        endpoint, *args, client=client, chunk_size=chunk_size, **kwargs
+    ) as chunks:
+        async for chunk in chunks:
+            for item in batches.add(parser.feed(chunk)):
+                yield item
+    for item in batches.add(parser.close()) + batches.flush():
+        yield item
+
+
+__all__ = [
+    "JSONArrayParser",
+    "asyncio",
+    "item_model",
+    "sync",
+]
@@ -0,0 +1,495 @@
+"""Contains the httpx transports layered below Client and AuthenticatedClient"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import httpx
+from attrs import define, field
+
+from .ratelimit import AsyncRateLimitTransport, RateLimiter, RateLimitTransport
+from .retry import AsyncRetryTransport, RetryPolicy, RetryTransport
+
+# httpx.Client arguments that only configure its transports: the default one,
+# and the ones mounted by URL (proxies)
+_TRANSPORT_ARGS = (
+    "cert",
+    "http1",
+    "http2",
+    "limits",
+    "mounts",
+    "proxies",
+    "proxy",
+    "transport",
+)
+_SAFE_METHODS = ("GET", "HEAD")
+_KEPT_EXTENSIONS = ("http_version", "reason_phrase")
+# the limits of httpx.Client when none are given
+_DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0
+)
+DEFAULT_VALIDATED_ENTRIES = 128
+DEFAULT_VALIDATED_BYTES = 32 * 2**20
+# request extension for the responses streamed to the caller: they go past the
+# coalescing and conditional layers, which hold the whole body in memory
+UNBUFFERED = "unbuffered"
+
+
+@define
+class ResponseSnapshot:
+    """The status, headers and raw (still encoded) body of a response"""
+
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    content: bytes
+    extensions: dict[str, Any] = field(factory=dict)
+
+    @classmethod
+    def capture(cls, response: httpx.Response) -> "ResponseSnapshot":
+        if response.is_stream_consumed:  # built in memory, e.g. by MockTransport
+            return cls._from(response, response.content)
+        try:
+            content = b"".join(response.iter_raw())
+        finally:
+            response.close()
+        return cls._from(response, content)
+
+    @classmethod
+    async def acapture(cls, response: httpx.Response) -> "ResponseSnapshot":
+        if response.is_stream_consumed:  # built in memory, e.g. by MockTransport
+            return cls._from(response, response.content)
+        try:
+            content = b"".join([chunk async for chunk in response.aiter_raw()])
+        finally:
+            await response.aclose()
+        return cls._from(response, content)
+
+    @classmethod
+    def _from(cls, response: httpx.Response, content: bytes) -> "ResponseSnapshot":
+        return cls(
+            status_code=response.status_code,
+            headers=response.headers.raw,
+            content=content,
+            extensions={
+                k: v for k, v in response.extensions.items() if k in _KEPT_EXTENSIONS
+            },
+        )
+
+    def to_response(self) -> httpx.Response:
+        """Build a new, unread response that can be handed to httpx"""
+        return httpx.Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            stream=httpx.ByteStream(self.content),
+            extensions=dict(self.extensions),
+        )
+
+
+def _request_key(request: httpx.Request) -> tuple[Any, ...]:
+    return (
+        request.method,
+        str(request.url),
+        tuple(sorted(request.headers.multi_items())),
+    )
+
+
+@define
+class _InFlight:
+    done: threading.Event = field(factory=threading.Event)
+    snapshot: ResponseSnapshot | None = None
+    error: BaseException | None = None
+
+
+class CoalescingTransport(httpx.BaseTransport):
+    """Share one response among identical GET/HEAD requests sent concurrently
+
+    The first request for a given method, url and headers is sent to the
+    wrapped transport; requests arriving while it is in flight wait for it
+    and receive a copy of its response.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self._transport = transport
+        self._lock = threading.Lock()
+        self._in_flight: dict[tuple[Any, ...], _InFlight] = {}
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method not in _SAFE_METHODS or request.extensions.get(UNBUFFERED):
+            return self._transport.handle_request(request)
+
+        key = _request_key(request)
+        with self._lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if call is None:
+                call = self._in_flight[key] = _InFlight()
+
+        if leader:
+            try:
+                response = self._transport.handle_request(request)
+                call.snapshot = ResponseSnapshot.capture(response)
+            except BaseException as e:
+                call.error = e
+                raise
+            finally:
+                with self._lock:
+                    del self._in_flight[key]
+                call.done.set()
+        else:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+
+        return call.snapshot.to_response()
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncCoalescingTransport(httpx.AsyncBaseTransport):
+    """Asynchronous version of CoalescingTransport"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+        self._in_flight: dict[tuple[Any, ...], asyncio.Future[ResponseSnapshot]] = {}
+
+    async def _fetch(self, request: httpx.Request) -> ResponseSnapshot:
+        response = await self._transport.handle_async_request(request)
+        return await ResponseSnapshot.acapture(response)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method not in _SAFE_METHODS or request.extensions.get(UNBUFFERED):
+            return await self._transport.handle_async_request(request)
+
+        key = _request_key(request)
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch(request))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # a cancelled caller must not cancel the request shared with the others
+        snapshot = await asyncio.shield(future)
+        return snapshot.to_response()
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+@define
+class _Validated:
+    etag: str | None
+    last_modified: str | None
+    snapshot: ResponseSnapshot
+
+    def add_conditions(self, request: httpx.Request) -> None:
+        if self.etag is not None:
+            request.headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            request.headers["If-Modified-Since"] = self.last_modified
+
+
+class ValidatorStore:
+    """The latest response with an ETag or Last-Modified header for each request
+
+    Bounded to ``max_entries`` responses and ``max_bytes`` of bodies (None for
+    no limit), evicted in least recently used order. Bodies larger than
+    ``max_bytes`` are not kept, their requests are not revalidated.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_VALIDATED_ENTRIES,
+        max_bytes: int | None = DEFAULT_VALIDATED_BYTES,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[Any, ...], _Validated] = OrderedDict()
+        self._bytes = 0
+
+    def prepare(
+        self, request: httpx.Request
+    ) -> tuple[tuple[Any, ...], _Validated | None]:
+        """Add the conditional headers to ``request`` if a response is stored"""
+        key = _request_key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None:
+            entry.add_conditions(request)
+        return key, entry
+
+    def should_store(self, response: httpx.Response) -> bool:
+        return response.status_code == httpx.codes.OK and (
+            "etag" in response.headers or "last-modified" in response.headers
+        )
+
+    def store(self, key: tuple[Any, ...], snapshot: ResponseSnapshot) -> None:
+        headers = httpx.Headers(snapshot.headers)
+        entry = _Validated(
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+            snapshot=snapshot,
+        )
+        size = len(snapshot.content)
+        with self._lock:
+            self._discard(key)  # outdated by this response, kept or not
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: tuple[Any, ...]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry.snapshot.content)
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the stored bodies"""
+        return self._bytes
+
+    @staticmethod
+    def revalidated(entry: _Validated) -> httpx.Response:
+        """The stored response, marked with the ``revalidated`` extension"""
+        response = entry.snapshot.to_response()
+        response.extensions["revalidated"] = True
+        return response
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+class ConditionalTransport(httpx.BaseTransport):
+    """Revalidate GET requests with If-None-Match/If-Modified-Since
+
+    Responses carrying an ETag or Last-Modified header are stored; the next
+    identical request sends their validators and, if the server answers 304
+    Not Modified, gets the stored response back (with the ``revalidated``
+    response extension set).
+    """
+
+    def __init__(
+        self, transport: httpx.BaseTransport, store: ValidatorStore | None = None
+    ) -> None:
+        self._transport = transport
+        self.store = store if store is not None else ValidatorStore()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET" or request.extensions.get(UNBUFFERED):
+            return self._transport.handle_request(request)
+
+        key, entry = self.store.prepare(request)
+        response = self._transport.handle_request(request)
+
+        if entry is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            response.close()
+            return self.store.revalidated(entry)
+
+        if self.store.should_store(response):
+            snapshot = ResponseSnapshot.capture(response)
+            self.store.store(key, snapshot)
+            return snapshot.to_response()
+
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncConditionalTransport(httpx.AsyncBaseTransport):
+    """Asynchronous version of ConditionalTransport"""
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, store: ValidatorStore | None = None
+    ) -> None:
+        self._transport = transport
+        self.store = store if store is not None else ValidatorStore()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method != "GET" or request.extensions.get(UNBUFFERED):
+            return await self._transport.handle_async_request(request)
+
+        key, entry = self.store.prepare(request)
+        response = await self._transport.handle_async_request(request)
+
+        if entry is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            await response.aclose()
+            return self.store.revalidated(entry)
+
+        if self.store.should_store(response):
+            snapshot = await ResponseSnapshot.acapture(response)
+            self.store.store(key, snapshot)
+            return snapshot.to_response()
+
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class MountTransport(httpx.BaseTransport):
+    """Send each request through the transport an httpx.Client picks for its URL
+
+    The layers below Client wrap this transport rather than a bare
+    HTTPTransport: given a transport, httpx ignores the HTTP(S)_PROXY
+    variables, and sends the requests matching ``proxy`` or ``mounts`` past it.
+    """
+
+    def __init__(self, client: httpx.Client) -> None:
+        self._client = client
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        transport = self._client._transport_for_url(request.url)  # noqa: SLF001
+        return transport.handle_request(request)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class AsyncMountTransport(httpx.AsyncBaseTransport):
+    """Asynchronous version of MountTransport"""
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self._client = client
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        transport = self._client._transport_for_url(request.url)  # noqa: SLF001
+        return await transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def pool_limits(
+    max_connections: int | None = None,
+    max_keepalive_connections: int | None = None,
+    keepalive_expiry: float | None = None,
+) -> httpx.Limits | None:
+    """The httpx.Limits overriding the given options, None if none is given"""
+    options = (max_connections, max_keepalive_connections, keepalive_expiry)
+    if all(option is None for option in options):
+        return None
+
+    default = _DEFAULT_LIMITS
+    return httpx.Limits(
+        max_connections=default.max_connections
+        if max_connections is None
+        else max_connections,
+        max_keepalive_connections=default.max_keepalive_connections
+        if max_keepalive_connections is None
+        else max_keepalive_connections,
+        keepalive_expiry=default.keepalive_expiry
+        if keepalive_expiry is None
+        else keepalive_expiry,
+    )
+
+
+def phase_timeout(
+    timeout: httpx.Timeout | float | None,
+    *,
+    connect: float | None = None,
+    read: float | None = None,
+    write: float | None = None,
+    pool: float | None = None,
+) -> httpx.Timeout | float | None:
+    """``timeout`` with the phases given (in seconds) overridden"""
+    phases = {"connect": connect, "read": read, "write": write, "pool": pool}
+    phases = {k: v for k, v in phases.items() if v is not None}
+    if not phases:
+        return timeout
+
+    base = httpx.Timeout(timeout)
+    return httpx.Timeout(**{**base.as_dict(), **phases})
+
+
+def httpx_client_args(
+    httpx_args: dict[str, Any],
+    *,
+    verify: Any,
+    asynchronous: bool,
+    limits: httpx.Limits | None = None,
+    http2: bool = False,
+    coalesce_requests: bool = False,
+    conditional_requests: bool = False,
+    retry: RetryPolicy | None = None,
+    rate_limiter: RateLimiter | None = None,
+) -> dict[str, Any]:
+    """Arguments for httpx.Client/AsyncClient, with the transport layers enabled
+
+    When no layer is enabled ``httpx_args`` is returned untouched, so httpx
+    builds its usual default transport. Otherwise the layers wrap the
+    transports httpx would build, the proxies included (see MountTransport).
+    """
+    args = dict(httpx_args)
+    if limits is not None:
+        args["limits"] = limits
+    if http2:
+        args["http2"] = True
+    if not (coalesce_requests or conditional_requests or retry or rate_limiter):
+        return args
+
+    # the transports, proxies included, are those httpx would build itself
+    options = {k: args.pop(k) for k in _TRANSPORT_ARGS if k in args}
+    if "trust_env" in args:
+        options["trust_env"] = args["trust_env"]
+    transport = (
+        AsyncMountTransport(httpx.AsyncClient(verify=verify, **options))
+        if asynchronous
+        else MountTransport(httpx.Client(verify=verify, **options))
+    )
+
+    if rate_limiter is not None:
+        transport = (
+            AsyncRateLimitTransport(transport, rate_limiter)
+            if asynchronous
+            else RateLimitTransport(transport, rate_limiter)
+        )
+
+    if retry is not None:
+        transport = (
+            AsyncRetryTransport(transport, retry)
+            if asynchronous
+            else RetryTransport(transport, retry)
+        )
+
+    if conditional_requests:
+        transport = (
+            AsyncConditionalTransport(transport)
+            if asynchronous
+            else ConditionalTransport(transport)
+        )
+
+    if coalesce_requests:
+        transport = (
+            AsyncCoalescingTransport(transport)
+            if asynchronous
+            else CoalescingTransport(transport)
+        )
+
+    args["transport"] = transport
+    return args
+
+
+__all__ = [
+    "AsyncCoalescingTransport",
+    "AsyncConditionalTransport",
+    "AsyncMountTransport",
+    "CoalescingTransport",
+    "ConditionalTransport",
+    "MountTransport",
+    "ResponseSnapshot",
+    "ValidatorStore",
+    "httpx_client_args",
+    "phase_timeout",
+    "pool_limits",
+]
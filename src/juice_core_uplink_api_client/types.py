@@ -3,9 +3,11 @@
 from collections.abc import MutableMapping
 from http import HTTPStatus
 from typing import (
+    Any,
     BinaryIO,
     Generic,
     Literal,
+    NoReturn,
     TypeVar,
 )
 
@@ -16,9 +18,70 @@ class Unset:
     def __bool__(self) -> Literal[False]:
         return False
 
+    def __reduce__(self) -> str:
+        # unpickled as the UNSET singleton, which the models test by identity
+        return "UNSET"
+
 
 UNSET: Unset = Unset()
 
+
+class EmptyProperties(dict[str, Any]):
+    """The additional_properties shared by the models that have none
+
+    Read-only, the models never hand it out: see AdditionalProperties.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: object, **kwargs: object) -> NoReturn:
+        msg = "EMPTY_PROPERTIES is shared and read-only"
+        raise TypeError(msg)
+
+    def __delitem__(self, key: str) -> NoReturn:
+        raise KeyError(key)
+
+    __setitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_empty_properties, ())
+
+
+def _empty_properties() -> "EmptyProperties":
+    return EMPTY_PROPERTIES
+
+
+EMPTY_PROPERTIES: EmptyProperties = EmptyProperties()
+
+
+class AdditionalProperties:
+    """The ``additional_properties`` of a model, shared while it has none
+
+    The models keep EMPTY_PROPERTIES in ``_additional_properties`` until they
+    get extra keys. The first access to ``additional_properties`` gives the
+    model a dict of its own, which can be modified as a plain dict.
+    """
+
+    __slots__ = ()
+    _additional_properties: dict[str, Any]
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is EMPTY_PROPERTIES:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
+
 FileJsonType = tuple[str | None, BinaryIO, str | None]
 
 
@@ -48,4 +111,13 @@ class Response(Generic[T]):
     parsed: T | None
 
 
-__all__ = ["File", "Response", "FileJsonType", "Unset", "UNSET"]
+__all__ = [
+    "AdditionalProperties",
+    "EMPTY_PROPERTIES",
+    "EmptyProperties",
+    "File",
+    "Response",
+    "FileJsonType",
+    "Unset",
+    "UNSET",
+]
@@ -0,0 +1,204 @@
+"""Offline fixtures emulating a small subset of the Juice Core Uplink API"""
+
+import json
+
+import httpx
+import pandas as pd
+import pytest
+
+from juice_core_uplink_api_client import Client
+
+MOCK_URL = "https://mock.juicesoc"
+
+PLANS = [
+    {
+        "trajectory": "CREMA_5_1_150lb_23_1",
+        "name": "PLAN_A",
+        "mnemonic": "PLAN_A",
+        "is_public": True,
+        "created": "2024-01-01T10:00:00Z",
+        "id": 1,
+    },
+    {
+        "trajectory": "CREMA_5_1_150lb_23_1",
+        "name": "PLAN_B",
+        "mnemonic": "PLAN_B",
+        "is_public": True,
+        "created": "2024-02-01T10:00:00Z",
+        "id": 2,
+    },
+]
+
+SEGMENTS = [
+    {
+        "start": "2032-01-01T00:00:00Z",
+        "end": "2032-01-01T06:00:00Z",
+        "segment_definition": "DL_",
+        "timeline": "PRIME",
+        "name": "DL_",
+    },
+    {
+        "start": "2032-01-01T04:00:00Z",
+        "end": "2032-01-01T10:00:00Z",
+        "segment_definition": "JANUS_OBS",
+        "timeline": "PRIME",
+        "name": "JANUS_OBS",
+    },
+    {
+        "start": "2032-01-02T00:00:00Z",
+        "end": "2032-01-02T03:00:00Z",
+        "segment_definition": "DL_",
+        "timeline": "PRIME",
+        "name": "DL_",
+    },
+]
+
+ENGINEERING_SEGMENTS = [
+    {
+        "start": "2032-01-01T00:00:00Z",
+        "end": "2032-01-01T12:00:00Z",
+        "segment_type": "COMMS",
+        "power": 10.0,
+    },
+    {
+        "start": "2032-01-01T12:00:00Z",
+        "end": "2032-01-02T12:00:00Z",
+        "segment_type": "SCIENCE",
+        "power": 20.0,
+    },
+]
+
+EVENT_TYPES = [
+    {"name": "Perijove", "mnemonic": "PERIJOVE"},
+    {"name": "Apojove", "mnemonic": "APOJOVE"},
+]
+
+KNOWN_SERIES = [
+    {"name": "Altitude", "mnemonic": "JUICE_ALT"},
+    {"name": "Phase angle", "mnemonic": "JUICE_PHASE"},
+]
+
+PHASES = [
+    {
+        "name": "Phase 1",
+        "mnemonic": "PH1",
+        "start": "2032-01-01T00:00:00Z",
+        "end": "2032-01-03T00:00:00Z",
+    },
+    {
+        "name": "Phase 2",
+        "mnemonic": "PH2",
+        "start": "2032-01-03T00:00:00Z",
+        "end": "2032-01-05T00:00:00Z",
+    },
+]
+
+
+def _iso(t):
+    return t.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _time_grid(query, freq):
+    start = pd.Timestamp(query["start"])
+    end = pd.Timestamp(query["end"])
+    return pd.date_range(start, end, freq=freq, inclusive="both")
+
+
+def mock_series(query):
+    """One sample per hour in [start, end], value depending on series name."""
+    offset = len(query["series"])
+    return [
+        {"epoch": _iso(t), "value": float(t.hour + offset)}
+        for t in _time_grid(query, "h")
+    ]
+
+
+def mock_events(query):
+    """One event per day and requested mnemonic in [start, end]."""
+    return [
+        {
+            "name": m,
+            "start": _iso(t),
+            "end": _iso(t),
+            "description": f"ID = {i}; TYPE = {m}",
+        }
+        for m in query["mnemonics"]
+        for i, t in enumerate(_time_grid(query, "D"))
+    ]
+
+
+def mock_handler(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+
+    if path == "/rest_api/plan/":
+        return httpx.Response(200, json=PLANS)
+
+    if path.startswith("/rest_api/plan/"):
+        plan_id = int(path.strip("/").split("/")[-1])
+        plan = next(p for p in PLANS if p["id"] == plan_id)
+        return httpx.Response(
+            200,
+            json={**plan, "segment_groups": [], "segments": SEGMENTS},
+        )
+
+    if path == "/rest_api/series/":
+        query = json.loads(request.url.params["body"])
+        return httpx.Response(200, json=mock_series(query))
+
+    if path == "/rest_api/events/":
+        query = json.loads(request.url.params["body"])
+        return httpx.Response(200, json=mock_events(query))
+
+    if path == "/rest_api/pcw/":
+        return httpx.Response(200, json=[{"name": "PCW1", "mnemonic": "PCW1"}])
+
+    if path.endswith("/engineering_segments"):
+        return httpx.Response(200, json=ENGINEERING_SEGMENTS)
+
+    if path.endswith("/event"):
+        return httpx.Response(200, json=EVENT_TYPES)
+
+    if path.endswith("/series"):
+        return httpx.Response(200, json=KNOWN_SERIES)
+
+    if path.startswith("/rest_api/trajectory/"):
+        mnemonic = path.strip("/").split("/")[-1]
+        return httpx.Response(
+            200,
+            json={"name": mnemonic, "mnemonic": mnemonic, "phases": PHASES},
+        )
+
+    return httpx.Response(404)
+
+
+class CountingHandler:
+    """Wrap mock_handler counting the requests received per path."""
+
+    def __init__(self, handler=mock_handler):
+        self.handler = handler
+        self.calls = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls[request.url.path] = self.calls.get(request.url.path, 0) + 1
+        return self.handler(request)
+
+    @property
+    def total(self):
+        return sum(self.calls.values())
+
+
+@pytest.fixture
+def handler():
+    return CountingHandler()
+
+
+@pytest.fixture
+def mock_client(handler):
+    client = Client(base_url=MOCK_URL)
+    client.set_httpx_client(
+        httpx.Client(base_url=MOCK_URL, transport=httpx.MockTransport(handler)),
+    )
+    client.set_async_httpx_client(
+        httpx.AsyncClient(base_url=MOCK_URL, transport=httpx.MockTransport(handler)),
+    )
+    return client
@@ -0,0 +1,114 @@
+import asyncio
+from importlib.util import find_spec
+
+import pandas as pd
+import pytest
+
+from juice_core import AsyncSHTRestInterface, SHTRestInterface
+
+KWARGS = {"start": "2032-01-01", "end": "2032-01-03"}
+
+RECORDS = [
+    {
+        "name": "JANUS_OBS",
+        "start": "2032-01-01T00:00:00Z",
+        "end": "2032-01-01T06:00:00Z",
+        "resources": [{"instrument": "JANUS", "target": "power", "value": 12.5}],
+    },
+    {
+        "name": "DL_",
+        "start": "2032-01-02T00:00:00Z",
+        "end": None,
+        "resources": [],
+        "description": "station = MLG",
+    },
+]
+
+
+def test_output_modes_without_arrow(mock_client):
+    shtr = SHTRestInterface(client=mock_client)
+    pd.testing.assert_frame_equal(
+        shtr.plan_segments("PLAN_A", output="pandas"), shtr.plan_segments("PLAN_A")
+    )
+    assert shtr.plans(output="raw") == shtr.plans(as_pandas=False)
+    series = shtr.series("JUICE_ALT", **KWARGS, output="raw")
+    assert series == shtr.series("JUICE_ALT", **KWARGS, as_pandas=False)
+
+    with pytest.raises(ValueError, match="output must be one of"):
+        shtr.plans(output="numpy")
+
+
+@pytest.mark.skipif(find_spec("pyarrow") is not None, reason="pyarrow is installed")
+def test_arrow_output_needs_pyarrow(mock_client):
+    shtr = SHTRestInterface(client=mock_client)
+    with pytest.raises(ImportError, match="pip install pyarrow"):
+        shtr.events("PERIJOVE", **KWARGS, output="arrow")
+    with pytest.raises(ImportError, match="pip install pyarrow"):
+        shtr.series("JUICE_ALT", **KWARGS, output="polars")
+
+
+def test_records_to_arrow():
+    pa = pytest.importorskip("pyarrow")
+    from juice_core.arrow import records_to_arrow
+
+    table = records_to_arrow(RECORDS, ["start", "end"])
+    assert table.column_names == ["name", "start", "end", "resources", "description"]
+    assert table.schema.field("start").type == pa.timestamp("ns")
+    assert table["end"].null_count == 1
+    resources = table.schema.field("resources").type
+    assert pa.types.is_list(resources)
+    assert pa.types.is_struct(resources.value_type)
+    assert table["resources"].to_pylist() == [r["resources"] for r in RECORDS]
+    assert table["description"].to_pylist() == [None, "station = MLG"]
+
+    utc = records_to_arrow(RECORDS, ["start"], utc=True, expand_fields=["description"])
+    assert utc.schema.field("start").type == pa.timestamp("ns", tz="UTC")
+    assert utc["station"].to_pylist() == [None, "MLG"]
+    assert "description" not in utc.column_names
+
+
+def test_arrow_output(mock_client):
+    pa = pytest.importorskip("pyarrow")
+    shtr = SHTRestInterface(client=mock_client)
+
+    table = shtr.plan_segments("PLAN_A", output="arrow")
+    frame = shtr.plan_segments("PLAN_A")
+    assert isinstance(table, pa.Table)
+    assert table.column_names == list(frame.columns)
+    pd.testing.assert_frame_equal(table.to_pandas(), frame)
+
+    events = shtr.events(["PERIJOVE", "APOJOVE"], **KWARGS, output="arrow", utc=True)
+    assert events.schema.field("start").type == pa.timestamp("ns", tz="UTC")
+
+    series = shtr.series("JUICE_ALT", **KWARGS, output="arrow")
+    expected = shtr.series("JUICE_ALT", **KWARGS)
+    assert series.column_names == ["epoch", "JUICE_ALT"]
+    assert series["JUICE_ALT"].to_pylist() == expected.tolist()
+    assert (series["epoch"].to_numpy() == expected.index.to_numpy()).all()
+
+
+def test_polars_output(mock_client):
+    pytest.importorskip("pyarrow")
+    pl = pytest.importorskip("polars")
+    shtr = SHTRestInterface(client=mock_client)
+
+    table = shtr.events(["PERIJOVE", "APOJOVE"], **KWARGS, output="arrow")
+    frame = shtr.events(["PERIJOVE", "APOJOVE"], **KWARGS, output="polars")
+    assert isinstance(frame, pl.DataFrame)
+    assert frame.columns == table.column_names
+    assert frame.schema["start"] == pl.Datetime("ns")
+    # Polars keeps its own string layout (large_string or string_view)
+    assert frame.to_dicts() == table.to_pylist()
+
+
+def test_async_output_modes(mock_client):
+    shtr = AsyncSHTRestInterface(client=mock_client)
+    plans = asyncio.run(shtr.plans(output="raw"))
+    assert plans == asyncio.run(shtr.plans(as_pandas=False))
+    if find_spec("pyarrow") is None:
+        with pytest.raises(ImportError):
+            asyncio.run(shtr.series("JUICE_ALT", **KWARGS, output="arrow"))
+        return
+
+    table = asyncio.run(shtr.series("JUICE_ALT", **KWARGS, output="arrow"))
+    assert table.num_rows == len(asyncio.run(shtr.series("JUICE_ALT", **KWARGS)))
@@ -0,0 +1,44 @@
+import asyncio
+
+import pandas as pd
+
+from juice_core import AsyncSHTRestInterface
+
+
+def test_plans(mock_client):
+    client = AsyncSHTRestInterface(client=mock_client)
+    plans = asyncio.run(client.plans())
+    assert isinstance(plans, pd.DataFrame)
+    assert list(plans.name) == ["PLAN_A", "PLAN_B"]
+
+
+def test_segments_by_plan_name(mock_client):
+    client = AsyncSHTRestInterface(client=mock_client)
+    segments = asyncio.run(client.plan_segments("PLAN_B"))
+    assert len(segments) == 3
+    assert pd.api.types.is_datetime64_any_dtype(segments.start)
+
+
+def test_concurrent_queries(mock_client, handler):
+    client = AsyncSHTRestInterface(client=mock_client)
+
+    async def run():
+        return await asyncio.gather(
+            client.engineering_segments(),
+            client.events("PERIJOVE", start="2032-01-01", end="2032-01-03"),
+            client.series_multi(
+                ["JUICE_ALT", "JUICE_PHASE"], start="2032", end="2032-01-02"
+            ),
+        )
+
+    segs, events, series = asyncio.run(run())
+    assert len(segs) == 2
+    assert len(events) == 3
+    assert [s.name for s in series] == ["JUICE_ALT", "JUICE_PHASE"]
+    assert handler.calls["/rest_api/series/"] == 2
+
+
+def test_plain_result(mock_client):
+    client = AsyncSHTRestInterface(client=mock_client)
+    types = asyncio.run(client.event_types(as_pandas=False))
+    assert [t.mnemonic for t in types] == ["PERIJOVE", "APOJOVE"]
@@ -0,0 +1,153 @@
+import asyncio
+import gc
+import os
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from juice_core import AsyncSHTRestInterface, SHTRestInterface
+from juice_core.cache import DiskCache, MemoryCache
+
+
+def test_disk_cache_roundtrip(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite")
+    cache.set("key", "series", {"a": 1})
+
+    assert cache.get("key", "series") == (True, {"a": 1})
+    assert cache.get("other", "series") == (False, None)
+    assert len(cache) == 1
+
+
+def test_disk_cache_ttl(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite", ttl={"plans": 0.0})
+    cache.set("key", "plans", [1, 2, 3])
+    time.sleep(0.01)
+
+    assert cache.get("key", "plans") == (False, None)
+    assert len(cache) == 0
+
+
+def test_disk_cache_lru_eviction(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite", max_bytes=250)
+    cache.set("a", "series", os.urandom(80))
+    cache.set("b", "series", os.urandom(80))
+    time.sleep(0.01)
+    cache.get("a", "series")  # a is now the most recently used
+    cache.set("c", "series", os.urandom(80))
+
+    assert cache.size <= 250
+    assert cache.get("a", "series")[0]
+    assert not cache.get("b", "series")[0]
+
+
+def test_interface_uses_disk_cache(mock_client, handler, tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite")
+
+    first = SHTRestInterface(client=mock_client, disk_cache=cache)
+    first.engineering_segments()
+    series = first.series("JUICE_ALT", start="2032-01-01", end="2032-01-02")
+    assert handler.total == 2
+
+    # a new instance (e.g. a new process) reuses the stored results
+    second = SHTRestInterface(client=mock_client, disk_cache=cache)
+    second.engineering_segments()
+    cached = second.series("JUICE_ALT", start="2032-01-01", end="2032-01-02")
+    assert handler.total == 2
+    assert cached.equals(series)
+
+    cache.invalidate("series")
+    second.series("JUICE_ALT", start="2032-01-01", end="2032-01-03")
+    assert handler.total == 3
+
+
+def test_async_interface_uses_disk_cache(mock_client, handler, tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite")
+
+    async def run():
+        client = AsyncSHTRestInterface(client=mock_client, disk_cache=cache)
+        await client.plans()
+        await client.plans()
+
+    asyncio.run(run())
+    assert handler.total == 1
+
+
+def test_disk_cache_keys_on_method(mock_client, tmp_path):
+    client = SHTRestInterface(
+        client=mock_client, disk_cache=DiskCache(tmp_path / "cache.sqlite")
+    )
+    assert len(client.plans()) == 2
+    assert len(client.pcw()) == 1
+    assert client.plans.__name__ == "plans"
+
+
+def test_memory_cache_lru():
+    cache = MemoryCache(max_entries=2)
+    cache.get_or_compute(("m", 1), lambda: "one")
+    cache.get_or_compute(("m", 2), lambda: "two")
+    cache.get_or_compute(("m", 1), lambda: "not called")
+    cache.get_or_compute(("m", 3), lambda: "three")
+
+    assert len(cache) == 2
+    assert cache.get_or_compute(("m", 1), lambda: "again") == "one"
+    assert cache.get_or_compute(("m", 2), lambda: "again") == "again"
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 4
+
+
+def test_memory_cache_byte_budget():
+    cache = MemoryCache(max_entries=None, max_bytes=3000)
+    for i in range(5):
+        cache.get_or_compute(("m", i), lambda: pd.Series(np.zeros(100)))
+
+    assert cache.stats.bytes <= 3000
+    assert len(cache) == 3
+
+
+def test_memory_cache_ttl_and_invalidate():
+    cache = MemoryCache(ttl={"plans": 0.0})
+    cache.get_or_compute(("plans",), lambda: 1)
+    cache.get_or_compute(("series", "A"), lambda: 2)
+    time.sleep(0.01)
+
+    assert cache.get_or_compute(("plans",), lambda: 3) == 3
+    cache.invalidate("series")
+    assert cache.get_or_compute(("series", "A"), lambda: 4) == 4
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats.misses == 0
+
+
+def test_memory_cache_threads_share_one_fetch():
+    cache = MemoryCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(
+            pool.map(lambda _: cache.get_or_compute(("m",), compute), range(8)),
+        )
+
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+
+
+def test_interface_cache_is_per_instance(mock_client, handler):
+    client = SHTRestInterface(client=mock_client)
+    client.events(["PERIJOVE", "APOJOVE"], start="2032-01-01", end="2032-01-02")
+    client.events(["PERIJOVE", "APOJOVE"], start="2032-01-01", end="2032-01-02")
+    assert handler.total == 1
+    assert client.memory_cache.stats.hits == 1
+
+    ref = weakref.ref(client)
+    del client
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,214 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from juice_core import SHTRestInterface, expand_column
+from juice_core.SHTRestInterface import convert_times
+from juice_core.columnar import (
+    description_columns,
+    epochs_to_datetime64,
+    series_from_records,
+    times_to_datetime64,
+    values_to_float64,
+)
+
+
+def test_epochs_to_datetime64():
+    epochs = epochs_to_datetime64(["2032-01-01T00:00:00Z", "2032-01-01T01:00:00.5Z"])
+    assert epochs.dtype == np.dtype("datetime64[ns]")
+    assert epochs[1] == np.datetime64("2032-01-01T01:00:00.500")
+
+    # other offsets and missing epochs go through pandas
+    epochs = epochs_to_datetime64(["2032-01-01T01:00:00+01:00", None])
+    assert epochs[0] == np.datetime64("2032-01-01T00:00:00")
+    assert np.isnat(epochs[1])
+
+
+def test_values_to_float64():
+    assert values_to_float64([1, 2.5]).dtype == np.float64
+    values = values_to_float64([1.0, None, "x"])
+    assert values[0] == 1.0
+    assert np.isnan(values[1:]).all()
+
+
+def test_series_from_records():
+    records = [
+        {"epoch": "2032-01-01T00:00:00Z", "value": 1.0},
+        {"epoch": "2032-01-01T01:00:00Z"},
+    ]
+    series = series_from_records(records, name="S")
+    assert series.name == "S"
+    assert series.index.dtype == np.dtype("datetime64[ns]")
+    assert series.iloc[0] == 1.0
+    assert np.isnan(series.iloc[1])
+
+    assert series_from_records([]).empty
+
+
+def test_series_matches_models(mock_client):
+    shtr = SHTRestInterface(client=mock_client)
+    kwargs = {"start": "2032-01-01", "end": "2032-01-02"}
+
+    series = shtr.series("JUICE_ALT", **kwargs)
+    models = shtr.series("JUICE_ALT", **kwargs, as_pandas=False)
+
+    expected = pd.Series(
+        [m.value for m in models],
+        index=pd.to_datetime([m.epoch for m in models]).tz_localize(None),
+        name="JUICE_ALT",
+    )
+    pd.testing.assert_series_equal(series, expected, check_index_type=False)
+    assert series.index.dtype == np.dtype("datetime64[ns]")
+
+
+def _expand_column_loop(tab, column_name="description"):
+    """The former expand_column, item by item"""
+    rows = []
+    for d in tab[column_name]:
+        values = {}
+        for item in d.split(";"):
+            key, value = item.split("=")
+            values[key.strip()] = value.strip()
+        rows.append(values)
+    return tab.drop(columns=[column_name]).join(pd.DataFrame(rows))
+
+
+def test_expand_column_matches_loop():
+    tab = pd.DataFrame(
+        {
+            "name": ["PERIJOVE"] * 3,
+            "description": [
+                f"ID = {i}; TYPE = PERIJOVE;ORBIT={i % 2}" for i in range(3)
+            ],
+        }
+    )
+    pd.testing.assert_frame_equal(expand_column(tab), _expand_column_loop(tab))
+
+    # keys differing from row to row go through the other path
+    tab.loc[1, "description"] = "ID = 1; ALTITUDE = 400"
+    pd.testing.assert_frame_equal(expand_column(tab), _expand_column_loop(tab))
+
+
+def test_description_columns_scattered():
+    columns = description_columns(
+        [
+            "A = 1; B = 2",
+            "B = 3",
+            None,
+            "C = x=y; flag; A = 4;",
+            float("nan"),
+            "A = 5; A = 6",
+        ]
+    )
+    assert list(columns) == ["A", "B", "C"]
+    assert pd.isna(columns["A"][[1, 2, 4]]).all()
+    assert list(columns["A"][[0, 3, 5]]) == ["1", "4", "6"]
+    assert list(columns["B"][:2]) == ["2", "3"]
+    assert columns["C"][3] == "x=y"
+    assert description_columns([]) == {}
+
+
+def test_description_columns_equals_in_values():
+    columns = description_columns(["URL = a=b; COMMENT", "URL = c; COMMENT = d"])
+    assert list(columns) == ["URL", "COMMENT"]
+    assert list(columns["URL"]) == ["a=b", "c"]
+    assert pd.isna(columns["COMMENT"][0])
+    assert columns["COMMENT"][1] == "d"
+
+
+def _partition_parser(texts):
+    """Item by item, on the first "=" of each item"""
+    rows = []
+    for text in texts:
+        values = {}
+        for item in text.split(";"):
+            key, sep, value = item.partition("=")
+            if sep:
+                values[key.strip()] = value.strip()
+        rows.append(values)
+    return pd.DataFrame(rows)
+
+
+def test_description_columns_random():
+    rng = np.random.default_rng(0)
+    alphabet = np.array(list("AB =;="))
+    texts = ["".join(rng.choice(alphabet, rng.integers(0, 12))) for _ in range(3000)]
+    expected = _partition_parser(texts)
+    columns = pd.DataFrame(description_columns(texts))
+    pd.testing.assert_frame_equal(columns, expected, check_dtype=False)
+
+
+def test_description_columns_whitespace():
+    columns = description_columns(["A\t= 1 ;  B =  two words ", " A =2;B=\n3"])
+    assert list(columns["A"]) == ["1", "2"]
+    assert list(columns["B"]) == ["two words", "3"]
+
+
+def test_expand_column_index_and_categorical():
+    tab = pd.DataFrame(
+        {"description": ["TYPE = A; ID = 1", "TYPE = B", "TYPE = A; ID = 3"]},
+        index=[10, 20, 30],
+    )
+    expanded = expand_column(tab, categorical=True)
+    assert list(expanded.index) == [10, 20, 30]
+    assert isinstance(expanded["TYPE"].dtype, pd.CategoricalDtype)
+    assert list(expanded["TYPE"].cat.categories) == ["A", "B"]
+    assert expanded["ID"].isna().tolist() == [False, True, False]
+
+
+def test_expand_events(mock_client):
+    shtr = SHTRestInterface(client=mock_client)
+    events = shtr.events(["PERIJOVE", "APOJOVE"], start="2032-01-01", end="2032-01-03")
+    expanded = expand_column(events)
+    assert "description" not in expanded
+    assert (expanded["TYPE"] == events["name"]).all()
+    assert expanded["ID"].notna().all()
+
+
+def test_times_to_datetime64():
+    times, unparsed = times_to_datetime64(
+        ["2032-01-01T00:00:00Z", None, "tomorrow", float("nan")]
+    )
+    assert times[0] == np.datetime64("2032-01-01T00:00:00")
+    assert np.isnat(times[1:]).all()
+    assert unparsed.tolist() == [False, False, True, False]
+
+
+def test_convert_times():
+    table = pd.DataFrame(
+        {
+            "start": ["2032-01-01T00:00:00Z", "2032-01-01T02:00:00+01:00"],
+            "end": ["2032-01-01T01:00:00.5Z", None],
+        }
+    )
+    convert_times(table, ["start", "end", "missing"])
+    assert (table.dtypes == np.dtype("datetime64[ns]")).all()
+    assert table["start"][1] == pd.Timestamp("2032-01-01T01:00:00")
+    assert table["end"][0] == pd.Timestamp("2032-01-01T01:00:00.5")
+    assert pd.isna(table["end"][1])
+
+    # converting again is a no-op, and utc only changes the timezone
+    convert_times(table, ["start", "end"], utc=True)
+    assert table["start"].dt.tz is not None
+    assert table["start"][1] == pd.Timestamp("2032-01-01T01:00:00Z")
+
+
+def test_convert_times_unparseable():
+    table = pd.DataFrame({"start": ["2032-01-01T00:00:00Z", "soon"]}, index=[5, 7])
+    with pytest.raises(ValueError, match=r"start on 1 rows \(first 7\)"):
+        convert_times(table.copy(), "start", errors="raise")
+
+    table = convert_times(table, "start")
+    assert pd.isna(table["start"][7])
+
+
+def test_series_utc(mock_client):
+    shtr = SHTRestInterface(client=mock_client)
+    kwargs = {"start": "2032-01-01", "end": "2032-01-02"}
+    naive = shtr.series("JUICE_ALT", **kwargs)
+    aware = shtr.series("JUICE_ALT", **kwargs, utc=True)
+    assert str(aware.index.tz) == "UTC"
+    assert (aware.index.tz_localize(None) == naive.index).all()
+
+    events = shtr.events("PERIJOVE", **kwargs, utc=True)
+    assert str(events["start"].dt.tz) == "UTC"
@@ -0,0 +1,98 @@
+import ast
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+from juice_core_uplink_api_client import lazy_lists, models
+from juice_core_uplink_api_client._decoders import DECODERS
+from juice_core_uplink_api_client.api.rest_api import get_plan, get_plan_by_id
+from juice_core_uplink_api_client.decoding import decode_response, response_model
+
+ROOT = Path(__file__).parent.parent
+SPEC = json.loads((ROOT / "openapi.json").read_text())
+SCHEMAS = SPEC["components"]["schemas"]
+REF = "#/components/schemas/"
+
+
+def sample(schema, keys="all", null=False):
+    """A document for ``schema`` with all its properties, or only the required ones"""
+    required = schema.get("required", [])
+    doc = {}
+    for key, prop in schema.get("properties", {}).items():
+        if keys == "required" and key not in required:
+            continue
+        if null and prop.get("nullable"):
+            doc[key] = None
+        else:
+            doc[key] = value(prop)
+    return doc
+
+
+def value(prop):
+    if "enum" in prop:
+        return prop["enum"][-1]
+    if prop.get("format") == "date-time":
+        return "2032-01-01T12:00:00Z"
+    if prop["type"] == "array":
+        items = prop["items"]
+        if "$ref" in items:
+            return [sample(SCHEMAS[items["$ref"].removeprefix(REF)])] * 2
+        return [None, "a"] if items.get("nullable") else ["a", "b"]
+    return {"string": "text", "integer": 3, "number": 1.5, "boolean": True}[
+        prop["type"]
+    ]
+
+
+DOCUMENTS = [
+    {"keys": "all"},
+    {"keys": "required"},
+    {"keys": "all", "null": True},
+]
+
+
+@pytest.mark.parametrize("name", sorted(SCHEMAS))
+@pytest.mark.parametrize("options", DOCUMENTS)
+def test_same_as_from_dict(name, options):
+    model = getattr(models, name)
+    doc = sample(SCHEMAS[name], **options)
+    decode = DECODERS[model]
+
+    assert decode(doc) == model.from_dict(doc)
+
+    extra = {**doc, "unknown": [1]}
+    assert decode(extra).additional_properties == {"unknown": [1]}
+    assert decode(extra) == model.from_dict(extra)
+
+    with lazy_lists():
+        assert decode(doc) == model.from_dict(doc)
+
+
+def test_malformed_values():
+    phase = {"name": "P", "mnemonic": "P", "start": "not a date", "end": None}
+    assert DECODERS[models.Phase](phase) == models.Phase.from_dict(phase)
+
+    with pytest.raises(KeyError):
+        DECODERS[models.Segment]({"start": "2032"})
+
+
+def test_decode_response(mock_client):
+    assert response_model(get_plan) == (models.PlanList, True)
+    assert response_model(get_plan_by_id) == (models.ReadOnlyPlan, False)
+
+    response = mock_client.get_httpx_client().get("/rest_api/plan/1/")
+    assert decode_response(
+        get_plan_by_id, client=mock_client, response=response
+    ) == get_plan_by_id.sync("1", client=mock_client)
+
+
+def test_up_to_date():
+    path = ROOT / "scripts" / "generate_decoders.py"
+    spec = importlib.util.spec_from_file_location("generate_decoders", path)
+    generator = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generator)
+
+    generated = ast.parse(generator.generate(SPEC))
+    current = ast.parse(generator.OUTPUT.read_text())
+    assert ast.dump(generated) == ast.dump(current), "run scripts/generate_decoders.py"
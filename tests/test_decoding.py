@@ -0,0 +1,47 @@
+import json
+
+import httpx
+import pytest
+
+from juice_core_uplink_api_client import Client
+from juice_core_uplink_api_client.api.rest_api import get_plan
+from juice_core_uplink_api_client.decoding import get_json_decoder
+
+from .conftest import MOCK_URL, PLANS, mock_handler
+
+
+def test_backends():
+    assert get_json_decoder("json") is json.loads
+    assert get_json_decoder("auto")(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        get_json_decoder("yaml")
+
+
+def test_fast_backend_accepts_what_json_does():
+    orjson = pytest.importorskip("orjson")
+    decode = get_json_decoder("orjson")
+    assert decode(b"[1.5, null]") == orjson.loads(b"[1.5, null]")
+
+    # rejected by orjson, decoded by the fallback
+    values = decode(b"[NaN, 1]")
+    assert values[0] != values[0]
+    assert values[1] == 1
+
+
+def test_client_uses_decoder():
+    calls = []
+
+    def decode(content):
+        calls.append(content)
+        return json.loads(content)
+
+    client = Client(
+        base_url=MOCK_URL,
+        json_decoder=decode,
+        httpx_args={"transport": httpx.MockTransport(mock_handler)},
+    )
+    plans = get_plan.sync(client=client)
+
+    assert len(calls) == 1
+    assert [p.name for p in plans] == [p["name"] for p in PLANS]
@@ -0,0 +1,93 @@
+from importlib.util import find_spec
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from juice_core import SHTRestInterface
+from juice_core.dtypes import DtypePolicy, memory_report
+
+
+@pytest.fixture
+def table():
+    return pd.DataFrame(
+        {
+            "timeline": ["PRIME", "PRIME", "RIDER", "PRIME"],
+            "name": ["a", "b", "c", None],
+            "overwritten": [True, False, True, False],
+            "flag": [True, None, False, True],
+            "power": [1.5, 2.25, np.nan, 0.0],
+            "precise": [0.1, 0.2, 0.3, 0.4],
+            "count": [1, 2, 3, 4],
+            "resources": [[], [{"unit": "W"}], None, []],
+        }
+    )
+
+
+def test_policy(table):
+    typed = DtypePolicy().apply(table.copy())
+    assert isinstance(typed["timeline"].dtype, pd.CategoricalDtype)
+    assert typed["name"].dtype == object
+    assert typed["overwritten"].dtype == bool
+    assert typed["flag"].dtype == object  # has a missing value
+    assert typed["power"].dtype == np.float32
+    assert typed["precise"].dtype == np.float64  # not exact in float32
+    assert typed["count"].dtype == np.int64
+    assert typed["resources"].dtype == object
+    pd.testing.assert_frame_equal(
+        typed.astype(table.dtypes), table, check_categorical=False
+    )
+
+
+def test_policy_downcast_integers(table):
+    typed = DtypePolicy(downcast_integers=True).apply(table.copy())
+    assert typed["count"].dtype == np.int8
+    assert typed["power"].dtype == np.float32
+    typed = DtypePolicy(downcast=False, downcast_integers=True).apply(table.copy())
+    assert typed["count"].dtype == np.int8
+    assert typed["power"].dtype == np.float64
+
+
+def test_policy_options(table):
+    typed = DtypePolicy(
+        categories=False, strings="python", downcast=False, exclude=("name",)
+    ).apply(table.copy())
+    assert typed["timeline"].dtype == "string[python]"
+    assert typed["name"].dtype == object
+    assert typed["power"].dtype == np.float64
+
+    with pytest.raises(ValueError, match="strings"):
+        DtypePolicy(strings="arrow")
+
+
+@pytest.mark.skipif(find_spec("pyarrow") is not None, reason="pyarrow is installed")
+def test_policy_without_pyarrow(table):
+    assert DtypePolicy(strings="auto").string_dtype() is None
+    with pytest.raises(ImportError):
+        DtypePolicy(categories=False, strings="pyarrow").apply(table.copy())
+
+
+def test_memory_report(table):
+    report = memory_report({"segments": table})
+    assert report.index.names == ["table", "column"]
+    assert report.loc[("segments", "timeline"), "lean_dtype"] == "category"
+    assert report["bytes"].is_monotonic_decreasing
+    assert report.loc[("segments", "count"), "lean_dtype"] == "int64"
+    assert (
+        memory_report(table, DtypePolicy(categories=False, downcast=False))["bytes"]
+        == memory_report(table)["bytes"]
+    ).all()
+
+
+def test_interface_dtypes(mock_client):
+    kwargs = {"start": "2032-01-01", "end": "2032-01-10"}
+    events = SHTRestInterface(client=mock_client).events(
+        ["PERIJOVE", "APOJOVE"], **kwargs
+    )
+    lean = SHTRestInterface(client=mock_client, dtypes=DtypePolicy()).events(
+        ["PERIJOVE", "APOJOVE"], **kwargs
+    )
+    assert events["name"].dtype == object
+    assert isinstance(lean["name"].dtype, pd.CategoricalDtype)
+    assert lean["start"].dtype == events["start"].dtype
+    assert lean.memory_usage(deep=True).sum() < events.memory_usage(deep=True).sum()
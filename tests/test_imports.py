@@ -0,0 +1,79 @@
+import json
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import importlib_metadata
+import pytest
+
+import juice_core
+from juice_core import imports
+from juice_core_uplink_api_client import api, models
+
+
+def test_import_is_light():
+    probe = (
+        "import sys, juice_core; "
+        "print(sorted(m for m in sys.modules if m in ('pandas', 'numpy') "
+        "or m.startswith('juice_core_uplink_api_client.models.')))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "[]"
+
+
+def test_lazy_models():
+    assert models.Segment.__module__ == "juice_core_uplink_api_client.models.segment"
+    assert "Segment" in dir(models)
+    with pytest.raises(AttributeError):
+        models.NotAModel  # noqa: B018
+
+
+def test_lazy_api():
+    assert callable(api.rest_api.get_plan.sync)
+    with pytest.raises(AttributeError):
+        api.rest_api.not_an_endpoint  # noqa: B018
+
+
+def test_version():
+    assert isinstance(juice_core.__version__, str)
+
+
+def test_version_is_cached(monkeypatch):
+    monkeypatch.delitem(vars(juice_core), "__version__", raising=False)
+    lookups = []
+
+    def version(name):
+        lookups.append(name)
+        return "1.2.3"
+
+    monkeypatch.setattr(importlib_metadata, "version", version)
+    assert juice_core.__version__ == "1.2.3"
+    assert juice_core.__version__ == "1.2.3"
+    assert lookups == ["juice_core_uplink_api_client"]
+
+
+def test_lazy_module_concurrent_first_access(monkeypatch):
+    barrier = threading.Barrier(8)
+    loads = []
+
+    def slow_import(name):
+        loads.append(name)
+        time.sleep(0.05)
+        return sys.modules[name]
+
+    monkeypatch.setattr(imports, "import_module", slow_import)
+    module = imports.lazy_module("json")
+
+    def use(_):
+        barrier.wait()
+        return module.dumps
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(use, range(8)))
+
+    assert loads == ["json"]
+    assert all(r is json.dumps for r in results)
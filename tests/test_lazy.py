@@ -0,0 +1,103 @@
+import pickle
+
+import pytest
+
+from juice_core import SHTRestInterface
+from juice_core.cache import DiskCache
+from juice_core_uplink_api_client import LazyList, lazy_lists
+from juice_core_uplink_api_client.models import Segment, Trajectory
+
+from .conftest import PHASES
+
+RESOURCE = {"category": "DATA", "target": "ALL", "unit": "bits", "instrument_type": "X"}
+
+
+def make_segment(i):
+    return {
+        "start": f"2032-01-{i + 1:02d}T00:00:00Z",
+        "end": f"2032-01-{i + 1:02d}T12:00:00Z",
+        "segment_definition": f"SEG_{i}",
+        "overwritten": False,
+        "instrument_overwritten": False,
+        "timeline": "PRIME",
+        "resources": [RESOURCE] * 3,
+    }
+
+
+def test_eager_by_default():
+    trajectory = Trajectory.from_dict({"name": "T", "mnemonic": "T", "phases": PHASES})
+    assert isinstance(trajectory.phases, list)
+
+
+def test_lazy_list():
+    raw = [make_segment(i) for i in range(10)]
+    with lazy_lists():
+        segments = LazyList(raw, Segment.from_dict)
+
+    assert len(segments) == 10
+    assert segments.decoded == 0
+
+    assert segments[-1].segment_definition == "SEG_9"
+    assert [s.segment_definition for s in segments[:2]] == ["SEG_0", "SEG_1"]
+    assert segments.decoded == 3
+    assert segments[0] is segments[0]
+
+    # the items are decoded lazily as well
+    assert isinstance(segments[0].resources, LazyList)
+    assert segments[0].resources.decoded == 0
+
+    with pytest.raises(IndexError):
+        segments[10]
+
+
+def test_lazy_models_round_trip():
+    raw = {"name": "T", "mnemonic": "T", "phases": PHASES}
+    eager = Trajectory.from_dict(raw)
+    with lazy_lists():
+        lazy = Trajectory.from_dict(raw)
+
+    assert isinstance(lazy.phases, LazyList)
+    assert lazy.phases.decoded == 0
+    assert lazy.to_dict() == eager.to_dict()
+    assert lazy.phases == eager.phases
+
+    segment = make_segment(0)
+    eager = Segment.from_dict(segment)
+    with lazy_lists():
+        lazy = Segment.from_dict(segment)
+    assert isinstance(lazy.resources, LazyList)
+    assert lazy.to_dict() == eager.to_dict()
+
+
+def test_interface_lazy_models(mock_client):
+    shtr = SHTRestInterface(client=mock_client, lazy_models=True)
+    phases = shtr.phases(as_pandas=False)
+    assert isinstance(phases, LazyList)
+    assert [p.mnemonic for p in phases] == [p["mnemonic"] for p in PHASES]
+
+    # pandas results do not go through the models
+    assert len(shtr.phases()) == len(PHASES)
+
+
+def test_lazy_list_pickles():
+    raw = [make_segment(i) for i in range(3)]
+    segments = LazyList(raw, Segment.from_dict)
+    first = segments[1]
+
+    copy = pickle.loads(pickle.dumps(segments))
+    assert copy.decoded == 1
+    assert copy[1] == first
+    assert copy == [Segment.from_dict(s) for s in raw]
+    assert isinstance(copy[0].resources, LazyList)
+
+
+def test_lazy_models_from_disk_cache(mock_client, tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite")
+    SHTRestInterface(client=mock_client, lazy_models=True, disk_cache=cache).phases(
+        as_pandas=False
+    )
+
+    shtr = SHTRestInterface(client=mock_client, lazy_models=True, disk_cache=cache)
+    phases = shtr.phases(as_pandas=False)
+    assert isinstance(phases, LazyList)
+    assert [p.mnemonic for p in phases] == [p["mnemonic"] for p in PHASES]
@@ -0,0 +1,43 @@
+import pickle
+
+import pytest
+
+from juice_core_uplink_api_client.models import SeriesData
+from juice_core_uplink_api_client.types import EMPTY_PROPERTIES
+
+
+def test_shared_empty_properties():
+    a = SeriesData.from_dict({"epoch": "2032-01-01T00:00:00Z", "value": 1.0})
+    b = SeriesData()
+    assert a._additional_properties is EMPTY_PROPERTIES  # noqa: SLF001
+    assert b._additional_properties is EMPTY_PROPERTIES  # noqa: SLF001
+    assert not hasattr(a, "__dict__")
+
+    a["flag"] = True
+    assert a["flag"] is True
+    assert a.to_dict()["flag"] is True
+    assert "flag" not in b
+    assert EMPTY_PROPERTIES == {}
+
+    with pytest.raises(KeyError):
+        del b["flag"]
+    with pytest.raises(TypeError):
+        EMPTY_PROPERTIES["flag"] = True
+
+    # the public dict is the model's own, and can be written to
+    b.additional_properties["flag"] = True
+    b.additional_properties.update(unit="km")
+    assert b.to_dict()["unit"] == "km"
+    assert "flag" in b
+    assert EMPTY_PROPERTIES == {}
+
+
+def test_extra_keys_kept():
+    data = SeriesData.from_dict({"epoch": "2032", "value": 1.0, "unit": "km"})
+    assert data.additional_properties == {"unit": "km"}
+    assert data.to_dict() == {"epoch": "2032", "value": 1.0, "unit": "km"}
+
+
+def test_pickle_keeps_sentinel():
+    data = pickle.loads(pickle.dumps(SeriesData(epoch="2032", value=1.0)))
+    assert data._additional_properties is EMPTY_PROPERTIES  # noqa: SLF001
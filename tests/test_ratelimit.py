@@ -0,0 +1,196 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import httpx
+
+from juice_core.SHTRestInterface import series_query
+from juice_core_uplink_api_client import Client, RateLimit, RateLimiter
+from juice_core_uplink_api_client.api.rest_api import get_plan, get_series
+from juice_core_uplink_api_client.ratelimit import ConcurrencyLimit, TokenBucket
+
+from .conftest import MOCK_URL, mock_handler
+
+
+class ConcurrencyHandler:
+    """Serve the mock API slowly, recording the highest number of concurrent requests."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def enter(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def exit(self):
+        with self.lock:
+            self.active -= 1
+
+    def __call__(self, request):
+        self.enter()
+        try:
+            time.sleep(self.delay)
+            return mock_handler(request)
+        finally:
+            self.exit()
+
+
+class AsyncConcurrencyHandler(ConcurrencyHandler):
+    async def __call__(self, request):
+        self.enter()
+        try:
+            await asyncio.sleep(self.delay)
+            return mock_handler(request)
+        finally:
+            self.exit()
+
+
+def make_client(handler, limiter):
+    transport = httpx.MockTransport(handler)
+    return Client(
+        base_url=MOCK_URL,
+        rate_limiter=limiter,
+        httpx_args={"transport": transport},
+    )
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert 0.05 < bucket.reserve() <= 0.1
+    assert 0.15 < bucket.reserve() <= 0.2
+
+
+def test_rate_limit_spaces_requests():
+    limiter = RateLimiter(default=RateLimit(requests_per_second=20))
+    client = make_client(mock_handler, limiter)
+
+    t0 = time.monotonic()
+    for _ in range(5):
+        get_plan.sync_detailed(client=client)
+    assert time.monotonic() - t0 >= 0.19
+
+
+def test_max_concurrency_sync():
+    handler = ConcurrencyHandler()
+    limiter = RateLimiter(default=RateLimit(max_concurrency=2))
+    client = make_client(handler, limiter)
+
+    with ThreadPoolExecutor(8) as pool:
+        responses = list(
+            pool.map(lambda _: get_plan.sync_detailed(client=client), range(8))
+        )
+
+    assert all(r.status_code == 200 for r in responses)
+    assert handler.peak == 2
+    assert limiter.hosts["mock.juicesoc"].in_flight == 0
+
+
+def test_max_concurrency_async():
+    handler = AsyncConcurrencyHandler()
+    limiter = RateLimiter(default=RateLimit(max_concurrency=3))
+    client = make_client(handler, limiter)
+
+    async def main():
+        return await asyncio.gather(
+            *[get_plan.asyncio_detailed(client=client) for _ in range(10)]
+        )
+
+    responses = asyncio.run(main())
+    assert all(r.status_code == 200 for r in responses)
+    assert handler.peak == 3
+
+
+def test_limit_shared_by_sync_and_async_clients():
+    handler = ConcurrencyHandler()
+    limiter = RateLimiter(default=RateLimit(max_concurrency=1))
+    client = make_client(handler, limiter)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(2) as pool:
+            sync_calls = [
+                loop.run_in_executor(
+                    pool, partial(get_plan.sync_detailed, client=client)
+                )
+                for _ in range(4)
+            ]
+            async_calls = [get_plan.asyncio_detailed(client=client) for _ in range(4)]
+            return await asyncio.gather(*sync_calls, *async_calls)
+
+    responses = asyncio.run(main())
+    assert all(r.status_code == 200 for r in responses)
+    assert handler.peak == 1
+    assert limiter.hosts["mock.juicesoc"].in_flight == 0
+
+
+def test_path_limit():
+    handler = ConcurrencyHandler()
+    limiter = RateLimiter(paths={"/rest_api/series/": RateLimit(max_concurrency=1)})
+    client = make_client(handler, limiter)
+    query = series_query("SERIES", start="2032-01-01", end="2032-01-02")
+
+    with ThreadPoolExecutor(4) as pool:
+        list(
+            pool.map(
+                lambda _: get_series.sync_detailed(client=client, body=query),
+                range(4),
+            )
+        )
+    assert handler.peak == 1
+
+    handler.peak = 0
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(lambda _: get_plan.sync_detailed(client=client), range(4)))
+    assert handler.peak > 1
+
+
+def test_slot_released_on_error():
+    def failing(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    limiter = RateLimiter(default=RateLimit(max_concurrency=1))
+    client = make_client(failing, limiter)
+
+    for _ in range(2):
+        try:
+            get_plan.sync_detailed(client=client)
+        except httpx.ConnectError:
+            pass
+    assert limiter.hosts["mock.juicesoc"].in_flight == 0
+
+
+def test_cancelled_waiter_passes_its_slot_on():
+    limit = ConcurrencyLimit(1)
+
+    async def main():
+        await limit.acquire_async()
+        first = asyncio.ensure_future(limit.acquire_async())
+        second = asyncio.ensure_future(limit.acquire_async())
+        await asyncio.sleep(0)
+
+        # cancelled while waiting, e.g. by asyncio.wait_for timing out
+        first.cancel()
+        await asyncio.sleep(0)
+        limit.release()
+        await asyncio.wait_for(second, timeout=1)
+        assert limit.active == 1
+
+        # cancelled after being woken, before running
+        third = asyncio.ensure_future(limit.acquire_async())
+        fourth = asyncio.ensure_future(limit.acquire_async())
+        await asyncio.sleep(0)
+        limit.release()
+        third.cancel()
+        await asyncio.wait_for(fourth, timeout=1)
+        assert limit.active == 1
+        assert not limit._async_waiters  # noqa: SLF001
+
+    asyncio.run(main())
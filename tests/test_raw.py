@@ -0,0 +1,107 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from juice_core_uplink_api_client import Client, errors, raw
+from juice_core_uplink_api_client.api.rest_api import (
+    get_pcw_by_mnemonic,
+    get_plan,
+    get_plan_by_id,
+)
+from juice_core_uplink_api_client.models import PlanList, ReadOnlyPlan
+
+from .conftest import MOCK_URL, PLANS, CountingHandler
+
+
+def fail(*args, **kwargs):
+    raise AssertionError("the response should not be decoded")
+
+
+def test_raw(mock_client, monkeypatch):
+    monkeypatch.setattr(PlanList, "from_dict", fail)
+    monkeypatch.setattr(ReadOnlyPlan, "from_dict", fail)
+
+    content = raw.sync(get_plan, client=mock_client)
+    assert json.loads(content) == PLANS
+
+    response = raw.sync_detailed(get_plan_by_id, "1", client=mock_client)
+    assert response.status_code == 200
+    assert response.parsed == response.content
+    assert json.loads(response.content)["id"] == 1
+
+    content = asyncio.run(raw.asyncio(get_plan_by_id, id="2", client=mock_client))
+    assert json.loads(content)["id"] == 2
+
+
+def test_raw_error_status(mock_client):
+    response = raw.sync_detailed(get_pcw_by_mnemonic, "UNKNOWN", client=mock_client)
+    assert response.status_code == 404
+    assert response.parsed is None
+
+    mock_client.raise_on_unexpected_status = True
+    with pytest.raises(errors.UnexpectedStatus):
+        raw.sync(get_pcw_by_mnemonic, "UNKNOWN", client=mock_client)
+
+    # a stream raises whatever the option
+    mock_client.raise_on_unexpected_status = False
+    with (
+        pytest.raises(errors.UnexpectedStatus),
+        raw.stream(get_pcw_by_mnemonic, "UNKNOWN", client=mock_client),
+    ):
+        pass
+
+
+class ETagHandler(CountingHandler):
+    """Serve the mock API with an ETag, recording the conditional requests."""
+
+    def __init__(self):
+        super().__init__()
+        self.conditional = 0
+
+    def __call__(self, request):
+        if "If-None-Match" in request.headers:
+            self.conditional += 1
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        response = super().__call__(request)
+        response.headers["ETag"] = '"v1"'
+        return response
+
+
+def test_stream():
+    handler = ETagHandler()
+    client = Client(
+        base_url=MOCK_URL,
+        coalesce_requests=True,
+        conditional_requests=True,
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+    expected = raw.sync(get_plan, client=client)
+
+    for _ in range(2):
+        with raw.stream(get_plan, client=client, chunk_size=16) as chunks:
+            chunks = list(chunks)
+        assert len(chunks) > 1
+        assert b"".join(chunks) == expected
+
+    # streamed responses are neither revalidated nor stored
+    assert handler.calls["/rest_api/plan/"] == 3
+    assert handler.conditional == 0
+
+
+def test_astream():
+    handler = ETagHandler()
+    client = Client(
+        base_url=MOCK_URL,
+        conditional_requests=True,
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+
+    async def fetch():
+        async with raw.astream(get_plan_by_id, "1", client=client) as chunks:
+            return b"".join([chunk async for chunk in chunks])
+
+    content = asyncio.run(fetch())
+    assert json.loads(content)["id"] == 1
+    assert handler.conditional == 0
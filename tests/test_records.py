@@ -0,0 +1,60 @@
+import asyncio
+
+import pandas as pd
+import pytest
+
+from juice_core import AsyncSHTRestInterface, SHTRestInterface
+from juice_core.SHTRestInterface import _as_pandas
+from juice_core_uplink_api_client._decoders import DECODERS
+from juice_core_uplink_api_client.models import Event, PlanList
+
+EVENTS = {"mnemonics": "PERIJOVE", "start": "2032-01-01", "end": "2032-01-03"}
+
+QUERIES = [
+    ("plans", {}, ["created"]),
+    ("plan", {"plan_id_or_name": 1}, []),
+    ("pcw", {}, []),
+    ("phases", {}, ["start", "end"]),
+    ("engineering_segments", {}, ["start", "end"]),
+    ("known_series", {}, []),
+    ("event_types", {}, []),
+    ("events", EVENTS, ["start", "end"]),
+    ("events", {**EVENTS, "window": "D"}, ["start", "end"]),
+]
+
+
+@pytest.mark.parametrize(("method", "kwargs", "time_fields"), QUERIES)
+def test_records_match_models(mock_client, method, kwargs, time_fields):
+    shtr = SHTRestInterface(client=mock_client)
+    table = getattr(shtr, method)(**kwargs)
+    models = getattr(shtr, method)(**kwargs, as_pandas=False)
+
+    # the columns follow the order of the JSON keys instead of the model fields
+    expected = _as_pandas(models, time_fields=time_fields)
+    if isinstance(expected, pd.Series):
+        pd.testing.assert_series_equal(
+            table.sort_index(), expected.sort_index(), check_dtype=False
+        )
+    else:
+        pd.testing.assert_frame_equal(
+            table, expected, check_dtype=False, check_like=True
+        )
+
+
+def test_pandas_skips_models(mock_client, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("models should not be built")
+
+    for model in (PlanList, Event):
+        monkeypatch.setattr(model, "from_dict", fail)
+        monkeypatch.setitem(DECODERS, model, fail)
+
+    shtr = SHTRestInterface(client=mock_client)
+    assert len(shtr.plans()) == 2
+    assert len(shtr.events(**EVENTS, window="D")) == 3
+
+    client = AsyncSHTRestInterface(client=mock_client)
+    assert len(asyncio.run(client.events(**EVENTS, window="D"))) == 3
+
+    with pytest.raises(AssertionError):
+        shtr.plans(as_pandas=False)
@@ -0,0 +1,87 @@
+import asyncio
+
+import httpx
+
+from juice_core_uplink_api_client import Client, RetryBudget, RetryPolicy
+from juice_core_uplink_api_client.api.rest_api import get_plan
+from juice_core_uplink_api_client.retry import parse_retry_after
+
+from .conftest import MOCK_URL, mock_handler
+
+
+class FlakyHandler:
+    """Fail the first ``failures`` requests, then serve the mock API."""
+
+    def __init__(self, failures, status_code=503, headers=None, error=None):
+        self.failures = failures
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.error = error
+        self.attempts = 0
+
+    def __call__(self, request):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            if self.error is not None:
+                raise self.error("connection reset", request=request)
+            return httpx.Response(self.status_code, headers=self.headers)
+        return mock_handler(request)
+
+
+def make_client(handler, **policy):
+    policy = RetryPolicy(backoff_factor=0.001, **policy)
+    return Client(
+        base_url=MOCK_URL,
+        retry=policy,
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+
+
+def test_retry_on_status():
+    handler = FlakyHandler(failures=2)
+    plans = get_plan.sync(client=make_client(handler))
+    assert handler.attempts == 3
+    assert len(plans) == 2
+
+
+def test_retry_gives_up_after_max_attempts():
+    handler = FlakyHandler(failures=5)
+    response = get_plan.sync_detailed(client=make_client(handler, max_attempts=2))
+    assert handler.attempts == 2
+    assert response.status_code == 503
+
+
+def test_no_retry_for_non_idempotent_methods():
+    handler = FlakyHandler(failures=1)
+    client = make_client(handler)
+    response = client.get_httpx_client().post("/rest_api/plan/", json={})
+    assert handler.attempts == 1
+    assert response.status_code == 503
+
+
+def test_retry_after_too_long_is_not_honoured():
+    handler = FlakyHandler(failures=1, headers={"Retry-After": "3600"})
+    response = get_plan.sync_detailed(client=make_client(handler))
+    assert handler.attempts == 1
+    assert response.status_code == 503
+
+
+def test_retry_budget():
+    handler = FlakyHandler(failures=100)
+    client = make_client(handler, budget=RetryBudget(ratio=0.0, capacity=1))
+    get_plan.sync_detailed(client=client)
+    get_plan.sync_detailed(client=client)
+    assert handler.attempts == 3  # a single retry allowed overall
+
+
+def test_retry_on_connection_error_async():
+    handler = FlakyHandler(failures=2, error=httpx.ReadError)
+    plans = asyncio.run(get_plan.asyncio(client=make_client(handler)))
+    assert handler.attempts == 3
+    assert len(plans) == 2
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
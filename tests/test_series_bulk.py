@@ -0,0 +1,68 @@
+import asyncio
+
+import httpx
+import pandas as pd
+
+from juice_core import AsyncSHTRestInterface, SHTRestInterface
+from juice_core_uplink_api_client import Client
+
+from .conftest import MOCK_URL, mock_handler
+
+NAMES = ["JUICE_ALT", "JUICE_PHASE", "SUN_DISTANCE"]
+
+
+def test_series_bulk(mock_client, handler):
+    client = SHTRestInterface(client=mock_client)
+    table = client.series_bulk(NAMES, start="2032-01-01", end="2032-01-02")
+
+    assert list(table.columns) == NAMES
+    assert table.index.name == "epoch"
+    assert isinstance(table.index, pd.DatetimeIndex)
+    assert len(table) == 25
+    assert table.index.is_monotonic_increasing
+    assert handler.calls["/rest_api/series/"] == len(NAMES)
+
+
+def test_series_bulk_async_bounded_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def slow_handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return mock_handler(request)
+
+    client = Client(base_url=MOCK_URL)
+    client.set_async_httpx_client(
+        httpx.AsyncClient(
+            base_url=MOCK_URL, transport=httpx.MockTransport(slow_handler)
+        ),
+    )
+    interface = AsyncSHTRestInterface(client=client)
+
+    names = [f"SERIES_{i}" for i in range(10)]
+    table = asyncio.run(
+        interface.series_bulk(
+            names,
+            start="2032-01-01",
+            end="2032-01-01T05:00:00",
+            max_concurrency=3,
+        ),
+    )
+
+    assert list(table.columns) == names
+    assert len(table) == 6
+    assert peak == 3
+
+
+def test_series_bulk_utc(mock_client):
+    kwargs = {"start": "2032-01-01", "end": "2032-01-02", "utc": True}
+    table = SHTRestInterface(client=mock_client).series_bulk(NAMES, **kwargs)
+    assert str(table.index.tz) == "UTC"
+
+    interface = AsyncSHTRestInterface(client=mock_client)
+    table = asyncio.run(interface.series_bulk(NAMES, **kwargs))
+    assert str(table.index.tz) == "UTC"
@@ -0,0 +1,107 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from juice_core.SHTRestInterface import events_query, series_query
+from juice_core_uplink_api_client import Client, streaming
+from juice_core_uplink_api_client.api.rest_api import get_events, get_series
+from juice_core_uplink_api_client.models import Event, SeriesData
+
+from .conftest import MOCK_URL, mock_handler
+
+DOCUMENT = [
+    {"name": "a, [b]", "nested": {"list": [1, 2.5e3, None]}, "ok": True},
+    -12.75,
+    "été ✓",
+    [],
+    {},
+    False,
+    1234567,
+]
+SERIES = series_query("DISTANCE", start="2032-01-01", end="2032-01-02")
+
+
+def test_parser():
+    text = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+    for size in (1, 7, len(text)):
+        parser = streaming.JSONArrayParser()
+        items = []
+        for i in range(0, len(text), size):
+            items += parser.feed(text[i : i + size])
+        items += parser.close()
+        assert items == DOCUMENT
+
+    assert streaming.JSONArrayParser().feed(b" [ ] ") == []
+
+
+@pytest.mark.parametrize(
+    "text", [b'{"a": 1}', b"[1, 2", b'[{"a": 1}', b"[1 2]", b"[1] 2"]
+)
+def test_parser_invalid(text):
+    parser = streaming.JSONArrayParser()
+    with pytest.raises(ValueError):  # noqa: PT011
+        parser.feed(text)
+        parser.close()
+
+
+def test_stream_items(mock_client):
+    events = list(
+        streaming.sync(get_events, client=mock_client, body=events_query(["PERIJOVE"]))
+    )
+    assert events
+    assert all(isinstance(e, Event) for e in events)
+    assert events == get_events.sync(
+        client=mock_client, body=events_query(["PERIJOVE"])
+    )
+
+    records = list(
+        streaming.sync(get_series, client=mock_client, body=SERIES, model=None)
+    )
+    batches = list(
+        streaming.sync(
+            get_series, client=mock_client, body=SERIES, batch_size=10, chunk_size=100
+        )
+    )
+    assert [len(b) for b in batches[:-1]] == [10] * (len(batches) - 1)
+    assert [s.to_dict() for b in batches for s in b] == records
+
+
+def test_items_arrive_with_the_body():
+    sent = []
+
+    def handler(request):
+        body = mock_handler(request).read()
+
+        def chunks():
+            for i in range(0, len(body), 64):
+                sent.append(i)
+                yield body[i : i + 64]
+
+        return httpx.Response(200, content=chunks())
+
+    client = Client(
+        base_url=MOCK_URL, httpx_args={"transport": httpx.MockTransport(handler)}
+    )
+    items = streaming.sync(get_series, client=client, body=SERIES, chunk_size=64)
+    assert isinstance(next(items), SeriesData)
+    total = len(list(items)) + 1
+    assert total > 1
+    # the first item came before the rest of the body was sent
+    assert len(sent) < total
+
+
+def test_stream_items_async(mock_client):
+    async def collect():
+        return [
+            batch
+            async for batch in streaming.asyncio(
+                get_series, client=mock_client, body=SERIES, batch_size=7
+            )
+        ]
+
+    batches = asyncio.run(collect())
+    assert sum(len(b) for b in batches) == len(
+        get_series.sync(client=mock_client, body=SERIES)
+    )
@@ -0,0 +1,228 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from juice_core import SHTRestInterface
+from juice_core.timeline import IntervalSet, Timeline
+
+ORIGIN = pd.Timestamp("2032-01-01")
+
+
+def random_table(rng, rows, long_intervals=0.05):
+    start = ORIGIN + pd.to_timedelta(rng.integers(0, 10_000, rows), "s")
+    duration = pd.to_timedelta(rng.integers(0, 100, rows), "s")
+    duration = duration.where(rng.random(rows) > long_intervals, pd.Timedelta("2h"))
+    # a few point events
+    duration = duration.where(rng.random(rows) > 0.1, pd.Timedelta(0))  # noqa: PLR2004
+    return pd.DataFrame({"start": start, "end": start + duration, "id": range(rows)})
+
+
+def overlaps(a, b):
+    return (a["start"].to_numpy()[:, None] <= b["end"].to_numpy()[None, :]) & (
+        a["end"].to_numpy()[:, None] >= b["start"].to_numpy()[None, :]
+    )
+
+
+@pytest.fixture
+def tables():
+    rng = np.random.default_rng(42)
+    return random_table(rng, 300), random_table(rng, 100)
+
+
+def test_join_matches_masks(tables):
+    a, b = tables
+    joined = Timeline(a).join(b)
+    expected = set(zip(*np.nonzero(overlaps(a, b)), strict=True))
+    assert set(zip(joined["id"], joined["id_other"], strict=True)) == expected
+    assert len(joined) == len(expected)
+    # ordered as the rows of the other table by start
+    assert joined["start_other"].is_monotonic_increasing
+
+    within = Timeline(a).join(b, how="within")
+    mask = (a["start"].to_numpy()[:, None] <= b["start"].to_numpy()[None, :]) & (
+        a["end"].to_numpy()[:, None] >= b["end"].to_numpy()[None, :]
+    )
+    assert set(zip(within["id"], within["id_other"], strict=True)) == set(
+        zip(*np.nonzero(mask), strict=True)
+    )
+
+
+def test_point_queries(tables):
+    a, b = tables
+    timeline = Timeline(a)
+
+    t = ORIGIN + pd.Timedelta("5000s")
+    rows = timeline.at(t)
+    assert set(rows["id"]) == set(a["id"][(a["start"] <= t) & (a["end"] >= t)])
+    assert rows["start"].is_monotonic_increasing
+
+    end = t + pd.Timedelta("10min")
+    rows = timeline.overlapping(t, end)
+    assert set(rows["id"]) == set(a["id"][(a["start"] <= end) & (a["end"] >= t)])
+
+    times = b["start"]
+    found = timeline.containing(times)
+    mask = (a["start"].to_numpy()[:, None] <= times.to_numpy()[None, :]) & (
+        a["end"].to_numpy()[:, None] >= times.to_numpy()[None, :]
+    )
+    assert len(found) == mask.sum()
+    assert set(zip(found["id"], found["time"], strict=True)) == {
+        (i, times[j]) for i, j in zip(*np.nonzero(mask), strict=True)
+    }
+
+
+def test_nearest(tables):
+    a, b = tables
+    times = pd.Series(ORIGIN + pd.to_timedelta(np.arange(-500, 11_000, 97), "s"))
+    nearest = Timeline(a).nearest(times)
+
+    start = a["start"].to_numpy()[:, None]
+    end = a["end"].to_numpy()[:, None]
+    t = times.to_numpy()[None, :]
+    distance = np.maximum(np.maximum(start - t, t - end), np.timedelta64(0))
+    assert len(nearest) == len(times)
+    assert (nearest["distance"].to_numpy() == distance.min(axis=0)).all()
+    assert (nearest["time"].to_numpy() == times.to_numpy()).all()
+
+
+def test_closed_intervals_and_missing_times():
+    table = pd.DataFrame(
+        {
+            "start": ["2032-01-01T00:00:00Z", "2032-01-01T01:00:00Z", None],
+            "end": ["2032-01-01T01:00:00Z", None, "2032-01-01T03:00:00Z"],
+        }
+    )
+    timeline = Timeline(table)
+    assert len(timeline) == 2  # noqa: PLR2004
+
+    # the end of the first interval is the start of the point event
+    assert list(timeline.at("2032-01-01T01:00:00Z").index) == [0, 1]
+    assert timeline.at(pd.Timestamp("2032-01-01T02:00:00+01:00")).index.tolist() == [
+        0,
+        1,
+    ]
+    assert timeline.at("2032-01-01T02:00:00Z").empty
+
+    found = timeline.containing(["2032-01-01T00:30:00Z", None, "bad"])
+    assert found.index.tolist() == [0]
+
+    nearest = timeline.nearest(["2032-01-01T05:00:00Z"])
+    assert nearest.index.tolist() == [1]
+    assert nearest["distance"].iloc[0] == pd.Timedelta("4h")
+
+    with pytest.raises(ValueError, match="Not a time range"):
+        timeline.overlapping(None, "2032-01-01")
+    with pytest.raises(ValueError, match="how must be"):
+        timeline.join(table, how="touches")
+
+
+def test_empty_timeline():
+    timeline = Timeline(pd.DataFrame({"start": [], "end": []}))
+    assert len(timeline) == 0
+    assert timeline.at("2032-01-01").empty
+    assert timeline.join(pd.DataFrame({"start": ["2032-01-01"]})).empty
+    with pytest.raises(ValueError, match="no intervals"):
+        timeline.nearest(["2032-01-01"])
+
+
+def test_events_timeline(mock_client):
+    shtr = SHTRestInterface(client=mock_client)
+    kwargs = {"start": "2032-01-01", "end": "2032-01-03"}
+    events = shtr.events(["PERIJOVE", "APOJOVE"], **kwargs)
+    days = pd.DataFrame(
+        {
+            "start": pd.date_range("2032-01-01", periods=2, freq="D"),
+            "end": pd.date_range("2032-01-01T23:59:59", periods=2, freq="D"),
+            "day": [1, 2],
+        }
+    )
+    joined = Timeline(days).join(events)
+    assert joined.groupby("day").size().to_dict() == {1: 2, 2: 2}
+
+
+def seconds(*pairs):
+    return IntervalSet.from_intervals(
+        [ORIGIN + pd.Timedelta(a, "s") for a, _ in pairs],
+        [ORIGIN + pd.Timedelta(b, "s") for _, b in pairs],
+    )
+
+
+def covered(intervals, size=220):
+    """The seconds of [0, size) in the set, as booleans"""
+    grid = ORIGIN + pd.to_timedelta(np.arange(size), "s")
+    return intervals.contains(grid)
+
+
+def test_interval_set_matches_grid():
+    rng = np.random.default_rng(7)
+    for _ in range(20):
+        sets = []
+        for _ in range(2):
+            starts = rng.integers(0, 190, 15)
+            sets.append(seconds(*zip(starts, starts + rng.integers(0, 20, 15))))
+        a, b = sets
+        ca, cb = covered(a), covered(b)
+
+        for result, expected in (
+            (a | b, ca | cb),
+            (a & b, ca & cb),
+            (a - b, ca & ~cb),
+            (a.complement(ORIGIN, ORIGIN + pd.Timedelta("220s")), ~ca),
+        ):
+            assert (covered(result) == expected).all()
+            # normalised: sorted, disjoint, not touching, not empty
+            assert (result.starts < result.ends).all()
+            assert (result.ends[:-1] < result.starts[1:]).all()
+
+        assert (a | b).total == pd.Timedelta((ca | cb).sum(), "s")
+
+
+def test_interval_set_normalisation():
+    intervals = seconds((0, 10), (5, 20), (20, 25), (30, 40), (50, 50), (45, 42))
+    assert intervals == seconds((0, 25), (30, 40))
+    assert intervals.gaps() == seconds((25, 30))
+    assert intervals.clip(ORIGIN + pd.Timedelta("8s"), "2032-01-01T00:00:32Z") == (
+        seconds((8, 25), (30, 32))
+    )
+    assert intervals.contains(
+        [ORIGIN, ORIGIN + pd.Timedelta("25s"), None]
+    ).tolist() == [
+        True,
+        False,
+        False,
+    ]
+    assert IntervalSet.empty().contains([ORIGIN]).tolist() == [False]
+
+    stats = intervals.stats()
+    assert stats["intervals"] == 2  # noqa: PLR2004
+    assert stats["longest"] == pd.Timedelta("25s")
+    assert stats["total_gap"] == pd.Timedelta("5s")
+    assert stats["coverage"] == 35 / 40
+
+    frame = intervals.to_frame()
+    assert frame["end"].tolist() == [
+        ORIGIN + pd.Timedelta("25s"),
+        ORIGIN + pd.Timedelta("40s"),
+    ]
+
+
+def test_interval_set_from_outputs(mock_client):
+    shtr = SHTRestInterface(client=mock_client)
+    kwargs = {"start": "2032-01-01", "end": "2032-01-03"}
+    days = IntervalSet.from_intervals(
+        ["2032-01-01", "2032-01-02"], ["2032-01-01T12:00Z", "2032-01-03"]
+    )
+
+    # point events have no duration, but the same table with a duration does
+    events = shtr.events("PERIJOVE", **kwargs)
+    assert len(IntervalSet.from_table(events)) == 0
+    events["end"] = events["start"] + pd.Timedelta("1h")
+    assert (days - IntervalSet.from_table(events)).total == pd.Timedelta("34h")
+
+    models = shtr.events("PERIJOVE", **kwargs, as_pandas=False)
+    assert len(IntervalSet.from_table(models)) == 0
+    for model in models:
+        model.end = model.start.replace("T00:", "T01:")
+    assert IntervalSet.from_table(models) == IntervalSet.from_table(events)
+    records = [model.to_dict() for model in models]
+    assert IntervalSet.from_table(records) == IntervalSet.from_table(events)
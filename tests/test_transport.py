@@ -0,0 +1,320 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpcore
+import httpx
+import pandas as pd
+
+from juice_core import AsyncSHTRestInterface, SHTRestInterface
+from juice_core.SHTRestInterface import DEFAULT_URL, _as_pandas
+from juice_core.cache import MemoryCache
+from juice_core_uplink_api_client import Client
+from juice_core_uplink_api_client.api.rest_api import get_plan
+from juice_core_uplink_api_client.transport import (
+    AsyncMountTransport,
+    MountTransport,
+    ResponseSnapshot,
+    ValidatorStore,
+)
+
+from .conftest import MOCK_URL, CountingHandler, mock_handler
+
+
+def slow(handler, delay=0.05):
+    def slow_handler(request):
+        time.sleep(delay)
+        return handler(request)
+
+    return slow_handler
+
+
+def test_coalescing_sync():
+    handler = CountingHandler(slow(mock_handler))
+    client = Client(
+        base_url=MOCK_URL,
+        coalesce_requests=True,
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+    barrier = threading.Barrier(8)
+
+    def fetch(_):
+        barrier.wait()
+        return get_plan.sync(client=client)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(fetch, range(8)))
+
+    assert handler.total == 1
+    assert all(len(r) == 2 for r in results)
+
+    # once completed, a new request reaches the server again
+    get_plan.sync(client=client)
+    assert handler.total == 2
+
+
+def test_coalescing_async():
+    calls = 0
+
+    async def async_handler(request):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return mock_handler(request)
+
+    client = Client(
+        base_url=MOCK_URL,
+        coalesce_requests=True,
+        httpx_args={"transport": httpx.MockTransport(async_handler)},
+    )
+
+    async def run():
+        return await asyncio.gather(
+            *[get_plan.asyncio(client=client) for _ in range(5)]
+        )
+
+    results = asyncio.run(run())
+    assert calls == 1
+    assert all(len(r) == 2 for r in results)
+
+
+def test_coalescing_disabled_by_default():
+    handler = CountingHandler(slow(mock_handler, 0.01))
+    client = Client(
+        base_url=MOCK_URL,
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: get_plan.sync(client=client), range(4)))
+
+    assert handler.total == 4
+
+
+def test_async_interface_single_flight(mock_client, handler):
+    client = AsyncSHTRestInterface(client=mock_client)
+
+    async def run():
+        return await asyncio.gather(*[client.plan("PLAN_A") for _ in range(10)])
+
+    plans = asyncio.run(run())
+    assert all(p is plans[0] for p in plans)
+    assert handler.calls == {"/rest_api/plan/": 1, "/rest_api/plan/1/": 1}
+
+
+class ETagHandler(CountingHandler):
+    """Serve the mock API with an ETag, answering 304 when it matches."""
+
+    etag = '"v1"'
+    not_modified = 0
+
+    def __call__(self, request):
+        self.calls[request.url.path] = self.calls.get(request.url.path, 0) + 1
+        if request.headers.get("If-None-Match") == self.etag:
+            self.not_modified += 1
+            return httpx.Response(304, headers={"ETag": self.etag})
+
+        response = mock_handler(request)
+        response.headers["ETag"] = self.etag
+        return response
+
+
+def test_conditional_requests():
+    handler = ETagHandler()
+    client = Client(
+        base_url=MOCK_URL,
+        conditional_requests=True,
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+
+    first = get_plan.sync_detailed(client=client)
+    second = get_plan.sync_detailed(client=client)
+    assert handler.total == 2
+    assert second.status_code == 200
+    assert second.parsed == first.parsed
+
+    handler.etag = '"v2"'
+    third = get_plan.sync_detailed(client=client)
+    assert third.headers["ETag"] == '"v2"'
+
+
+def test_validator_store_byte_budget():
+    store = ValidatorStore(max_bytes=250)
+
+    def snapshot(size):
+        return ResponseSnapshot(200, [(b"etag", b'"v1"')], b"x" * size)
+
+    for i in range(3):
+        store.store(("GET", i), snapshot(100))
+    assert store.size == 200
+    assert list(store._entries) == [("GET", 1), ("GET", 2)]  # noqa: SLF001
+
+    # too large to keep, and the response it replaces is outdated
+    store.store(("GET", 2), snapshot(300))
+    assert store.size == 100
+    assert list(store._entries) == [("GET", 1)]  # noqa: SLF001
+
+    store.clear()
+    assert store.size == 0
+
+
+def test_interface_reuses_parsed_result_on_304():
+    handler = ETagHandler()
+    client = Client(
+        base_url=MOCK_URL,
+        conditional_requests=True,
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+    interface = SHTRestInterface(
+        client=client,
+        memory_cache=MemoryCache(ttl={"plans": 0.0}),
+    )
+
+    first = interface.plans(as_pandas=False)
+    second = interface.plans(as_pandas=False)
+    assert handler.total == 2
+    assert second is first
+
+    handler.etag = '"v2"'
+    assert interface.plans(as_pandas=False) is not first
+
+
+def test_interface_reuses_records_on_304():
+    handler = ETagHandler()
+    decoded = []
+
+    def decode(content):
+        decoded.append(content)
+        return json.loads(content)
+
+    client = Client(
+        base_url=MOCK_URL,
+        conditional_requests=True,
+        json_decoder=decode,
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+    interface = SHTRestInterface(
+        client=client,
+        memory_cache=MemoryCache(ttl={"plans": 0.0}),
+    )
+
+    first = interface.plans()
+    second = interface.plans()
+    assert handler.total == 2
+    assert len(decoded) == 1
+    pd.testing.assert_frame_equal(second, first)
+
+    # records and models are kept apart
+    assert interface.plans(as_pandas=False)[0].name == first.name[0]
+
+
+def test_series_reuses_records_on_304():
+    handler = ETagHandler()
+    decoded = []
+
+    def decode(content):
+        decoded.append(content)
+        return json.loads(content)
+
+    client = Client(
+        base_url=MOCK_URL,
+        conditional_requests=True,
+        json_decoder=decode,
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+    interface = SHTRestInterface(
+        client=client,
+        memory_cache=MemoryCache(ttl={"series": 0.0}),
+    )
+    kwargs = {"start": "2032-01-01", "end": "2032-01-02"}
+
+    first = interface.series("JUICE_ALT", **kwargs)
+    bulk = interface.series_bulk(["JUICE_ALT"], **kwargs)
+    assert handler.calls["/rest_api/series/"] == 2
+    assert len(decoded) == 1
+    pd.testing.assert_series_equal(bulk["JUICE_ALT"], first, check_names=False)
+
+
+def test_plan_segments_from_records(mock_client):
+    interface = SHTRestInterface(client=mock_client)
+    models = interface.plan("PLAN_A", as_pandas=False).segments
+    pd.testing.assert_frame_equal(
+        interface.plan_segments("PLAN_A"),
+        _as_pandas(models, time_fields=["start", "end"]),
+    )
+
+    async_interface = AsyncSHTRestInterface(client=mock_client)
+    pd.testing.assert_frame_equal(
+        asyncio.run(async_interface.plan_segments("PLAN_A")),
+        interface.plan_segments("PLAN_A"),
+    )
+
+
+def test_pool_and_timeout_options():
+    client = Client(
+        base_url=MOCK_URL,
+        timeout=httpx.Timeout(10.0),
+        read_timeout=60.0,
+        max_connections=16,
+        max_keepalive_connections=8,
+        keepalive_expiry=30.0,
+    )
+
+    httpx_client = client.get_httpx_client()
+    assert httpx_client.timeout == httpx.Timeout(10.0, read=60.0)
+    pool = httpx_client._transport._pool  # noqa: SLF001
+    assert pool._max_connections == 16  # noqa: SLF001
+    assert pool._max_keepalive_connections == 8  # noqa: SLF001
+    assert pool._keepalive_expiry == 30.0  # noqa: SLF001
+
+    client = client.with_timeout(httpx.Timeout(5.0))
+    assert client.get_httpx_client().timeout == httpx.Timeout(5.0, read=60.0)
+
+
+def test_interface_configures_default_client():
+    shtr = SHTRestInterface(timeout=12.0, max_connections=4)
+    httpx_client = shtr.client.get_httpx_client()
+    assert httpx_client.timeout == httpx.Timeout(12.0)
+
+    assert _base_transport(httpx_client)._pool._max_connections == 4  # noqa: SLF001
+
+
+def _base_transport(httpx_client, url=DEFAULT_URL):
+    """The transport below the layers sending the requests for ``url``"""
+    transport = httpx_client._transport  # noqa: SLF001
+    while not isinstance(transport, MountTransport | AsyncMountTransport):
+        transport = transport._transport  # noqa: SLF001
+    return transport._client._transport_for_url(httpx.URL(url))  # noqa: SLF001
+
+
+def test_layers_keep_environment_proxies(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+    plain = httpx.Client()._transport_for_url(httpx.URL(DEFAULT_URL))  # noqa: SLF001
+    assert isinstance(plain._pool, httpcore.HTTPProxy)  # noqa: SLF001
+
+    for httpx_client in (
+        SHTRestInterface().client.get_httpx_client(),
+        AsyncSHTRestInterface().client.get_async_httpx_client(),
+    ):
+        pool = _base_transport(httpx_client)._pool  # noqa: SLF001
+        assert isinstance(pool, httpcore.HTTPProxy | httpcore.AsyncHTTPProxy)
+        assert pool._proxy_url.host == b"proxy.example"  # noqa: SLF001
+
+    monkeypatch.setenv("NO_PROXY", "juicesoc.esac.esa.int")
+    pool = _base_transport(SHTRestInterface().client.get_httpx_client())._pool  # noqa: SLF001
+    assert isinstance(pool, httpcore.ConnectionPool)
+
+
+def test_layers_wrap_mounted_transports():
+    # requests matching the mounts of httpx_args go through the layers too
+    handler = ETagHandler()
+    client = Client(
+        base_url=MOCK_URL,
+        conditional_requests=True,
+        httpx_args={"mounts": {"all://": httpx.MockTransport(handler)}},
+    )
+    get_plan.sync_detailed(client=client)
+    assert get_plan.sync_detailed(client=client).status_code == 200
+    assert handler.not_modified == 1
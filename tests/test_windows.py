@@ -0,0 +1,116 @@
+import asyncio
+
+from juice_core import AsyncSHTRestInterface, SHTRestInterface
+from juice_core.windows import (
+    merge_windows,
+    phase_windows,
+    record_key,
+    time_windows,
+)
+
+from .conftest import PHASES
+
+
+def test_time_windows():
+    windows = time_windows("2032-01-15", "2032-04-01", freq="MS")
+    assert windows == [
+        ("2032-01-15T00:00:00Z", "2032-02-01T00:00:00Z"),
+        ("2032-02-01T00:00:00Z", "2032-03-01T00:00:00Z"),
+        ("2032-03-01T00:00:00Z", "2032-04-01T00:00:00Z"),
+    ]
+
+
+def test_time_windows_shorter_than_freq():
+    windows = time_windows("2032-01-15", "2032-01-20T00:00:00Z", freq="MS")
+    assert windows == [("2032-01-15T00:00:00Z", "2032-01-20T00:00:00Z")]
+
+
+def test_phase_windows():
+    from juice_core_uplink_api_client.models.phase import Phase
+
+    phases = [Phase.from_dict(p) for p in PHASES]
+    windows = phase_windows(phases, "2032-01-02", "2040")
+    assert windows == [
+        ("2032-01-02T00:00:00Z", "2032-01-03T00:00:00Z"),
+        ("2032-01-03T00:00:00Z", "2032-01-05T00:00:00Z"),
+        ("2032-01-05T00:00:00Z", "2040-01-01T00:00:00Z"),
+    ]
+
+
+def test_phase_windows_cover_the_range():
+    from juice_core_uplink_api_client.models.phase import Phase
+
+    phases = [
+        Phase.from_dict({"name": n, "mnemonic": n, "start": a, "end": b})
+        for n, a, b in (
+            ("B", "2033-01-01T00:00:00Z", "2034-01-01T00:00:00Z"),
+            ("A", "2031-01-01T00:00:00Z", "2032-01-01T00:00:00Z"),
+        )
+    ]
+    windows = phase_windows(phases, "2020", "2040")
+    edges = ["2020", "2031", "2032", "2033", "2034", "2040"]
+    edges = [f"{e}-01-01T00:00:00Z" for e in edges]
+    assert windows == list(zip(edges[:-1], edges[1:]))
+
+    # without phases in the range, a single window
+    assert phase_windows(phases, "2035", "2036") == [
+        ("2035-01-01T00:00:00Z", "2036-01-01T00:00:00Z")
+    ]
+
+
+def test_merge_windows():
+    merged = merge_windows([[1, 2, 3], None, [3, 4]], key=lambda x: x)
+    assert merged == [1, 2, 3, 4]
+
+    # only the items shared with the previous window are dropped
+    merged = merge_windows([[1, 1, 2], [2, 2, 3], [3]], key=lambda x: x)
+    assert merged == [1, 1, 2, 2, 3]
+
+
+def test_merge_windows_keeps_identical_events():
+    # same name and times, from two sources
+    events = [
+        {"name": "FLYBY", "start": "2032-01-02", "end": "2032-01-02", "source": s}
+        for s in ("A", "B")
+    ]
+    key = record_key("name", "start", "end")
+    assert merge_windows([events, []], key=key) == events
+    # overlapping the boundary, both windows return them
+    assert merge_windows([events, events], key=key) == events
+
+
+def test_windowed_series_matches_single_query(mock_client, handler):
+    client = SHTRestInterface(client=mock_client)
+    full = client.series("JUICE_ALT", start="2032-01-01", end="2032-01-05")
+    windowed = client.series(
+        "JUICE_ALT",
+        start="2032-01-01",
+        end="2032-01-05",
+        window="D",
+    )
+
+    assert windowed.index.is_unique
+    assert (windowed == full).all()
+    assert handler.calls["/rest_api/series/"] == 1 + 4
+
+
+def test_windowed_events_by_phase(mock_client):
+    client = SHTRestInterface(client=mock_client)
+    events = client.events(
+        "PERIJOVE",
+        start="2032-01-01",
+        end="2032-01-05",
+        window="phases",
+    )
+
+    assert len(events) == 5
+    assert events.start.is_monotonic_increasing
+
+
+def test_windowed_series_async(mock_client):
+    client = AsyncSHTRestInterface(client=mock_client)
+    windowed = asyncio.run(
+        client.series("JUICE_ALT", start="2032-01-01", end="2032-01-05", window="D"),
+    )
+    assert len(windowed) == 4 * 24 + 1
+    assert windowed.index.is_unique